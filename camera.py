@@ -0,0 +1,106 @@
+"""
+Camera - Scrollable, zoomable view of the farm inside the map area left of the UI panel
+"""
+import pyglet
+from pyglet.gl import GL_SCISSOR_TEST, glDisable, glEnable, glScissor
+from pyglet.math import Mat4, Vec3
+from constants import grid_size, game_config, UI_PANEL_WIDTH
+
+
+class Camera:
+    """Maps between screen and world (farm pixel) coordinates and applies the view transform for world drawing
+
+    (x, y) is the world position shown at the bottom-left corner of the map area.
+    """
+
+    def __init__(self, window, world_width, world_height):
+        self.window = window
+        self.world_width = world_width
+        self.world_height = world_height
+        self.x = 0.0
+        self.y = 0.0
+        self.zoom = 1.0
+        self.min_zoom = game_config.get('camera_min_zoom', 0.25)
+        self.max_zoom = game_config.get('camera_max_zoom', 4.0)
+        self.zoom_step = game_config.get('camera_zoom_step', 1.1)
+        self.pan_speed = game_config.get('camera_pan_speed', 600)  # Screen pixels per second
+        self._saved_view = None
+
+    @property
+    def viewport_width(self):
+        """Width of the map area in screen pixels"""
+        return max(0, self.window.width - UI_PANEL_WIDTH)
+
+    @property
+    def viewport_height(self):
+        """Height of the map area in screen pixels"""
+        return self.window.height
+
+    def contains_screen_point(self, x, y):
+        """Check if a screen point lies in the map area (not the UI panel)"""
+        return 0 <= x < self.viewport_width and 0 <= y < self.viewport_height
+
+    def screen_to_world(self, x, y):
+        """Convert a screen point to world coordinates"""
+        return self.x + x / self.zoom, self.y + y / self.zoom
+
+    def world_to_screen(self, x, y):
+        """Convert a world point to screen coordinates"""
+        return (x - self.x) * self.zoom, (y - self.y) * self.zoom
+
+    def clamp(self):
+        """Keep the view over the map; a map smaller than the view stays anchored bottom-left"""
+        max_x = max(0.0, self.world_width - self.viewport_width / self.zoom)
+        max_y = max(0.0, self.world_height - self.viewport_height / self.zoom)
+        self.x = min(max(self.x, 0.0), max_x)
+        self.y = min(max(self.y, 0.0), max_y)
+
+    def pan(self, dx, dy):
+        """Move the view by a screen-pixel offset"""
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self.clamp()
+
+    def zoom_at(self, screen_x, screen_y, steps):
+        """Zoom by a number of wheel steps, keeping the world point under the cursor fixed"""
+        world_x, world_y = self.screen_to_world(screen_x, screen_y)
+        self.zoom = min(self.max_zoom, max(self.min_zoom, self.zoom * self.zoom_step ** steps))
+        self.x = world_x - screen_x / self.zoom
+        self.y = world_y - screen_y / self.zoom
+        self.clamp()
+
+    def center_on(self, world_x, world_y):
+        """Center the view on a world point"""
+        self.x = world_x - self.viewport_width / self.zoom / 2
+        self.y = world_y - self.viewport_height / self.zoom / 2
+        self.clamp()
+
+    def update(self, dt, keys):
+        """Pan with the arrow keys (keys is a pyglet KeyStateHandler)"""
+        key = pyglet.window.key
+        dx = (keys[key.RIGHT] - keys[key.LEFT]) * self.pan_speed * dt
+        dy = (keys[key.UP] - keys[key.DOWN]) * self.pan_speed * dt
+        if dx or dy:
+            self.pan(dx, dy)
+
+    def visible_tile_range(self):
+        """Get (first_col, first_row, end_col, end_row) of the tiles in view, end exclusive"""
+        right, top = self.screen_to_world(self.viewport_width, self.viewport_height)
+        return (int(self.x // grid_size), int(self.y // grid_size),
+                int(right // grid_size) + 1, int(top // grid_size) + 1)
+
+    def begin(self):
+        """Apply the camera transform and clip drawing to the map area"""
+        self._saved_view = self.window.view
+        self.window.view = (self._saved_view @
+                            Mat4.from_scale(Vec3(self.zoom, self.zoom, 1)) @
+                            Mat4.from_translation(Vec3(-self.x, -self.y, 0)))
+        # Scissor works in framebuffer pixels, which differ from window pixels on HiDPI screens
+        ratio = self.window.get_framebuffer_size()[0] / max(1, self.window.width)
+        glEnable(GL_SCISSOR_TEST)
+        glScissor(0, 0, int(self.viewport_width * ratio), int(self.viewport_height * ratio))
+
+    def end(self):
+        """Restore screen-space drawing"""
+        glDisable(GL_SCISSOR_TEST)
+        self.window.view = self._saved_view
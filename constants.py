@@ -1,58 +1,46 @@
 import pyglet
-import json
-import sys
 import os
+from texture_atlas import TileAtlas
 
-# Handle PyInstaller bundle path
-if getattr(sys, 'frozen', False):
-    # Running in a PyInstaller bundle
-    bundle_dir = sys._MEIPASS
-else:
-    # Running in normal Python environment - use current directory
-    bundle_dir = os.path.dirname(os.path.abspath(__file__))
+# Game data, tile states and building types come from the pyglet-free simulation package
+from simulation.config import (
+    bundle_dir, game_config, seeds_config, fertilizer_config, tractor_config, grid_size,
+    TILE_UNOWNED, TILE_OWNED, TILE_TILLED, TILE_PLANTED, TILE_GROWING, TILE_READY_HARVEST,
+    TILE_BARN, TILE_SEED_BIN, BUILDING_BARN, BUILDING_SEED_BIN
+)
 
 # Set pyglet resource path to include our bundle directory and parent directory
 pyglet.resource.path = [bundle_dir, os.path.join(bundle_dir, 'tilefarmer')]
 pyglet.resource.reindex()
 
-# Load config files
-with open(os.path.join(bundle_dir, 'config', 'game_config.json'), 'r') as f:
-    game_config = json.load(f)
-with open(os.path.join(bundle_dir, 'config', 'seeds.json'), 'r') as f:
-    seeds_config = json.load(f)
-with open(os.path.join(bundle_dir, 'config', 'fertilizer.json'), 'r') as f:
-    fertilizer_config = json.load(f)
-with open(os.path.join(bundle_dir, 'config', 'tractor.json'), 'r') as f:
-    tractor_config = json.load(f)
+# Pack every image into one texture at tile resolution so each batch layer draws from a single texture
+tile_atlas = TileAtlas(os.path.join(bundle_dir, 'img'), grid_size,
+                       cache_dir=os.path.join(bundle_dir, game_config.get('atlas_cache_dir', 'cache')))
 
 # Load our images
-farm_tile_image = pyglet.resource.image('img/farm_tile.png')
-tilled_image = pyglet.resource.image('img/tilled.png')
-tractor_image = pyglet.resource.image('img/tractor.png')
-
-# Scale forest image to tile size (24x24)
-forest_image_raw = pyglet.resource.image('img/forest.png')
-forest_image = forest_image_raw.get_texture()
-forest_image.width = 24
-forest_image.height = 24
-
-barn_image = pyglet.resource.image('img/barn.png')
-seed_bin_image = pyglet.resource.image('img/seed_bin.png')
-unowned_image = pyglet.resource.image('img/unowned.png')
-grass_image = pyglet.resource.image('img/grass.png')
+farm_tile_image = tile_atlas['farm_tile']
+tilled_image = tile_atlas['tilled']
+tractor_image = tile_atlas['tractor']
+forest_image = tile_atlas['forest']
+barn_image = tile_atlas['barn']
+seed_bin_image = tile_atlas['seed_bin']
+barn_bordered_image = tile_atlas['barn_bordered']
+seed_bin_bordered_image = tile_atlas['seed_bin_bordered']
+unowned_image = tile_atlas['unowned']
+grass_image = tile_atlas['grass']
+grow_image = tile_atlas['grow']
 
 # Load crop images
 crop_images = {}
 for seed in seeds_config:
-    try:
-        crop_images[seed['name']] = pyglet.resource.image(f"img/{seed['tile_image']}")
-    except:
+    image_name = os.path.splitext(seed['tile_image'])[0]
+    if image_name in tile_atlas:
+        crop_images[seed['name']] = tile_atlas[image_name]
+    else:
         print(f"Warning: Could not load image img/{seed['tile_image']} for {seed['name']}")
 
 # Create a Batch for our farm tiles
 farm_batch = pyglet.graphics.Batch()
-# Load tile_size from game_config.json
-grid_size = game_config.get('tile_size', 32)
 icon_batch = pyglet.graphics.Batch()  # Separate batch for icons - drawn after farm_batch
 tractor_batch = pyglet.graphics.Batch()
 ui_batch = pyglet.graphics.Batch()
@@ -60,10 +48,9 @@ ui_batch = pyglet.graphics.Batch()
 # Rendering groups to control draw order (higher numbers draw on top)
 background_group = pyglet.graphics.Group(order=0)  # Background tiles, buildings
 icon_group = pyglet.graphics.Group(order=1)        # Icons on top of buildings
-forest_image_raw = pyglet.resource.image('img/forest.png')
-forest_image = forest_image_raw.get_texture()
-forest_image.width = grid_size
-forest_image.height = grid_size
+
+# Width of the UI panel on the right of the window; the map area fills the rest
+UI_PANEL_WIDTH = 245
 
 # Mouse modes
 MOUSE_MODE_NORMAL = 0
@@ -87,18 +74,3 @@ OVERLAY_CALCIUM = 6
 OVERLAY_MAGNESIUM = 7
 OVERLAY_SULFUR = 8
 OVERLAY_SEED_REQUIREMENTS = 9
-
-# Tile states
-TILE_UNOWNED = 0
-TILE_OWNED = 1
-TILE_TILLED = 2
-TILE_PLANTED = 3
-TILE_GROWING = 4
-TILE_READY_HARVEST = 5
-TILE_BARN = 6
-TILE_SEED_BIN = 7
-
-# Building types
-BUILDING_BARN = 'barn'
-BUILDING_SEED_BIN = 'seed_bin'
-
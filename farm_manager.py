@@ -1,67 +1,74 @@
 """
-Farm Manager - Handles farm setup and tile management
+Farm Manager - Draws the simulation's farm tiles and forwards tile lookups to it
 """
-from constants import grid_size
-from farm_tile import FarmTile
+from farm_tile_visual_manager import FarmTileVisualManager
+from tile_chunks import TileChunks
 
 
 class FarmManager:
     def __init__(self, game_window):
         self.game_window = game_window
-        self.farm_tiles = None
-    
+        self.farm = game_window.simulation.farm
+        self.tile_chunks = None  # Per-chunk batches the tile sprites draw into, filled as chunks come into view
+
+    @property
+    def farm_tiles(self):
+        return self.farm.farm_tiles
+
+    @property
+    def farm_grid(self):
+        return self.farm.farm_grid
+
+    @property
+    def tile_grid(self):
+        return self.farm.tile_grid
+
+    @property
+    def grid_width(self):
+        return self.farm.grid_width
+
+    @property
+    def grid_height(self):
+        return self.farm.grid_height
+
+    @property
+    def row_index(self):
+        return self.farm.row_index
+
+    @property
+    def storage_index(self):
+        return self.farm.storage_index
+
+    @property
+    def growth_scheduler(self):
+        return self.farm.growth_scheduler
+
     def setup_farm(self):
-        """Initialize the farm with tiles (245 pixel border at right for UI)"""
-        from constants import farm_batch, game_config
-        tiles = []
-        map_width = game_config.get('map_width', 50)
-        map_height = game_config.get('map_height', 25)
-        # Create farm tiles grid
-        for i in range(map_width):
-            for j in range(map_height):
-                x = i * grid_size
-                y = j * grid_size
-                tile = FarmTile(x, y, farm_batch)
-                tiles.append(tile)
-
-        # Center the owned area in the farm grid
-        tiles_width = map_width
-        tiles_height = map_height
-        center_grid_x = tiles_width // 2
-        center_grid_y = tiles_height // 2
-
-        # Set owned tiles: 6 columns in center for middle row and row below
-        for tile in tiles:
-            tile_grid_x = tile.x // grid_size
-            tile_grid_y = tile.y // grid_size
-            # Create 6x2 area of owned tiles in the center (6 columns, 2 rows)
-            # Middle row and the row below it
-            if (center_grid_x - 2 <= tile_grid_x <= center_grid_x + 3 and
-                center_grid_y <= tile_grid_y <= center_grid_y + 1):
-                tile.set_state(1)  # TILE_OWNED
-
-                # Add carrot seed bin at the end of the first owned row (rightmost position)
-                if (tile_grid_x == center_grid_x + 3 and tile_grid_y == center_grid_y):
-                    from constants import TILE_SEED_BIN, BUILDING_SEED_BIN
-                    tile.build_structure(BUILDING_SEED_BIN)
-                    tile.store_crop("Carrot", 20)  # Start with 20 carrot seeds - this will create the icon
-
-                # Add barn as second to last tile of the first owned row
-                elif (tile_grid_x == center_grid_x + 2 and tile_grid_y == center_grid_y):
-                    from constants import TILE_BARN
-                    tile.set_state(TILE_BARN)
-                    tile.building_type = "barn"
-
-        self.farm_tiles = tiles
-        return tiles
-    
+        """Set up the per-chunk batches; a chunk's tile sprites are created when it first comes into view"""
+        self.tile_chunks = TileChunks(self.farm.map_width, self.farm.map_height, self._build_tile_chunk)
+        return self.farm.farm_tiles
+
+    def _build_tile_chunk(self, key, batch):
+        """Create the sprites for the farm tiles in one chunk"""
+        first_col, first_row, end_col, end_row = self.tile_chunks.tile_range(key)
+        for row in range(first_row, end_row):
+            for col in range(first_col, end_col):
+                tile = self.farm.get_tile_at_grid(col, row)
+                if tile is not None:
+                    FarmTileVisualManager(tile, batch)
+
+    def build_tile_index(self):
+        """Rebuild the (column, row) lookup grid from the current farm tiles"""
+        self.farm.build_tile_index()
+
+    def get_tile_at_grid(self, col, row):
+        """Get the farm tile at the given column and row"""
+        return self.farm.get_tile_at_grid(col, row)
+
     def get_tile_at_position(self, grid_x, grid_y):
         """Get the farm tile at the given grid position"""
-        if not self.farm_tiles:
-            return None
-            
-        for tile in self.farm_tiles:
-            if tile.x == grid_x and tile.y == grid_y:
-                return tile
-        return None
+        return self.farm.get_tile_at_position(grid_x, grid_y)
 
+    def daily_soil_tick(self):
+        """Run the day-rollover soil update over all farmed tiles at once"""
+        return self.farm.daily_soil_tick()
@@ -1,95 +1,55 @@
 import pyglet
 from constants import (
-    grid_size, forest_image, farm_tile_image, tilled_image, barn_image,
-    background_group, TILE_UNOWNED, TILE_OWNED, TILE_TILLED, TILE_BARN, TILE_SEED_BIN,
-    TILE_PLANTED, TILE_GROWING, TILE_READY_HARVEST
+    grid_size, forest_image, farm_tile_image, tilled_image, barn_bordered_image, seed_bin_bordered_image,
+    crop_images, grow_image, background_group, icon_group, TILE_UNOWNED, TILE_OWNED, TILE_TILLED,
+    TILE_BARN, TILE_SEED_BIN, TILE_PLANTED, TILE_GROWING, TILE_READY_HARVEST
 )
 
+# Ground image for each tile state; crops draw the tilled ground underneath, buildings have their border baked in
+STATE_IMAGES = {
+    TILE_UNOWNED: forest_image,
+    TILE_OWNED: farm_tile_image,
+    TILE_TILLED: tilled_image,
+    TILE_PLANTED: tilled_image,
+    TILE_GROWING: tilled_image,
+    TILE_READY_HARVEST: tilled_image,
+    TILE_BARN: barn_bordered_image,
+    TILE_SEED_BIN: seed_bin_bordered_image,
+}
+
 
 class FarmTileVisualManager:
-    """Manages visual sprites and appearance for a farm tile"""
+    """Draws a simulation farm tile: its ground, crop and seed bin icon sprites
+
+    Attached to the tile as tile.view; the tile calls back into it whenever something visible changes.
+    Each tile has a single ground sprite; changing state swaps its atlas image rather than
+    toggling a set of per-state sprites.
+    """
 
-    def __init__(self, tile):
+    def __init__(self, tile, batch):
         self.tile = tile
-        self.forest_sprite = None
-        self.farm_sprite = None
-        self.tilled_sprite = None
-        self.barn_sprite = None
-        self.seed_bin_bg = None
-        self.barn_border = None
-        self.seed_bin_border = None
-        self._create_sprites()
-
-    def _create_sprites(self):
-        """Create all the visual sprites for the tile"""
-        # Create forest sprite for unowned tile
-        self.forest_sprite = pyglet.sprite.Sprite(forest_image, x=self.tile.x, y=self.tile.y,
-                                                 batch=self.tile.batch, group=background_group)
-        self.forest_sprite.scale_x = grid_size / self.forest_sprite.width
-        self.forest_sprite.scale_y = grid_size / self.forest_sprite.height
-
-        # Create sprites for owned and tilled states (initially hidden)
-        self.farm_sprite = pyglet.sprite.Sprite(farm_tile_image, x=self.tile.x, y=self.tile.y,
-                                               batch=self.tile.batch, group=background_group)
-        self.farm_sprite.scale_x = grid_size / self.farm_sprite.width
-        self.farm_sprite.scale_y = grid_size / self.farm_sprite.height
-        self.farm_sprite.visible = False
-
-        self.tilled_sprite = pyglet.sprite.Sprite(tilled_image, x=self.tile.x, y=self.tile.y,
-                                                 batch=self.tile.batch, group=background_group)
-        self.tilled_sprite.scale_x = grid_size / self.tilled_sprite.width
-        self.tilled_sprite.scale_y = grid_size / self.tilled_sprite.height
-        self.tilled_sprite.visible = False
-
-        # Building sprites (initially hidden)
-        self.barn_sprite = pyglet.sprite.Sprite(barn_image, x=self.tile.x, y=self.tile.y,
-                                               batch=self.tile.batch, group=background_group)
-        self.barn_sprite.scale_x = grid_size / self.barn_sprite.width
-        self.barn_sprite.scale_y = grid_size / self.barn_sprite.height
-        self.barn_sprite.visible = False
-        # 2 pixel black border for barn (outline, not filled)
-        self.barn_border_lines = [
-            pyglet.shapes.Line(self.tile.x, self.tile.y, self.tile.x + grid_size, self.tile.y, thickness=2, color=(0,0,0), batch=self.tile.batch),
-            pyglet.shapes.Line(self.tile.x + grid_size, self.tile.y, self.tile.x + grid_size, self.tile.y + grid_size, thickness=2, color=(0,0,0), batch=self.tile.batch),
-            pyglet.shapes.Line(self.tile.x + grid_size, self.tile.y + grid_size, self.tile.x, self.tile.y + grid_size, thickness=2, color=(0,0,0), batch=self.tile.batch),
-            pyglet.shapes.Line(self.tile.x, self.tile.y + grid_size, self.tile.x, self.tile.y, thickness=2, color=(0,0,0), batch=self.tile.batch)
-        ]
-        for line in self.barn_border_lines:
-            line.visible = False
-
-        # Seed bin icon sprite (initially hidden)
-        from constants import seed_bin_image
-        self.seed_bin_sprite = pyglet.sprite.Sprite(seed_bin_image, x=self.tile.x, y=self.tile.y,
-                                                   batch=self.tile.batch, group=background_group)
-        self.seed_bin_sprite.scale_x = grid_size / self.seed_bin_sprite.width
-        self.seed_bin_sprite.scale_y = grid_size / self.seed_bin_sprite.height
-        self.seed_bin_sprite.visible = False
-        # 2 pixel black border for seed bin (outline, not filled)
-        self.seed_bin_border_lines = [
-            pyglet.shapes.Line(self.tile.x, self.tile.y, self.tile.x + grid_size, self.tile.y, thickness=2, color=(0,0,0), batch=self.tile.batch),
-            pyglet.shapes.Line(self.tile.x + grid_size, self.tile.y, self.tile.x + grid_size, self.tile.y + grid_size, thickness=2, color=(0,0,0), batch=self.tile.batch),
-            pyglet.shapes.Line(self.tile.x + grid_size, self.tile.y + grid_size, self.tile.x, self.tile.y + grid_size, thickness=2, color=(0,0,0), batch=self.tile.batch),
-            pyglet.shapes.Line(self.tile.x, self.tile.y + grid_size, self.tile.x, self.tile.y, thickness=2, color=(0,0,0), batch=self.tile.batch)
-        ]
-        for line in self.seed_bin_border_lines:
-            line.visible = False
+        self.batch = batch
+        self.crop_sprite = None
+        self.seed_icon_sprite = None
+        # Atlas images are already tile-sized, so the sprite needs no scaling
+        self.ground_sprite = pyglet.sprite.Sprite(forest_image, x=self.tile.x, y=self.tile.y,
+                                                  batch=self.batch, group=background_group)
+        tile.view = self
+        self.set_state(tile.state)
+        self.update_crop()
+        self.update_seed_icon()
+
+    def _set_ground_image(self, state):
+        image = STATE_IMAGES.get(state, forest_image)
+        if self.ground_sprite.image is not image:
+            self.ground_sprite.image = image
 
     def set_state(self, new_state):
         """Update visual state based on tile state"""
-        self.tile.state = new_state
-
-        # Hide all visuals first
-        self.forest_sprite.visible = False
-        self.farm_sprite.visible = False
-        self.tilled_sprite.visible = False
-        self.barn_sprite.visible = False
-        for line in self.barn_border_lines:
-            line.visible = False
-        self.seed_bin_sprite.visible = False
-        for line in self.seed_bin_border_lines:
-            line.visible = False
-        if self.tile.building_manager.seed_icon_sprite:
-            self.tile.building_manager.seed_icon_sprite.visible = False
+        self._set_ground_image(new_state)
+
+        if self.seed_icon_sprite:
+            self.seed_icon_sprite.visible = False
 
         # Determine if tile should be darkened (water > 100)
         water_level = self.tile.nutrient_manager.get_nutrient_level('water')
@@ -97,37 +57,87 @@ class FarmTileVisualManager:
         # 70% of 255 = 179 (30% darker for watered tiles)
         dark_color = (179, 179, 179) if should_darken else (255, 255, 255)
 
-        # Show appropriate visual based on state
         if new_state == TILE_UNOWNED:
-            self.forest_sprite.visible = True
             # Apply 25% darker tint to unowned tiles (75% of 255 = 191)
-            self.forest_sprite.color = (48, 96, 48)  # 25% darker green tint
-        elif new_state == TILE_OWNED:
-            self.farm_sprite.visible = True
-            self.farm_sprite.color = dark_color
-        elif new_state == TILE_TILLED:
-            self.tilled_sprite.visible = True
-            self.tilled_sprite.color = dark_color
-        elif new_state == TILE_BARN:
-            self.barn_sprite.visible = True
-            for line in self.barn_border_lines:
-                line.visible = True
-            self.barn_sprite.color = dark_color
-        elif new_state == TILE_SEED_BIN:
-            self.seed_bin_sprite.visible = True
-            for line in self.seed_bin_border_lines:
-                line.visible = True
-            self.seed_bin_sprite.color = dark_color
+            self.ground_sprite.color = (48, 96, 48)  # 25% darker green tint
+        else:
+            self.ground_sprite.color = dark_color
+
+        if new_state == TILE_SEED_BIN:
             # Show seed icon if there's a stored crop type
-            if self.tile.building_manager.seed_icon_sprite and self.tile.building_manager.stored_crop_type:
-                self.tile.building_manager.seed_icon_sprite.visible = True
-                self.tile.building_manager.seed_icon_sprite.color = dark_color
+            if self.tile.building_manager.stored_crop_type:
+                if not self.seed_icon_sprite:
+                    self.update_seed_icon()
+                if self.seed_icon_sprite:
+                    self.seed_icon_sprite.visible = True
+                    self.seed_icon_sprite.color = dark_color
         elif new_state in [TILE_PLANTED, TILE_GROWING, TILE_READY_HARVEST]:
-            self.tilled_sprite.visible = True  # Show tilled ground underneath
-            self.tilled_sprite.color = dark_color
-            if self.tile.crop_manager.crop_sprite:
-                self.tile.crop_manager.crop_sprite.visible = True
-                self.tile.crop_manager.crop_sprite.color = dark_color
+            if self.crop_sprite:
+                self.crop_sprite.visible = True
+                self.crop_sprite.color = dark_color
+
+    def update_crop(self):
+        """Show the tile's crop: grow.png while growing, the crop icon when ready, nothing once harvested"""
+        crop_manager = self.tile.crop_manager
+        if not crop_manager.crop_type or crop_manager.crop_type not in crop_images:
+            if self.crop_sprite:
+                self.crop_sprite.delete()
+                self.crop_sprite = None
+            return
+
+        if self.tile.state == TILE_READY_HARVEST:
+            sprite_image = crop_images[crop_manager.crop_type]
+        else:
+            sprite_image = grow_image
+        if self.crop_sprite is None:
+            self.crop_sprite = pyglet.sprite.Sprite(sprite_image, x=self.tile.x, y=self.tile.y,
+                                                    batch=self.batch, group=icon_group)
+        elif self.crop_sprite.image is not sprite_image:
+            self.crop_sprite.image = sprite_image
+        self.update_growth_scale()
+
+        water_level = self.tile.nutrient_manager.get_nutrient_level('water')
+        self.crop_sprite.color = (179, 179, 179) if water_level > 100 else (255, 255, 255)
+        self.crop_sprite.visible = True
+
+    def update_growth_scale(self):
+        """Size and center the crop sprite for the crop's current growth scale"""
+        if not self.crop_sprite:
+            return
+        current_scale = self.tile.crop_manager.current_scale
+        self.crop_sprite.scale_x = (grid_size * current_scale) / self.crop_sprite.image.width
+        self.crop_sprite.scale_y = (grid_size * current_scale) / self.crop_sprite.image.height
+        # Center the sprite based on current scale
+        self.crop_sprite.x = self.tile.x + grid_size * (1 - current_scale) / 2
+        self.crop_sprite.y = self.tile.y + grid_size * (1 - current_scale) / 2
+
+    def update_seed_icon(self):
+        """Show an icon of the stored seed on a seed bin, or remove it when the bin is empty"""
+        stored_crop_type = self.tile.building_manager.stored_crop_type
+        if self.tile.state != TILE_SEED_BIN or stored_crop_type not in crop_images:
+            if self.seed_icon_sprite:
+                self.seed_icon_sprite.delete()
+                self.seed_icon_sprite = None
+            return
+
+        if self.seed_icon_sprite is None:
+            # Icon group draws on top of the seed bin
+            self.seed_icon_sprite = pyglet.sprite.Sprite(crop_images[stored_crop_type], batch=self.batch,
+                                                         group=icon_group)
+        else:
+            self.seed_icon_sprite.image = crop_images[stored_crop_type]
+
+        # Scale the icon to be 80% of the tile height, centered on the tile
+        icon_size = grid_size * 0.8
+        self.seed_icon_sprite.scale_x = icon_size / self.seed_icon_sprite.image.width
+        self.seed_icon_sprite.scale_y = icon_size / self.seed_icon_sprite.image.height
+        self.seed_icon_sprite.x = self.tile.x + (grid_size - icon_size) / 2
+        self.seed_icon_sprite.y = self.tile.y + (grid_size - icon_size) / 2
+        self.seed_icon_sprite.visible = True
+
+        # Apply current color state
+        water_level = self.tile.nutrient_manager.get_nutrient_level('water')
+        self.seed_icon_sprite.color = (217, 217, 217) if water_level > 100 else (255, 255, 255)
 
     def update_visual_appearance(self):
         """Update the visual appearance based on current water levels"""
@@ -135,17 +145,12 @@ class FarmTileVisualManager:
         should_darken = water_level > 100
         dark_color = (217, 217, 217) if should_darken else (255, 255, 255)  # 85% of 255 = 217 (15% darker)
 
-        # Apply color to all sprites (except unowned tiles which have special green tint)
+        # Unowned tiles keep their special green tint
         if self.tile.state == TILE_UNOWNED:
-            self.forest_sprite.color = (64, 128, 64)  # 50% dark green tint for unowned tiles
+            self.ground_sprite.color = (64, 128, 64)  # 50% dark green tint for unowned tiles
         else:
-            self.forest_sprite.color = dark_color
-        self.farm_sprite.color = dark_color
-        self.tilled_sprite.color = dark_color
-        self.barn_sprite.color = dark_color
-        self.seed_bin_sprite.color = dark_color
-        if self.tile.building_manager.seed_icon_sprite:
-            self.tile.building_manager.seed_icon_sprite.color = dark_color
-        if self.tile.crop_manager.crop_sprite:
-            self.tile.crop_manager.crop_sprite.color = dark_color
-
+            self.ground_sprite.color = dark_color
+        if self.seed_icon_sprite:
+            self.seed_icon_sprite.color = dark_color
+        if self.crop_sprite:
+            self.crop_sprite.color = dark_color
@@ -5,6 +5,7 @@ import tkinter as tk
 from tkinter import ttk
 import threading
 import time
+from constants import BUILDING_BARN, BUILDING_SEED_BIN
 
 
 class FinancialSummaryWindow:
@@ -187,9 +188,9 @@ class FinancialSummaryWindow:
             assets_value = 0
             
             # Count buildings (approximate values)
-            if hasattr(self.game_window, 'farm_tiles'):
-                barn_count = sum(1 for tile in self.game_window.farm_tiles if hasattr(tile, 'state') and tile.state == 6)  # TILE_BARN
-                seed_bin_count = sum(1 for tile in self.game_window.farm_tiles if hasattr(tile, 'state') and tile.state == 5)  # TILE_SEED_BIN
+            if hasattr(self.game_window, 'storage_index'):
+                barn_count = self.game_window.storage_index.count(BUILDING_BARN)
+                seed_bin_count = self.game_window.storage_index.count(BUILDING_SEED_BIN)
                 
                 assets_value += barn_count * 200  # Barn cost
                 assets_value += seed_bin_count * 100  # Seed bin cost
@@ -217,7 +218,7 @@ class FinancialSummaryWindow:
                 total_income = finance.get_total_income()
                 total_expenses = finance.get_total_expenses()
                 net_profit = finance.get_net_profit()
-                transaction_count = len(finance.transactions)
+                transaction_count = finance.transaction_count
                 
                 # Calculate net worth
                 cash_value, inventory_value, assets_value, total_net_worth = self._calculate_net_worth()
@@ -43,6 +43,12 @@ class GameEvents:
 
         self.game_window.input_handler.handle_mouse_press(x, y, button, modifiers)
 
+    def on_mouse_drag(self, x, y, dx, dy, buttons, modifiers):
+        """Pan the camera while the middle mouse button is held over the map"""
+        if buttons & pyglet.window.mouse.MIDDLE:
+            self.game_window.camera.pan(-dx, -dy)
+            self.game_window.managers.hover_system.update_hover_position(x, y)
+
     def on_mouse_scroll(self, x, y, scroll_x, scroll_y):
         """Handle mouse wheel scrolling"""
         # Check orders popup first (blocks other scrolling when open)
@@ -93,6 +99,11 @@ class GameEvents:
                     self.game_window.popup_system.core.overlay_scroll_offset += 1
                     self.game_window.popup_system.overlays._update_overlay_buttons()
 
+        # Otherwise the wheel zooms the map around the cursor
+        elif self.game_window.camera.contains_screen_point(x, y):
+            self.game_window.camera.zoom_at(x, y, scroll_y)
+            self.game_window.managers.hover_system.update_hover_position(x, y)
+
     def on_mouse_leave(self, x, y):
         """Handle mouse leaving the window"""
         self.game_window.tooltip_system.hide_tooltip()
@@ -101,20 +112,30 @@ class GameEvents:
         """Handle mouse entering the window"""
         pass
 
+    def on_resize(self, width, height):
+        """Lay out the right panel and retained UI shapes for the new window size"""
+        if hasattr(self.game_window, 'ui_manager'):
+            self.game_window.ui_manager.update_button_positions()
+        if hasattr(self.game_window, 'camera'):
+            self.game_window.camera.clamp()
+
     def on_close(self):
         """Handle window close event"""
         # Save game on exit
         self.game_window.save_game()
+        self.game_window.forecaster.shutdown()
         pyglet.app.exit()
 
     def update(self, dt):
         """Update game state"""
-        # Update all tractors
-        for tractor in self.game_window.tractors:
-            tractor.update(dt, self.game_window)
+        # Pan the camera with held arrow keys
+        self.game_window.camera.update(dt, self.game_window.key_state)
+
+        # Advance the simulation: tractors, job queue, crop growth, market day, soil and orders
+        self.game_window.simulation.update(dt)
 
-        # Process tractor job queue when tractors become available
-        self.game_window.tractor_job_queue.process_queue()
+        # Collect finished price forecasts; a new market day starts the next one in the background
+        self.game_window.forecaster.poll()
 
         # Check if tractors have finished their tasks and show messages
         for tractor in self.game_window.tractors:
@@ -130,21 +151,6 @@ class GameEvents:
 
                 tractor.show_completion_message = False
 
-        # Update crop growth
-        for tile in self.game_window.farm_tiles:
-            tile.update_growth()
-
-        # Update market prices and check for new day
-        old_day = self.game_window.market.current_day
-        self.game_window.market.update(dt)
-
-        # If a new day has started, grow weeds on all farm tiles
-        if self.game_window.market.current_day != old_day:
-            self.grow_weeds_daily()
-
-        # Update order system (generate new orders periodically)
-        self.game_window.game_state.order_system.update()
-
         # Update tooltip content every tick for dynamic data
         self.game_window.tooltip_system.update_tooltip_tick()
 
@@ -163,17 +169,5 @@ class GameEvents:
             self.game_window.auto_save_game()
             self.game_window.auto_save_timer = 0.0
 
-    def grow_weeds_daily(self):
-        """Grow weeds on all farm tiles at the start of each new day"""
-        total_tiles_affected = 0
-        total_weed_growth = 0
-
-        for tile in self.game_window.farm_tiles:
-            weed_growth = tile.grow_weeds()
-            if weed_growth > 0:
-                total_tiles_affected += 1
-                total_weed_growth += weed_growth
-
-        if total_tiles_affected > 0:
-            avg_growth = total_weed_growth / total_tiles_affected
-            print(f"🌿 Daily weed growth: {total_tiles_affected} tiles affected, average +{avg_growth:.1f} weeds per tile")
+        # Report background saves that finished since the last tick
+        self.game_window.managers.save_manager.poll_background_saves()
@@ -3,7 +3,7 @@ from tractor_manager import TractorManager
 from hover_system import HoverSystem
 from rendering_manager import RenderingManager
 from overlay_manager import OverlayManager
-from tractor_job_queue import TractorJobQueue
+from save_manager import SaveManager
 
 class GameManagers:
     def __init__(self, game_window):
@@ -14,4 +14,7 @@ class GameManagers:
         self.hover_system = HoverSystem(game_window)
         self.rendering_manager = RenderingManager(game_window)
         self.overlay_manager = OverlayManager(game_window)
-        self.tractor_job_queue = TractorJobQueue(game_window)
+        self.tractor_job_queue = game_window.simulation.tractor_job_queue
+        # Queued-job indicators follow the simulation's job queue
+        self.tractor_job_queue.on_queue_changed = self.rendering_manager.sync_queue_indicators
+        self.save_manager = SaveManager(game_window)
@@ -6,7 +6,9 @@ import pyglet
 import os
 import json
 from pathlib import Path
-from constants import grid_size, MOUSE_MODE_NORMAL, BUILDING_BARN, TILE_PLANTED
+from constants import grid_size, MOUSE_MODE_NORMAL, BUILDING_BARN, UI_PANEL_WIDTH
+from camera import Camera
+from simulation import Simulation
 from window_setup import WindowSetup
 from game_managers import GameManagers
 from game_events import GameEvents
@@ -37,14 +39,33 @@ class GameWindow(pyglet.window.Window):
     
     @property
     def tractor_job_queue(self):
-        return self.managers.tractor_job_queue
+        return self.simulation.tractor_job_queue
+
+    @property
+    def game_state(self):
+        return self.simulation.game_state
+
+    @property
+    def market(self):
+        return self.simulation.market
+
+    @property
+    def forecaster(self):
+        return self.simulation.forecaster
+
+    @property
+    def storage_index(self):
+        return self.simulation.farm.storage_index
+
     def __init__(self, *args, **kwargs):
         from constants import game_config
-        ui_border_right = 245
         map_width = game_config.get('map_width', 50)
         map_height = game_config.get('map_height', 25)
-        window_width = map_width * grid_size + ui_border_right
-        window_height = map_height * grid_size
+        # The window shows at most view_width x view_height tiles; larger maps scroll with the camera
+        view_width = min(map_width, game_config.get('view_width', 40))
+        view_height = min(map_height, game_config.get('view_height', 30))
+        window_width = view_width * grid_size + UI_PANEL_WIDTH
+        window_height = view_height * grid_size
         
         # Initialize the pyglet window
         super().__init__(width=window_width, height=window_height, caption="A Tile Farming Game", *args, **kwargs)
@@ -61,16 +82,15 @@ class GameWindow(pyglet.window.Window):
                 int((screen.width - window_width) / 2),
                 int((screen.height - window_height) / 2)
             )
-        # Initialize game state first
-        from game_state import GameState
-        from market import Market
-        self.game_state = GameState()
-        self.market = Market()
-        # Initialize order system with market reference
-        self.game_state.order_system.initialize_starting_orders(self.market)
+        # The simulation owns all game state; the window and managers draw it and feed it input
+        self.simulation = Simulation(map_width, map_height)
         self.managers = GameManagers(self)
-        # Setup the farm tiles
+        # Create the sprites for the farm tiles
         self.managers.farm_manager.setup_farm()
+        self.camera = Camera(self, map_width * grid_size, map_height * grid_size)
+        # Held-key state for camera panning
+        self.key_state = pyglet.window.key.KeyStateHandler()
+        self.push_handlers(self.key_state)
         self.events = GameEvents(self)
         self.rendering = GameRendering(self)
         self.tooltip_system = TooltipSystem(self)
@@ -111,7 +131,6 @@ class GameWindow(pyglet.window.Window):
         self.notification_duration = 10.0  # 10 seconds
 
         # Schedule the update method
-        import pyglet
         pyglet.clock.schedule_interval(self.events.update, 1/60.0)
     
     def show_orders_window(self):
@@ -125,6 +144,10 @@ class GameWindow(pyglet.window.Window):
         """Get the farm tile at the given grid position"""
         return self.managers.farm_manager.get_tile_at_position(grid_x, grid_y)
     
+    def get_tile_at_grid(self, col, row):
+        """Get the farm tile at the given column and row"""
+        return self.managers.farm_manager.get_tile_at_grid(col, row)
+    
     def get_active_tractor(self):
         """Get the currently active/selected tractor"""
         return self.managers.tractor_manager.get_active_tractor()
@@ -239,239 +262,21 @@ class GameWindow(pyglet.window.Window):
         
         return save_dir
     
-    def save_game(self, filename="game_save.json"):
+    def save_game(self, filename=None, incremental=False):
         """Save the complete game state"""
-        import json
-        try:
-            # Get the full path for the save file
-            save_dir = self.get_save_directory()
-            full_path = save_dir / filename
-            
-            # Save game state
-            self.game_state.save_game_state(str(full_path))
-            
-            # Get additional data that needs to be saved
-            game_data = {}
-            
-            # Load existing save file and add additional data
-            try:
-                with open(full_path, 'r') as f:
-                    game_data = json.load(f)
-            except:
-                pass
-            
-            # Add farm tiles data
-            farm_tiles_data = []
-            for tile in self.farm_tiles:
-                tile_data = {
-                    'x': tile.x,
-                    'y': tile.y,
-                    'state': tile.state,
-                    'weeds': tile.weeds,
-                    'crop_type': tile.crop_manager.get_crop_type(),
-                    'growth_time': tile.crop_manager.growth_time,
-                    'plant_time': tile.crop_manager.plant_time,
-                    'current_scale': tile.crop_manager.current_scale,
-                    'building_type': tile.building_manager.building_type,
-                    'stored_crop_type': tile.building_manager.get_stored_crop_type(),
-                    'stored_amount': tile.building_manager.get_stored_amount(),
-                    'building_capacity': tile.building_manager.get_building_capacity(),
-                    'previous_seed_type': tile.building_manager.previous_seed_type,
-                    'nutrients': tile.nutrient_manager.nutrients.copy()
-                }
-                farm_tiles_data.append(tile_data)
-            
-            # Add tractor data
-            tractors_data = []
-            for tractor in self.tractors:
-                tractor_data = {
-                    'x': tractor.x,
-                    'y': tractor.y,
-                    'target_x': tractor.core.target_x,
-                    'target_y': tractor.core.target_y,
-                    'moving': tractor.core.moving,
-                    'speed': tractor.speed,
-                    'is_idle': tractor.is_idle(),
-                    'row_direction': tractor.core.row_direction,
-                    'mode': tractor.core.mode,
-                    'selected_seed': tractor.core.selected_seed,
-                    'selected_fertilizer': tractor.core.selected_fertilizer,
-                    'cultivated_tiles': list(tractor.core.cultivated_tiles),
-                    'additional_rows': tractor.core.additional_rows.copy(),
-                    'current_operation': tractor.core.current_operation,
-                    'field_width': tractor.core.field_width,
-                    'start_x': tractor.core.start_x,
-                    'current_seed_type': tractor.core.current_seed_type,
-                    'current_fertilizer_data': tractor.core.current_fertilizer_data,
-                    'active_rows': tractor.core.active_rows.copy(),
-                    'job_harvest_accumulator': tractor.core.job_harvest_accumulator.copy(),
-                    'job_fertilizer_accumulator': tractor.core.job_fertilizer_accumulator.copy()
-                }
-                tractors_data.append(tractor_data)
-            
-            # Add additional game data
-            game_data.update({
-                'current_day': getattr(self.market, 'current_day', 0),
-                'current_row': self.current_row,
-                'active_tractor_index': self.active_tractor_index,
-                'auto_till': self.auto_till,
-                'mouse_mode': self.mouse_mode,
-                'selected_building': self.selected_building,
-                'farm_tiles': farm_tiles_data,
-                'tractors': tractors_data,
-                'tractor_job_queue': self.tractor_job_queue.save_job_data(),
-                'order_system': self.game_state.order_system.save_order_data()
-            })
-            
-            # Save complete data
-            with open(full_path, 'w') as f:
-                json.dump(game_data, f, indent=2)
-            
-            print(f"💾 Complete game saved to {full_path}")
-            self.show_notification("Game Saved!")
-            return True
-        except Exception as e:
-            print(f"❌ Failed to save game: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+        return self.managers.save_manager.save_game(filename, incremental)
     
     def auto_save_game(self):
-        """Auto-save the game to autosave.json"""
+        """Auto-save the game to the autosave slot in the background, appending only what changed"""
         try:
-            result = self.save_game("autosave.json")
-            if result:
-                save_dir = self.get_save_directory()
-                full_path = save_dir / "autosave.json"
-                print(f"💾 Auto-saved game to {full_path}")
-            return result
+            return self.managers.save_manager.save_game_async(incremental=True)
         except Exception as e:
             print(f"❌ Auto-save failed: {e}")
             return False
     
-    def load_game(self, filename="game_save.json"):
+    def load_game(self, filename=None):
         """Load the complete game state"""
-        import json
-        try:
-            # Get the full path for the save file
-            save_dir = self.get_save_directory()
-            full_path = save_dir / filename
-            
-            with open(full_path, 'r') as f:
-                game_data = json.load(f)
-            
-            # Load game state
-            self.game_state.load_game_state(str(full_path))
-            
-            # Load farm tiles data
-            if 'farm_tiles' in game_data:
-                for i, tile_data in enumerate(game_data['farm_tiles']):
-                    if i < len(self.farm_tiles):
-                        tile = self.farm_tiles[i]
-                        tile.state = tile_data.get('state', tile.state)
-                        tile.weeds = tile_data.get('weeds', tile.weeds)
-                        
-                        # Load crop data
-                        crop_type = tile_data.get('crop_type')
-                        if crop_type is not None and crop_type != "":
-                            tile.crop_manager.restore_crop_state(
-                                crop_type,
-                                tile_data.get('growth_time', 0),
-                                tile_data.get('plant_time', 0),
-                                tile_data.get('state', TILE_PLANTED),
-                                tile_data.get('current_scale', 0.5)
-                            )
-                            # Note: update_growth() is not called here to preserve saved state exactly
-                        
-                        # Load building data
-                        if tile_data.get('building_type'):
-                            tile.building_manager.building_type = tile_data['building_type']
-                            tile.building_manager.stored_crop_type = tile_data.get('stored_crop_type', None)
-                            tile.building_manager.stored_amount = tile_data.get('stored_amount', 0)
-                            tile.building_manager.building_capacity = tile_data.get('building_capacity', 0)
-                            tile.building_manager.previous_seed_type = tile_data.get('previous_seed_type', None)
-                        
-                        # Load nutrients
-                        if 'nutrients' in tile_data:
-                            tile.nutrient_manager.nutrients = tile_data['nutrients'].copy()
-                        
-                        # Update visual state
-                        tile.visual_manager.set_state(tile.state)
-            
-            # Load tractor data
-            if 'tractors' in game_data:
-                for i, tractor_data in enumerate(game_data['tractors']):
-                    if i < len(self.tractors):
-                        tractor = self.tractors[i]
-                        tractor.x = tractor_data.get('x', tractor.x)
-                        tractor.y = tractor_data.get('y', tractor.y)
-                        tractor.core.target_x = tractor_data.get('target_x', tractor.core.target_x)
-                        tractor.core.target_y = tractor_data.get('target_y', tractor.core.target_y)
-                        tractor.core.moving = tractor_data.get('moving', tractor.core.moving)
-                        tractor.speed = tractor_data.get('speed', tractor.speed)
-                        tractor.core.row_direction = tractor_data.get('row_direction', tractor.core.row_direction)
-                        tractor.core.mode = tractor_data.get('mode', tractor.core.mode)
-                        tractor.core.selected_seed = tractor_data.get('selected_seed', tractor.core.selected_seed)
-                        tractor.core.selected_fertilizer = tractor_data.get('selected_fertilizer', tractor.core.selected_fertilizer)
-                        tractor.core.cultivated_tiles = set(tuple(coord) for coord in tractor_data.get('cultivated_tiles', []))
-                        tractor.core.additional_rows = tractor_data.get('additional_rows', tractor.core.additional_rows).copy()
-                        tractor.core.current_operation = tractor_data.get('current_operation', tractor.core.current_operation)
-                        tractor.core.field_width = tractor_data.get('field_width', tractor.core.field_width)
-                        tractor.core.start_x = tractor_data.get('start_x', tractor.core.start_x)
-                        tractor.core.current_seed_type = tractor_data.get('current_seed_type', tractor.core.current_seed_type)
-                        tractor.core.current_fertilizer_data = tractor_data.get('current_fertilizer_data', tractor.core.current_fertilizer_data)
-                        tractor.core.active_rows = tractor_data.get('active_rows', tractor.core.active_rows).copy()
-                        tractor.core.job_harvest_accumulator = tractor_data.get('job_harvest_accumulator', tractor.core.job_harvest_accumulator).copy()
-                        tractor.core.job_fertilizer_accumulator = tractor_data.get('job_fertilizer_accumulator', tractor.core.job_fertilizer_accumulator).copy()
-                        
-                        # Update sprite position
-                        tractor.core.sprite.x = tractor.x
-                        tractor.core.sprite.y = tractor.y
-            
-            # Show tractors that are currently working
-            for tractor in self.tractors:
-                if tractor.core.current_operation or tractor.core.moving:
-                    tractor.core.show()
-                else:
-                    tractor.core.hide()
-            
-            # Load additional game data
-            self.current_row = game_data.get('current_row', self.current_row)
-            self.active_tractor_index = game_data.get('active_tractor_index', self.active_tractor_index)
-            self.auto_till = game_data.get('auto_till', self.auto_till)
-            self.mouse_mode = game_data.get('mouse_mode', self.mouse_mode)
-            self.selected_building = game_data.get('selected_building', self.selected_building)
-            
-            # Update tractor manager
-            self.managers.tractor_manager.active_tractor_index = self.active_tractor_index
-            
-            # Load order system data
-            if 'order_system' in game_data:
-                self.game_state.order_system.load_order_data(game_data['order_system'])
-            
-            # Load tractor job queue data
-            if 'tractor_job_queue' in game_data:
-                self.tractor_job_queue.load_job_data(game_data['tractor_job_queue'])
-            
-            # Load market day
-            if 'current_day' in game_data:
-                self.market.current_day = game_data['current_day']
-            
-            # Update UI
-            if hasattr(self, 'ui_info_window'):
-                self.ui_info_window._update_info()
-            
-            print(f"📂 Complete game loaded from {full_path}")
-            self.show_notification("Game Loaded!")
-            return True
-        except FileNotFoundError:
-            print(f"📂 No save file found at {full_path}")
-            return False
-        except Exception as e:
-            print(f"❌ Failed to load game: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+        return self.managers.save_manager.load_game(filename)
     
     def reset_all_buttons(self):
         """Reset all button states"""
@@ -15,13 +15,16 @@ class HoverSystem:
     
     def update_hover_position(self, x, y):
         """Update hover tile position for buy tiles mode highlighting"""
+        camera = self.game_window.camera
         if self.game_window.mouse_mode == MOUSE_MODE_BUY_TILES:
-            # Convert mouse coordinates to grid coordinates
-            grid_x = int(x // grid_size) * grid_size
-            grid_y = int(y // grid_size) * grid_size
+            # Convert mouse coordinates to world grid coordinates
+            world_x, world_y = camera.screen_to_world(x, y)
+            grid_x = int(world_x // grid_size) * grid_size
+            grid_y = int(world_y // grid_size) * grid_size
             
-            # Only track if within the game area (not UI area)
-            if (0 <= grid_y < self.game_window.height and 0 <= grid_x < self.game_window.width - 245):
+            # Only track if within the map area (not UI area) and over a tile
+            if (camera.contains_screen_point(x, y) and
+                    self.game_window.managers.farm_manager.get_tile_at_position(grid_x, grid_y)):
                 self.hover_tile_x = grid_x
                 self.hover_tile_y = grid_y
             else:
@@ -83,13 +86,12 @@ class HoverSystem:
             tile_x = self.hover_tile_x + offset_x
             tile_y = self.hover_tile_y + offset_y
             
-            # Check if position is within game bounds
-            if 0 <= tile_x < self.game_window.width - 245 and 0 <= tile_y < self.game_window.height:
-                tile = self.game_window.managers.farm_manager.get_tile_at_position(tile_x, tile_y)
-                if tile:
-                    tiles_to_highlight.append((tile_x, tile_y))
-                    if tile.state == 0:  # TILE_UNOWNED
-                        unowned_tiles.append(tile)
+            # Positions off the map have no tile
+            tile = self.game_window.managers.farm_manager.get_tile_at_position(tile_x, tile_y)
+            if tile:
+                tiles_to_highlight.append((tile_x, tile_y))
+                if tile.state == 0:  # TILE_UNOWNED
+                    unowned_tiles.append(tile)
         
         # Check if player can afford all unowned tiles
         tile_price = game_config['tile_purchase_price']
@@ -123,14 +125,14 @@ class HoverSystem:
         tiles_to_highlight = []
         unowned_tiles = []
         
-        # Calculate the row width (game area width minus UI area)
-        game_area_width = self.game_window.width - 245
-        
-        # Go through all tiles in the row
-        for tile_x in range(0, game_area_width, grid_size):
-            tile = self.game_window.managers.farm_manager.get_tile_at_position(tile_x, row_y)
+        # Go through all tiles in the row (the whole map row is bought, even the part out of view)
+        farm_manager = self.game_window.managers.farm_manager
+        first_col, _, end_col, _ = self.game_window.camera.visible_tile_range()
+        for col in range(farm_manager.grid_width):
+            tile = farm_manager.get_tile_at_position(col * grid_size, row_y)
             if tile:
-                tiles_to_highlight.append((tile_x, row_y))
+                if first_col <= col < end_col:
+                    tiles_to_highlight.append((col * grid_size, row_y))
                 if tile.state == 0:  # TILE_UNOWNED
                     unowned_tiles.append(tile)
         
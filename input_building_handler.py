@@ -2,7 +2,8 @@
 Building interaction handling for barns and seed bins
 """
 from pyglet.window import key
-from constants import TILE_BARN, TILE_SEED_BIN, seeds_config
+from constants import TILE_BARN, TILE_SEED_BIN
+from simulation.catalog import get_seed_cost
 
 
 class BuildingInteractionHandler:
@@ -13,10 +14,7 @@ class BuildingInteractionHandler:
     
     def get_seed_price(self, seed_name):
         """Get the price of a specific seed type from seeds config"""
-        for seed in seeds_config:
-            if seed['name'] == seed_name:
-                return seed['cost']
-        return 10  # Default fallback price
+        return get_seed_cost(seed_name)  # Falls back to 10 for unknown seeds
     
     def interact_with_building(self, tile, modifiers=0):
         """Handle interactions with buildings"""
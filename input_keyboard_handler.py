@@ -3,6 +3,14 @@ Keyboard input handling
 """
 import pyglet
 from constants import OVERLAY_NONE
+from simulation.clock import TIME_SCALES
+
+# Number keys that pick a simulation speed
+TIME_SCALE_KEYS = {
+    pyglet.window.key._1: TIME_SCALES[0],
+    pyglet.window.key._2: TIME_SCALES[1],
+    pyglet.window.key._3: TIME_SCALES[2],
+}
 
 
 class KeyboardHandler:
@@ -27,6 +35,13 @@ class KeyboardHandler:
                 self.game_window.managers.tractor_manager.purchase_tractor()
             return
         
+        # Handle 1/2/3 for simulation speed (1x, 10x, 1000x)
+        if symbol in TIME_SCALE_KEYS:
+            time_scale = TIME_SCALE_KEYS[symbol]
+            self.game_window.simulation.clock.set_time_scale(time_scale)
+            self.game_window.show_notification(f"Speed: {time_scale}x", 3.0)
+            return
+        
         # No other hotkeys - all input is handled through mouse interface
         pass
 
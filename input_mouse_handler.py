@@ -87,10 +87,9 @@ class MouseHandler:
             return  # Popup handled the click
         
         # Handle tile interactions
-        grid_x = int(x // grid_size) * grid_size
-        grid_y = int(y // grid_size) * grid_size
-        
-        if 0 <= grid_y < self.game_window.height and 0 <= grid_x < self.game_window.width:
+        grid_position = self._grid_position(x, y)
+        if grid_position:
+            grid_x, grid_y = grid_position
             tile = self.game_window.get_tile_at_position(grid_x, grid_y)
             if tile:
                 # Import here to avoid circular import
@@ -114,11 +113,10 @@ class MouseHandler:
             return
         
         # Check for queued job cancellation first (works in any mode)
-        grid_x = int(x // grid_size) * grid_size
-        grid_y = int(y // grid_size) * grid_size
+        grid_position = self._grid_position(x, y)
         
-        if (0 <= grid_y < self.game_window.height and 0 <= grid_x < self.game_window.width and
-            hasattr(self.game_window, 'tractor_job_queue')):
+        if grid_position and hasattr(self.game_window, 'tractor_job_queue'):
+            grid_x, grid_y = grid_position
             # Try to cancel a queued job at this position
             if self.game_window.tractor_job_queue.cancel_job_at_position(grid_x, grid_y):
                 return  # Job cancelled, don't do other right-click actions
@@ -132,7 +130,8 @@ class MouseHandler:
             return
         
         # Right-click for seed bin purchases and barn selling (only in normal mode)
-        if 0 <= grid_y < self.game_window.height and 0 <= grid_x < self.game_window.width:
+        if grid_position:
+            grid_x, grid_y = grid_position
             tile = self.game_window.get_tile_at_position(grid_x, grid_y)
             if tile and tile.state == TILE_SEED_BIN:
                 # Import here to avoid circular import
@@ -145,6 +144,14 @@ class MouseHandler:
                 building_handler = BuildingInteractionHandler(self.game_window)
                 building_handler.handle_barn_right_click(tile, modifiers)
     
+    def _grid_position(self, x, y):
+        """Get the world position of the tile under a screen point, or None outside the map area"""
+        camera = self.game_window.camera
+        if not camera.contains_screen_point(x, y):
+            return None
+        world_x, world_y = camera.screen_to_world(x, y)
+        return int(world_x // grid_size) * grid_size, int(world_y // grid_size) * grid_size
+    
     def _handle_ui_button_clicks(self, x, y):
         """Handle UI button clicks and return True if a button was clicked"""
         # Check all UI buttons
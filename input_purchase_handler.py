@@ -31,11 +31,10 @@ class PurchaseHandler:
             tile_x = center_x + offset_x
             tile_y = center_y + offset_y
             
-            # Check if position is within game bounds
-            if 0 <= tile_x < self.game_window.width - 245 and 0 <= tile_y < self.game_window.height:
-                surrounding_tile = self.game_window.get_tile_at_position(tile_x, tile_y)
-                if surrounding_tile and surrounding_tile.state == 0:  # TILE_UNOWNED
-                    unowned_tiles.append(surrounding_tile)
+            # Positions off the map have no tile
+            surrounding_tile = self.game_window.get_tile_at_position(tile_x, tile_y)
+            if surrounding_tile and surrounding_tile.state == 0:  # TILE_UNOWNED
+                unowned_tiles.append(surrounding_tile)
         
         # Include the center tile in purchase if it's unowned
         if center_tile.state == 0:  # TILE_UNOWNED
@@ -68,11 +67,9 @@ class PurchaseHandler:
         row_y = center_y
         unowned_tiles = []
         
-        # Calculate the row width (game area width minus UI area)
-        game_area_width = self.game_window.width - 245
-        
-        # Go through all tiles in the row
-        for tile_x in range(0, game_area_width, grid_size):
+        # Go through all tiles in the map row
+        for col in range(self.game_window.managers.farm_manager.grid_width):
+            tile_x = col * grid_size
             tile = self.game_window.managers.farm_manager.get_tile_at_position(tile_x, row_y)
             if tile and tile.state == 0:  # TILE_UNOWNED
                 unowned_tiles.append(tile)
@@ -5,11 +5,12 @@ from pyglet.window import key
 from constants import (
     MOUSE_MODE_NORMAL, MOUSE_MODE_TRACTOR, MOUSE_MODE_BUY_TILES, 
     MOUSE_MODE_PLANT_SEEDS, MOUSE_MODE_HARVEST, MOUSE_MODE_BUILD, 
-    MOUSE_MODE_CULTIVATE, MOUSE_MODE_CULTIVATOR, game_config, seeds_config,
+    MOUSE_MODE_CULTIVATE, MOUSE_MODE_CULTIVATOR, game_config,
     TILE_BARN, TILE_SEED_BIN, TILE_TILLED, TILE_GROWING, TILE_READY_HARVEST,
     BUILDING_SEED_BIN
 )
-from tractor_job_queue import JobType
+from simulation.tractor_job_queue import JobType
+from simulation.catalog import get_seed_cost
 
 
 class TileInteractionHandler:
@@ -20,10 +21,7 @@ class TileInteractionHandler:
     
     def get_seed_price(self, seed_name):
         """Get the price of a specific seed type from seeds config"""
-        for seed in seeds_config:
-            if seed['name'] == seed_name:
-                return seed['cost']
-        return 10  # Default fallback price
+        return get_seed_cost(seed_name)  # Falls back to 10 for unknown seeds
     
     def handle_tile_interaction(self, tile, grid_x, grid_y, modifiers=0, is_double_click=False):
         """Handle interactions with farm tiles based on current mode"""
@@ -66,7 +64,7 @@ class TileInteractionHandler:
         if available_tractor:
             # Use multi-row tilling based on tractor upgrade mode
             num_rows = getattr(self.game_window.game_state, 'tractor_row_mode', 1)
-            success = available_tractor.start_tilling_multi_row(grid_y, self.game_window.width, self.game_window, grid_x, num_rows)
+            success = available_tractor.start_tilling_multi_row(grid_y, self.game_window.simulation.width, self.game_window.simulation, grid_x, num_rows)
         else:
             # No tractor available, queue the job
             num_rows = getattr(self.game_window.game_state, 'tractor_row_mode', 1)
@@ -111,13 +109,7 @@ class TileInteractionHandler:
             selected_seed = self.game_window.game_state.selected_seed
             if selected_seed:
                 # Check if we have seeds in seed bins
-                has_seeds = False
-                for bin_tile in self.game_window.farm_tiles:
-                    if (bin_tile.state == TILE_SEED_BIN and 
-                        bin_tile.stored_crop_type == selected_seed and 
-                        bin_tile.stored_amount > 0):
-                        has_seeds = True
-                        break
+                has_seeds = self.game_window.storage_index.total(BUILDING_SEED_BIN, selected_seed) > 0
                 
                 if has_seeds:
                     success = False
@@ -125,7 +117,7 @@ class TileInteractionHandler:
                     if available_tractor:
                         # Use multi-row planting based on tractor upgrade mode
                         num_rows = getattr(self.game_window.game_state, 'tractor_row_mode', 1)
-                        success = available_tractor.start_planting_multi_row(grid_y, self.game_window.width, self.game_window, grid_x, selected_seed, num_rows)
+                        success = available_tractor.start_planting_multi_row(grid_y, self.game_window.simulation.width, self.game_window.simulation, grid_x, selected_seed, num_rows)
                     else:
                         # No tractor available, queue the job
                         num_rows = getattr(self.game_window.game_state, 'tractor_row_mode', 1)
@@ -150,7 +142,7 @@ class TileInteractionHandler:
             if available_tractor:
                 # Use multi-row harvesting based on tractor upgrade mode
                 num_rows = getattr(self.game_window.game_state, 'tractor_row_mode', 1)
-                success = available_tractor.start_harvesting_multi_row(grid_y, self.game_window.width, self.game_window, grid_x, num_rows)
+                success = available_tractor.start_harvesting_multi_row(grid_y, self.game_window.simulation.width, self.game_window.simulation, grid_x, num_rows)
             else:
                 # No tractor available, queue the job
                 num_rows = getattr(self.game_window.game_state, 'tractor_row_mode', 1)
@@ -176,7 +168,7 @@ class TileInteractionHandler:
                     # Use multi-row cultivating based on tractor upgrade mode
                     num_rows = getattr(self.game_window.game_state, 'tractor_row_mode', 1)
                     success = available_tractor.start_cultivating_multi_row(
-                        grid_y, self.game_window.width, self.game_window, grid_x, selected_fertilizer, num_rows
+                        grid_y, self.game_window.simulation.width, self.game_window.simulation, grid_x, selected_fertilizer, num_rows
                     )
                 else:
                     # No tractor available, queue the job
@@ -201,7 +193,7 @@ class TileInteractionHandler:
         if available_tractor:
             # Use multi-row cultivator based on tractor upgrade mode
             num_rows = getattr(self.game_window.game_state, 'tractor_row_mode', 1)
-            success = available_tractor.start_cultivator_multi_row(grid_y, self.game_window.width, self.game_window, grid_x, num_rows)
+            success = available_tractor.start_cultivator_multi_row(grid_y, self.game_window.simulation.width, self.game_window.simulation, grid_x, num_rows)
         else:
             # No tractor available, queue the job
             num_rows = getattr(self.game_window.game_state, 'tractor_row_mode', 1)
@@ -1,3 +1,4 @@
+import multiprocessing
 import pyglet
 from game_window import GameWindow
 from splash_screen import SplashScreen
@@ -38,5 +39,7 @@ def main():
 
 
 if __name__ == '__main__':
+    # Price forecasts run in worker processes; frozen builds need this to start them
+    multiprocessing.freeze_support()
     main()
 
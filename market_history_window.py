@@ -1,8 +1,136 @@
 import pyglet
 from pyglet import shapes
+from pyglet.gl import GL_LINES, GL_POINTS, GL_SCISSOR_TEST, glDisable, glEnable, glPointSize, glScissor
+from pyglet.math import Mat4, Vec3
 import math
+import numpy as np
 from constants import seeds_config
 
+# (days, prices) for a crop with no recorded history
+EMPTY_HISTORY = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+
+class ChartGroup(pyglet.graphics.Group):
+    """Maps chart data coordinates (day, price) onto the chart area and clips drawing to it
+
+    Price series are uploaded once in data coordinates, so rescaling the chart only changes this matrix.
+    """
+
+    def __init__(self, window, chart_area, order=0):
+        super().__init__(order=order)
+        self.window = window
+        self.chart_area = chart_area
+        self.matrix = Mat4()
+        self._saved_view = None
+
+    def set_data_range(self, min_day, max_day, min_price, max_price):
+        """Set which days and prices span the chart area"""
+        area = self.chart_area
+        scale_x = (area['right'] - area['left']) / (max_day - min_day)
+        scale_y = (area['top'] - area['bottom']) / (max_price - min_price)
+        self.matrix = (Mat4.from_translation(Vec3(area['left'] - min_day * scale_x,
+                                                  area['bottom'] - min_price * scale_y, 0)) @
+                       Mat4.from_scale(Vec3(scale_x, scale_y, 1)))
+
+    def set_state(self):
+        self._saved_view = self.window.view
+        self.window.view = self._saved_view @ self.matrix
+        # Clip to the chart area (scissor works in framebuffer pixels)
+        area = self.chart_area
+        ratio = self.window.get_framebuffer_size()[0] / self.window.width
+        glEnable(GL_SCISSOR_TEST)
+        glScissor(int(area['left'] * ratio), int(area['bottom'] * ratio),
+                  int((area['right'] - area['left']) * ratio) + 1, int((area['top'] - area['bottom']) * ratio) + 1)
+        glPointSize(6 * ratio)
+
+    def unset_state(self):
+        glDisable(GL_SCISSOR_TEST)
+        self.window.view = self._saved_view
+
+
+class PriceSeries:
+    """One crop's price history as a line vertex list plus a point vertex list, grown one day at a time"""
+
+    def __init__(self, days, prices, color, batch, group):
+        self.color = color + (255,)
+        self.batch = batch
+        self.group = group
+        self.last_day = None
+        self.lines = None
+        self.points = None
+        self.rebuild(days, prices)
+
+    def rebuild(self, days, prices):
+        """Upload a complete history (parallel day and price arrays), replacing any previous geometry"""
+        self.delete()
+        program = pyglet.graphics.get_default_shader()
+        count = len(days)
+        points = np.zeros((count, 3), dtype=np.float32)
+        points[:, 0] = days
+        points[:, 1] = prices
+        self.points = program.vertex_list(count, GL_POINTS, self.batch, self.group,
+                                          position=('f', points.ravel().tolist()), colors=('Bn', self.color * count))
+        # Each segment joins a point to the next one
+        segments = np.stack((points[:-1], points[1:]), axis=1) if count > 1 else np.zeros((0, 2, 3))
+        segment_count = len(segments) * 2
+        self.lines = program.vertex_list(segment_count, GL_LINES, self.batch, self.group,
+                                         position=('f', segments.ravel().tolist()),
+                                         colors=('Bn', self.color * segment_count))
+        self.last_point = (int(days[-1]), int(prices[-1])) if count else None
+        self.last_day = self.last_point[0] if count else None
+
+    def append(self, day, price):
+        """Add one new data point (one point vertex and one line segment)"""
+        count = self.points.count
+        self.points.resize(count + 1)
+        self.points.position[count * 3:] = (day, price, 0)
+        self.points.colors[count * 4:] = self.color
+        if self.last_point is not None:
+            line_count = self.lines.count
+            self.lines.resize(line_count + 2)
+            self.lines.position[line_count * 3:] = self.last_point + (0,) + (day, price, 0)
+            self.lines.colors[line_count * 4:] = self.color * 2
+        self.last_point = (day, price)
+        self.last_day = day
+
+    @property
+    def point_count(self):
+        return self.points.count
+
+    def delete(self):
+        if self.points is not None:
+            self.points.delete()
+            self.lines.delete()
+            self.points = None
+            self.lines = None
+
+
+class ForecastBand:
+    """One crop's forecast as line strips from today: the median, plus fainter low and high percentiles"""
+
+    def __init__(self, forecast, crop, color, batch, group):
+        band = forecast.get_band(crop)  # [low/median/high, day ahead]
+        days = np.arange(forecast.market_day, forecast.market_day + forecast.days + 1, dtype=np.float32)
+        program = pyglet.graphics.get_default_shader()
+        positions = []
+        colors = []
+        for prices, alpha in ((band[0], 90), (band[1], 200), (band[2], 90)):
+            points = np.zeros((len(days), 3), dtype=np.float32)
+            points[:, 0] = days
+            points[:, 1] = prices
+            segments = np.stack((points[:-1], points[1:]), axis=1).ravel().tolist()
+            positions.extend(segments)
+            colors.extend((color + (alpha,)) * (len(segments) // 3))
+        self.low = float(band[0].min())
+        self.high = float(band[2].max())
+        self.last_day = int(days[-1])
+        self.lines = program.vertex_list(len(positions) // 3, GL_LINES, batch, group,
+                                         position=('f', positions),
+                                         colors=('Bn', colors))
+
+    def delete(self):
+        self.lines.delete()
+
 
 class MarketHistoryWindow(pyglet.window.Window):
     def __init__(self, market, game_window=None, *args, **kwargs):
@@ -10,6 +138,10 @@ class MarketHistoryWindow(pyglet.window.Window):
         
         self.market = market
         self.game_window = game_window
+        # Price forecasts come from the game's simulation; a standalone window shows none
+        self.forecaster = game_window.forecaster if game_window is not None else None
+        self._forecast_version = None
+        self.forecast_bands = {}  # crop -> ForecastBand
         self.selected_crop = None
         self.crop_colors = {}
         self.chart_area = {
@@ -40,6 +172,21 @@ class MarketHistoryWindow(pyglet.window.Window):
             'text': 'Hide All'
         }
         
+        # Retained scene: everything lives in one batch and is only rebuilt when its inputs change
+        self.batch = pyglet.graphics.Batch()
+        self.background_group = pyglet.graphics.Group(order=0)
+        self.grid_group = pyglet.graphics.Group(order=1)
+        self.chart_group = ChartGroup(self, self.chart_area, order=2)
+        self.button_group = pyglet.graphics.Group(order=3)
+        self.text_group = pyglet.graphics.Group(order=4)
+        self.axis_items = []  # Grid lines, axes and their labels for the current data range
+        self._axis_range = None
+        self.series = {}  # crop -> PriceSeries
+        self.series_groups = {}  # crop -> Group, hidden when the crop is toggled off
+        self._data_day = None  # Market day the cached data and series reflect
+        self._range_dirty = True  # Visible crops or data changed since the chart range was computed
+        self._build_static_scene()
+        
         # Create title label
         self.title_label = pyglet.text.Label(
             'Market Price History',
@@ -49,43 +196,22 @@ class MarketHistoryWindow(pyglet.window.Window):
             y=self.height - 30,
             anchor_x='center',
             anchor_y='center',
-            color=self.text_color + (255,)
+            color=self.text_color + (255,),
+            batch=self.batch, group=self.text_group
         )
         
         # Create legend labels
         self.legend_labels = {}
         self._create_legend()
         
-        # Update timer - only refresh data every 30 seconds
-        self.last_update_time = 0
-        self.update_interval = 30.0  # 30 seconds
-        self.cached_data = {}  # Cache the filtered history data
-        self._update_cached_data()  # Initial data load
+        # Filtered history data, refreshed when the market day advances
+        self.cached_data = {}
+        self._sync_with_market()  # Initial data load
     
     def _get_filtered_history(self, crop):
-        """Get the last 14 days of price history for a crop"""
-        history = self.market.get_price_history(crop)
-        if not history:
-            return []
-        
-        # Get the current day from the market
-        current_day = self.market.current_day
-        
-        # Filter to only include the last 14 days
-        # Handle day cycling (days cycle from -61 to 180, then back to -61)
-        filtered_history = []
-        for day, price in history:
-            days_ago = current_day - day
-            if days_ago < 0:  # Handle day cycling (current day < history day)
-                # Days cycle from 180 back to -61, so adjust calculation
-                days_ago += (180 - (-61) + 1)  # Total cycle length is 242 days
-            
-            if days_ago <= 14:  # Include last 14 days
-                filtered_history.append((day, price))
-        
-        # Sort by day to ensure proper order
-        filtered_history.sort(key=lambda x: x[0])
-        return filtered_history
+        """Get (days, prices) views of the last 14 days of price history for a crop"""
+        # The market records one entry per day, so the last 14 days are the last 15 entries
+        return self.market.get_history_view(crop, 15)
     
     def _generate_crop_colors(self):
         """Generate distinct colors for each crop"""
@@ -105,16 +231,54 @@ class MarketHistoryWindow(pyglet.window.Window):
     
     def _update_cached_data(self):
         """Update cached data for all crops"""
-        import time
-        self.last_update_time = time.time()
         self.cached_data = {}
         for crop in self.crop_colors.keys():
             self.cached_data[crop] = self._get_filtered_history(crop)
     
-    def _should_update_data(self):
-        """Check if data should be updated based on timer"""
-        import time
-        return (time.time() - self.last_update_time) >= self.update_interval
+    def _sync_with_market(self):
+        """Bring the cached data and price series up to date after the market day advanced"""
+        if self._data_day == self.market.current_day:
+            return
+        wrapped = self._data_day is not None and self.market.current_day < self._data_day  # Day counter cycled back
+        self._data_day = self.market.current_day
+        self._update_cached_data()
+        self._range_dirty = True
+        
+        for crop_order, (crop, color) in enumerate(self.crop_colors.items()):
+            days, prices = self.cached_data[crop]
+            series = self.series.get(crop)
+            if series is None:
+                # Groups with the same class, order and parent are merged by the batch, so each crop needs its own order
+                group = pyglet.graphics.Group(order=crop_order, parent=self.chart_group)
+                group.visible = crop in self.visible_crops
+                self.series_groups[crop] = group
+                self.series[crop] = PriceSeries(days, prices, color, self.batch, group)
+                continue
+            
+            # Only days after the last uploaded one are new; normally that is a single point
+            new_points = np.flatnonzero(days > series.last_day) if series.last_day is not None else np.arange(len(days))
+            if wrapped or series.point_count + len(new_points) > 4 * 15:
+                # Old points are clipped off the chart; start over once they pile up or the days cycle
+                series.rebuild(days, prices)
+            else:
+                for i in new_points:
+                    series.append(int(days[i]), int(prices[i]))
+    
+    def _sync_forecast(self):
+        """Replace the forecast bands when a newer forecast has finished computing"""
+        if self.forecaster is None:
+            return
+        version = self.forecaster.poll()
+        if version == self._forecast_version or self.forecaster.latest is None:
+            return
+        self._forecast_version = version
+        for band in self.forecast_bands.values():
+            band.delete()
+        self.forecast_bands = {
+            crop: ForecastBand(self.forecaster.latest, crop, color, self.batch, self.series_groups[crop])
+            for crop, color in self.crop_colors.items() if crop in self.series_groups
+        }
+        self._range_dirty = True
     
     def _create_legend(self):
         """Create legend labels for crops"""
@@ -123,6 +287,8 @@ class MarketHistoryWindow(pyglet.window.Window):
         legend_y = self.height - 120
         
         # Clear previous legend labels
+        for label in self.legend_labels.values():
+            label.delete()
         self.legend_labels.clear()
         
         for i, crop in enumerate(crops):
@@ -142,20 +308,24 @@ class MarketHistoryWindow(pyglet.window.Window):
                 y=legend_y - y_offset,
                 anchor_x='left',
                 anchor_y='center',
-                color=color + (255,) if crop in self.visible_crops else (100, 100, 100, 255)
+                color=color + (255,) if crop in self.visible_crops else (100, 100, 100, 255),
+                batch=self.batch, group=self.text_group
             )
     
     def _get_price_range(self):
-        """Get the min and max prices across all visible crops (last 14 days)"""
+        """Get the min and max prices across all visible crops (last 14 days and their forecasts)"""
         min_price = float('inf')
         max_price = 0
         
         for crop in self.visible_crops:
-            history = self.cached_data.get(crop, [])
-            if history:
-                prices = [price for day, price in history]
-                min_price = min(min_price, min(prices))
-                max_price = max(max_price, max(prices))
+            days, prices = self.cached_data.get(crop, EMPTY_HISTORY)
+            if len(prices):
+                min_price = min(min_price, int(prices.min()))
+                max_price = max(max_price, int(prices.max()))
+            band = self.forecast_bands.get(crop)
+            if band is not None:
+                min_price = min(min_price, band.low)
+                max_price = max(max_price, band.high)
         
         if min_price == float('inf'):
             return 0, 100
@@ -165,46 +335,49 @@ class MarketHistoryWindow(pyglet.window.Window):
         return max(0, min_price - padding), max_price + padding
     
     def _get_day_range(self):
-        """Get the min and max days across all crops (last 14 days)"""
+        """Get the min and max days across all crops (last 14 days and the forecast horizon)"""
         min_day = float('inf')
         max_day = 0
         
         for crop in self.visible_crops:
-            history = self._get_filtered_history(crop)
-            if history:
-                days = [day for day, price in history]
-                min_day = min(min_day, min(days))
-                max_day = max(max_day, max(days))
+            days, prices = self.cached_data.get(crop, EMPTY_HISTORY)
+            if len(days):
+                min_day = min(min_day, int(days.min()))
+                max_day = max(max_day, int(days.max()))
+            band = self.forecast_bands.get(crop)
+            if band is not None:
+                max_day = max(max_day, band.last_day)
         
         if min_day == float('inf'):
             return 1, 30
         
         return min_day, max_day
     
-    def _draw_grid_and_axes(self):
-        """Draw grid lines and axes"""
-        min_price, max_price = self._get_price_range()
-        min_day, max_day = self._get_day_range()
+    def _build_grid_and_axes(self, min_price, max_price, min_day, max_day):
+        """Create grid lines, axes and their labels for a data range"""
+        for item in self.axis_items:
+            item.delete()
+        self.axis_items = []
         
         chart_width = self.chart_area['right'] - self.chart_area['left']
         chart_height = self.chart_area['top'] - self.chart_area['bottom']
         
-        # Draw horizontal grid lines (price levels)
+        # Horizontal grid lines (price levels)
         price_steps = 5
         for i in range(price_steps + 1):
             price = min_price + (max_price - min_price) * i / price_steps
             y = self.chart_area['bottom'] + chart_height * i / price_steps
             
             # Grid line
-            line = shapes.Line(
+            self.axis_items.append(shapes.Line(
                 self.chart_area['left'], y,
                 self.chart_area['right'], y,
-                color=self.grid_color
-            )
-            line.draw()
+                color=self.grid_color,
+                batch=self.batch, group=self.grid_group
+            ))
             
             # Price label
-            label = pyglet.text.Label(
+            self.axis_items.append(pyglet.text.Label(
                 f"${int(price)}",
                 font_name='Arial',
                 font_size=9,
@@ -212,11 +385,11 @@ class MarketHistoryWindow(pyglet.window.Window):
                 y=y,
                 anchor_x='right',
                 anchor_y='center',
-                color=self.axis_color + (255,)
-            )
-            label.draw()
+                color=self.axis_color + (255,),
+                batch=self.batch, group=self.text_group
+            ))
         
-        # Draw vertical grid lines (days)
+        # Vertical grid lines (days)
         day_range = max_day - min_day
         if day_range > 0:
             day_steps = min(10, day_range)  # Limit to 10 vertical lines
@@ -225,15 +398,15 @@ class MarketHistoryWindow(pyglet.window.Window):
                 x = self.chart_area['left'] + chart_width * i / day_steps
                 
                 # Grid line
-                line = shapes.Line(
+                self.axis_items.append(shapes.Line(
                     x, self.chart_area['bottom'],
                     x, self.chart_area['top'],
-                    color=self.grid_color
-                )
-                line.draw()
+                    color=self.grid_color,
+                    batch=self.batch, group=self.grid_group
+                ))
                 
                 # Day label
-                label = pyglet.text.Label(
+                self.axis_items.append(pyglet.text.Label(
                     f"Day {int(day)}",
                     font_name='Arial',
                     font_size=9,
@@ -241,69 +414,44 @@ class MarketHistoryWindow(pyglet.window.Window):
                     y=self.chart_area['bottom'] - 15,
                     anchor_x='center',
                     anchor_y='center',
-                    color=self.axis_color + (255,)
-                )
-                label.draw()
+                    color=self.axis_color + (255,),
+                    batch=self.batch, group=self.text_group
+                ))
         
-        # Draw axes
         # Y-axis
-        y_axis = shapes.Line(
+        self.axis_items.append(shapes.Line(
             self.chart_area['left'], self.chart_area['bottom'],
             self.chart_area['left'], self.chart_area['top'],
-            color=self.axis_color
-        )
-        y_axis.draw()
+            color=self.axis_color,
+            batch=self.batch, group=self.grid_group
+        ))
         
         # X-axis
-        x_axis = shapes.Line(
+        self.axis_items.append(shapes.Line(
             self.chart_area['left'], self.chart_area['bottom'],
             self.chart_area['right'], self.chart_area['bottom'],
-            color=self.axis_color
-        )
-        x_axis.draw()
+            color=self.axis_color,
+            batch=self.batch, group=self.grid_group
+        ))
     
-    def _draw_price_lines(self):
-        """Draw price history lines for visible crops"""
+    def _update_chart_range(self):
+        """Rescale the price lines and rebuild the axes if the visible data range changed"""
+        if not self._range_dirty:
+            return
+        self._range_dirty = False
+        
         min_price, max_price = self._get_price_range()
         min_day, max_day = self._get_day_range()
         
-        if max_price == min_price or max_day == min_day:
-            return
-        
-        chart_width = self.chart_area['right'] - self.chart_area['left']
-        chart_height = self.chart_area['top'] - self.chart_area['bottom']
+        axis_range = (min_price, max_price, min_day, max_day)
+        if axis_range != self._axis_range:
+            self._axis_range = axis_range
+            self._build_grid_and_axes(*axis_range)
         
-        for crop in self.visible_crops:
-            history = self.cached_data.get(crop, [])
-            if len(history) < 2:
-                continue
-            
-            color = self.crop_colors[crop]
-            
-            # Draw line segments between consecutive points
-            for i in range(len(history) - 1):
-                day1, price1 = history[i]
-                day2, price2 = history[i + 1]
-                
-                # Convert to screen coordinates
-                x1 = self.chart_area['left'] + chart_width * (day1 - min_day) / (max_day - min_day)
-                y1 = self.chart_area['bottom'] + chart_height * (price1 - min_price) / (max_price - min_price)
-                x2 = self.chart_area['left'] + chart_width * (day2 - min_day) / (max_day - min_day)
-                y2 = self.chart_area['bottom'] + chart_height * (price2 - min_price) / (max_price - min_price)
-                
-                # Draw line segment
-                line = shapes.Line(x1, y1, x2, y2, color=color)
-                line.draw()
-            
-            # Draw data points
-            for day, price in history:
-                # Convert to screen coordinates
-                x = self.chart_area['left'] + chart_width * (day - min_day) / (max_day - min_day)
-                y = self.chart_area['bottom'] + chart_height * (price - min_price) / (max_price - min_price)
-                
-                # Draw point
-                point = shapes.Circle(x, y, 3, color=color)
-                point.draw()
+        # Price lines need a non-empty range to be placed on the chart
+        self.chart_group.visible = max_price != min_price and max_day != min_day
+        if self.chart_group.visible:
+            self.chart_group.set_data_range(min_day, max_day, min_price, max_price)
     
     def toggle_crop_visibility(self, crop_name):
         """Toggle the visibility of a crop in the chart"""
@@ -311,61 +459,50 @@ class MarketHistoryWindow(pyglet.window.Window):
             self.visible_crops.remove(crop_name)
         else:
             self.visible_crops.add(crop_name)
+        self._update_series_visibility()
         
         # Update legend colors
         self._create_legend()
     
-    def on_draw(self):
-        """Render the market history window"""
-        # Check if we should update data (every 30 seconds)
-        if self._should_update_data():
-            self._update_cached_data()
-        
-        self.clear()
-        
-        # Draw background
-        background = shapes.Rectangle(0, 0, self.width, self.height, color=self.bg_color)
-        background.draw()
-        
-        # Draw title
-        self.title_label.draw()
+    def _update_series_visibility(self):
+        """Show or hide each crop's price line without touching its geometry"""
+        for crop, group in self.series_groups.items():
+            group.visible = crop in self.visible_crops
+        self._range_dirty = True
+    
+    def _build_static_scene(self):
+        """Create the background, toggle button, day info, legend title and instructions"""
+        self.background = shapes.Rectangle(0, 0, self.width, self.height, color=self.bg_color,
+                                           batch=self.batch, group=self.background_group)
         
-        # Draw current day info
-        current_day = self.market.get_current_day()
-        day_of_week = self.market.get_day_of_week()
-        day_info = pyglet.text.Label(
-            f"Current: Day {current_day} ({day_of_week})",
+        self.day_info_label = pyglet.text.Label(
+            "",
             font_name='Arial',
             font_size=12,
             x=self.width // 2,
             y=self.height - 55,
             anchor_x='center',
             anchor_y='center',
-            color=(200, 200, 200, 255)
+            color=(200, 200, 200, 255),
+            batch=self.batch, group=self.text_group
         )
-        day_info.draw()
         
-        # Draw toggle all button
+        # Toggle all button, with a slightly larger rectangle behind it as border
         btn = self.toggle_button
-        button_rect = shapes.Rectangle(
-            btn['x'], btn['y'] - btn['height']//2,
-            btn['width'], btn['height'],
-            color=(70, 70, 70)
-        )
-        button_rect.draw()
-        
-        # Draw button border
-        border_color = (150, 150, 150)
         border_thickness = 1
-        # Create a slightly larger rectangle as border
-        button_border = shapes.Rectangle(
+        self.button_border = shapes.Rectangle(
             btn['x'] - border_thickness, btn['y'] - btn['height']//2 - border_thickness,
             btn['width'] + 2*border_thickness, btn['height'] + 2*border_thickness,
-            color=border_color
+            color=(150, 150, 150),
+            batch=self.batch, group=self.grid_group
         )
-        button_border.draw()
-        
-        button_text = pyglet.text.Label(
+        self.button_rect = shapes.Rectangle(
+            btn['x'], btn['y'] - btn['height']//2,
+            btn['width'], btn['height'],
+            color=(70, 70, 70),
+            batch=self.batch, group=self.button_group
+        )
+        self.button_label = pyglet.text.Label(
             btn['text'],
             font_name='Arial',
             font_size=10,
@@ -373,16 +510,11 @@ class MarketHistoryWindow(pyglet.window.Window):
             y=btn['y'],
             anchor_x='center',
             anchor_y='center',
-            color=(255, 255, 255, 255)
+            color=(255, 255, 255, 255),
+            batch=self.batch, group=self.text_group
         )
-        button_text.draw()
         
-        # Draw chart
-        self._draw_grid_and_axes()
-        self._draw_price_lines()
-        
-        # Draw legend
-        legend_title = pyglet.text.Label(
+        self.legend_title = pyglet.text.Label(
             "Crops (click to toggle):",
             font_name='Arial',
             font_size=12,
@@ -390,15 +522,11 @@ class MarketHistoryWindow(pyglet.window.Window):
             y=self.height - 100,
             anchor_x='left',
             anchor_y='center',
-            color=self.text_color + (255,)
+            color=self.text_color + (255,),
+            batch=self.batch, group=self.text_group
         )
-        legend_title.draw()
-        
-        for label in self.legend_labels.values():
-            label.draw()
         
-        # Draw instructions
-        instructions = pyglet.text.Label(
+        self.instructions = pyglet.text.Label(
             "Click on crop names to show/hide them in the chart",
             font_name='Arial',
             font_size=10,
@@ -406,9 +534,23 @@ class MarketHistoryWindow(pyglet.window.Window):
             y=20,
             anchor_x='left',
             anchor_y='center',
-            color=(150, 150, 150, 255)
+            color=(150, 150, 150, 255),
+            batch=self.batch, group=self.text_group
         )
-        instructions.draw()
+    
+    def on_draw(self):
+        """Render the market history window"""
+        # New market days append to the price series; nothing else is rebuilt per frame
+        self._sync_with_market()
+        self._sync_forecast()
+        self._update_chart_range()
+        
+        day_info = f"Current: Day {self.market.get_current_day()} ({self.market.get_day_of_week()})"
+        if self.day_info_label.text != day_info:
+            self.day_info_label.text = day_info
+        
+        self.clear()
+        self.batch.draw()
     
     def on_mouse_press(self, x, y, button, modifiers):
         """Handle mouse clicks for toggling crop visibility"""
@@ -448,6 +590,8 @@ class MarketHistoryWindow(pyglet.window.Window):
         else:
             self.visible_crops = set(self.crop_colors.keys())
             self.toggle_button['text'] = 'Hide All'
+        self.button_label.text = self.toggle_button['text']
+        self._update_series_visibility()
         self._create_legend()
     
     def on_key_press(self, symbol, modifiers):
@@ -16,6 +16,9 @@ class MarketWindow(pyglet.window.Window):
         self.last_prices = {}
         self.price_flash_timers = {}  # For flashing effect on price changes
         self.seed_labels = {}  # For seed price labels
+        # Price forecasts come from the game's simulation; a standalone window shows none
+        self.forecaster = game_window.forecaster if game_window is not None else None
+        self._forecast_version = None
         
         # Colors
         self.bg_color = (40, 40, 40)  # Dark gray background
@@ -146,19 +149,32 @@ class MarketWindow(pyglet.window.Window):
                 color=(150, 255, 150, 255)  # Light green for seed prices
             )
             
+            # Forecast label (10th-90th percentile price at the end of the forecast horizon)
+            forecast_label = pyglet.text.Label(
+                '--',
+                font_name='Arial',
+                font_size=10,
+                x=390,
+                y=y_pos,
+                anchor_x='left',
+                anchor_y='center',
+                color=(150, 200, 255, 255)  # Light blue for forecasts
+            )
+            
             self.labels[crop_name] = {
                 'name': name_label,
                 'price': price_label,
                 'change': change_label,
                 'trend': trend_label,
-                'seed_price': seed_price_label
+                'seed_price': seed_price_label,
+                'forecast': forecast_label
             }
             
             # Store previous price for change tracking (from price history if available)
-            history = self.market.price_history.get(crop_name, [])
+            _, history = self.market.get_history_view(crop_name, 2)
             if len(history) >= 2:
                 # Use the second-to-last price as the "last" price
-                self.last_prices[crop_name] = history[-2][1]
+                self.last_prices[crop_name] = int(history[0])
             else:
                 # Fallback to current price if no history
                 self.last_prices[crop_name] = price
@@ -228,6 +244,20 @@ class MarketWindow(pyglet.window.Window):
                     self.labels[crop_name]['price'].color = self.text_color + (255,)
             else:
                 self.labels[crop_name]['price'].color = self.text_color + (255,)
+        
+        self._update_forecast_labels()
+    
+    def _update_forecast_labels(self):
+        """Show the latest price forecast once one has finished computing"""
+        if self.forecaster is None:
+            return
+        version = self.forecaster.poll()
+        if version == self._forecast_version or self.forecaster.latest is None:
+            return
+        self._forecast_version = version
+        for crop_name, crop_labels in self.labels.items():
+            forecast = self.forecaster.latest.get_range(crop_name)
+            crop_labels['forecast'].text = f'${forecast[0]}-${forecast[2]}' if forecast else '--'
     
     def on_draw(self):
         """Render the market window"""
@@ -276,6 +306,9 @@ class MarketWindow(pyglet.window.Window):
             pyglet.text.Label('Trend', font_name='Arial', font_size=10, x=260, y=self.height - 85, 
                             anchor_x='center', anchor_y='center', color=(150, 150, 150, 255)),
             pyglet.text.Label('Seed Price', font_name='Arial', font_size=10, x=320, y=self.height - 85, 
+                            anchor_x='left', anchor_y='center', color=(150, 150, 150, 255)),
+            pyglet.text.Label(f'{self.forecaster.days}-Day Range' if self.forecaster else 'Forecast', font_name='Arial',
+                            font_size=10, x=390, y=self.height - 85,
                             anchor_x='left', anchor_y='center', color=(150, 150, 150, 255))
         ]
         
@@ -289,6 +322,7 @@ class MarketWindow(pyglet.window.Window):
             crop_data['change'].draw()
             crop_data['trend'].draw()
             crop_data['seed_price'].draw()
+            crop_data['forecast'].draw()
     
     def on_close(self):
         """Handle window close event"""
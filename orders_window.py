@@ -34,6 +34,17 @@ class OrdersPopup:
             self.x = (800 - self.width) // 2
             self.y = (600 - self.height) // 2
 
+        # Retained scene: frame objects plus GL objects for the visible order rows only
+        self.batch = pyglet.graphics.Batch()
+        self.overlay_group = pyglet.graphics.Group(order=0)
+        self.panel_group = pyglet.graphics.Group(order=1)
+        self.widget_group = pyglet.graphics.Group(order=2)
+        self.text_group = pyglet.graphics.Group(order=3)
+        self._chrome_items = []
+        self._chrome_size = None
+        self._row_items = []
+        self._rows_key = None
+
     def show(self):
         """Show the orders popup"""
         self.is_open = True
@@ -51,174 +62,112 @@ class OrdersPopup:
         if not self.is_open:
             return
 
-        # Draw semi-transparent background overlay covering entire window
-        if self.game_window:
-            overlay = pyglet.shapes.Rectangle(0, 0, self.game_window.width, self.game_window.height, color=(0, 0, 0, 150))
-        else:
-            # Fallback if no game window reference
-            overlay = pyglet.shapes.Rectangle(0, 0, 800, 600, color=(0, 0, 0, 150))
-        overlay.draw()
-
-        # Draw popup background
-        bg_rect = pyglet.shapes.Rectangle(
-            self.x, self.y, self.width, self.height,
-            color=(40, 40, 40)
-        )
-        bg_rect.draw()
+        # The scene is retained: the frame only rebuilds when the window size changes,
+        # and the rows only when orders, the market day or a scroll offset change
+        window_size = (self.game_window.width, self.game_window.height) if self.game_window else (800, 600)
+        if window_size != self._chrome_size:
+            self._build_chrome(window_size)
+        rows_key = (self.order_system.revision, self._current_day(),
+                    self.incoming_scroll_offset, self.accepted_scroll_offset)
+        if rows_key != self._rows_key:
+            self._rows_key = rows_key
+            self._build_orders_content()
+
+        self.batch.draw()
+
+    def _current_day(self):
+        return self.game_window.market.current_day if self.game_window and hasattr(self.game_window, 'market') else 0
+
+    @staticmethod
+    def _delete_items(items):
+        for item in items:
+            item.delete()
+        items.clear()
+
+    def _add_rect(self, items, x, y, width, height, color, group):
+        items.append(pyglet.shapes.Rectangle(x, y, width, height, color=color, batch=self.batch, group=group))
+
+    def _add_label(self, items, text, font_size, x, y, color, centered=False):
+        anchors = {'anchor_x': 'center', 'anchor_y': 'center'} if centered else {}
+        items.append(pyglet.text.Label(
+            text, font_size=font_size, x=x, y=y, color=color,
+            batch=self.batch, group=self.text_group, **anchors
+        ))
+
+    def _build_chrome(self, window_size):
+        """Create the overlay, frame, headers and scroll buttons"""
+        self._delete_items(self._chrome_items)
+        self._chrome_size = window_size
+        items = self._chrome_items
+        white = (255, 255, 255, 255)
+
+        # Semi-transparent background overlay covering entire window
+        self._add_rect(items, 0, 0, window_size[0], window_size[1], (0, 0, 0, 150), self.overlay_group)
+
+        # Popup background
+        self._add_rect(items, self.x, self.y, self.width, self.height, (40, 40, 40), self.panel_group)
 
         # Header background
-        header_rect = pyglet.shapes.Rectangle(
-            self.x, self.y + self.height - 40, self.width, 40,
-            color=(60, 60, 60)
-        )
-        header_rect.draw()
-
-        # Draw close button
-        close_btn = pyglet.shapes.Rectangle(
-            self.x + self.width - 30, self.y + self.height - 30,
-            20, 20, color=(200, 50, 50)
-        )
-        close_btn.draw()
-        pyglet.text.Label(
-            'X', font_size=12,
-            x=self.x + self.width - 20, y=self.y + self.height - 20,
-            anchor_x='center', anchor_y='center',
-            color=(255, 255, 255, 255)
-        ).draw()
-
-        # Draw title
-        pyglet.text.Label(
-            'Crop Orders', font_size=18,
-            x=self.x + self.width // 2, y=self.y + self.height - 25,
-            anchor_x='center', anchor_y='center',
-            color=(255, 255, 255, 255)
-        ).draw()
-
-        # Draw section headers
-        pyglet.text.Label(
-            'Incoming Orders', font_size=14,
-            x=self.x + 20, y=self.y + self.height - 70,
-            color=(255, 255, 0, 255)
-        ).draw()
-
-        pyglet.text.Label(
-            'Accepted Orders', font_size=14,
-            x=self.x + self.width // 2 + 20, y=self.y + self.height - 70,
-            color=(0, 255, 0, 255)
-        ).draw()
-
-        # Draw scroll buttons
-        # Incoming orders scroll buttons (right of incoming section)
-        incoming_up_btn = pyglet.shapes.Rectangle(
-            self.x + 325, self.y + self.height - 85, 20, 15, color=(100, 100, 100)
-        )
-        incoming_up_btn.draw()
-        pyglet.text.Label(
-            '↑', font_size=10,
-            x=self.x + 335, y=self.y + self.height - 80,
-            anchor_x='center', anchor_y='center',
-            color=(255, 255, 255, 255)
-        ).draw()
-
-        incoming_down_btn = pyglet.shapes.Rectangle(
-            self.x + 325, self.y + 30, 20, 15, color=(100, 100, 100)
-        )
-        incoming_down_btn.draw()
-        pyglet.text.Label(
-            '↓', font_size=10,
-            x=self.x + 335, y=self.y + 35,
-            anchor_x='center', anchor_y='center',
-            color=(255, 255, 255, 255)
-        ).draw()
-
-        # Accepted orders scroll buttons (right of accepted section)
-        accepted_up_btn = pyglet.shapes.Rectangle(
-            self.x + self.width // 2 + 345, self.y + self.height - 85, 20, 15, color=(100, 100, 100)
-        )
-        accepted_up_btn.draw()
-        pyglet.text.Label(
-            '↑', font_size=10,
-            x=self.x + self.width // 2 + 355, y=self.y + self.height - 80,
-            anchor_x='center', anchor_y='center',
-            color=(255, 255, 255, 255)
-        ).draw()
-
-        accepted_down_btn = pyglet.shapes.Rectangle(
-            self.x + self.width // 2 + 345, self.y + 30, 20, 15, color=(100, 100, 100)
-        )
-        accepted_down_btn.draw()
-        pyglet.text.Label(
-            '↓', font_size=10,
-            x=self.x + self.width // 2 + 355, y=self.y + 35,
-            anchor_x='center', anchor_y='center',
-            color=(255, 255, 255, 255)
-        ).draw()
-
-        # Draw orders content
-        self.draw_orders_content()
-
-    def draw_orders_content(self):
-        """Draw the orders list with scrolling"""
-        y_offset = self.y + self.height - 100
+        self._add_rect(items, self.x, self.y + self.height - 40, self.width, 40, (60, 60, 60), self.widget_group)
 
-        # Draw incoming orders (left side)
-        incoming_orders = self.order_system.get_incoming_orders()
-        start_idx = self.incoming_scroll_offset
-        end_idx = min(start_idx + self.max_visible_incoming, len(incoming_orders))
+        # Close button
+        self._add_rect(items, self.x + self.width - 30, self.y + self.height - 30, 20, 20, (200, 50, 50), self.widget_group)
+        self._add_label(items, 'X', 12, self.x + self.width - 20, self.y + self.height - 20, white, centered=True)
 
-        for i in range(start_idx, end_idx):
-            display_idx = i - start_idx
-            order_y = y_offset - display_idx * 65  # Increased spacing to 65 pixels for more space
-            self.draw_order(incoming_orders[i], self.x + 20, order_y, is_incoming=True)
-            
-            # Draw separator line between orders (not after the last one)
-            if i < end_idx - 1:
-                separator_y = order_y - 45  # Position line 9 pixels below the order (more padding)
-                separator_rect = pyglet.shapes.Rectangle(
-                    self.x + 20, separator_y - 1,  # Center the 2px line
-                    self.width // 2 - 40, 2,  # Width: from x+20 to x+width//2-20, 2px height
-                    color=(120, 120, 120)  # Slightly brighter gray
-                )
-                separator_rect.draw()
-
-        # Draw accepted orders (right side)
-        accepted_orders = self.order_system.get_accepted_orders()
-        start_idx = self.accepted_scroll_offset
-        end_idx = min(start_idx + self.max_visible_accepted, len(accepted_orders))
+        # Title
+        self._add_label(items, 'Crop Orders', 18, self.x + self.width // 2, self.y + self.height - 25, white, centered=True)
 
-        for i in range(start_idx, end_idx):
-            display_idx = i - start_idx
-            order_y = y_offset - display_idx * 65  # Increased spacing to 65 pixels for more space
-            self.draw_order(accepted_orders[i], self.x + self.width // 2 + 20, order_y, is_incoming=False)
-            
-            # Draw separator line between orders (not after the last one)
-            if i < end_idx - 1:
-                separator_y = order_y - 45  # Position line 9 pixels below the order (more padding)
-                separator_rect = pyglet.shapes.Rectangle(
-                    self.x + self.width // 2 + 20, separator_y - 1,  # Center the 2px line
-                    self.width // 2 - 40, 2,  # Width: from x+width//2+20 to x+width-20, 2px height
-                    color=(120, 120, 120)  # Slightly brighter gray
-                )
-                separator_rect.draw()
-                separator_rect.draw()
-
-    def draw_order(self, order, x, y, is_incoming=True):
-        """Draw a single order"""
+        # Section headers
+        self._add_label(items, 'Incoming Orders', 14, self.x + 20, self.y + self.height - 70, (255, 255, 0, 255))
+        self._add_label(items, 'Accepted Orders', 14, self.x + self.width // 2 + 20, self.y + self.height - 70, (0, 255, 0, 255))
+
+        # Scroll buttons: incoming (right of incoming section), then accepted (right of accepted section)
+        for button_x in (self.x + 325, self.x + self.width // 2 + 345):
+            self._add_rect(items, button_x, self.y + self.height - 85, 20, 15, (100, 100, 100), self.widget_group)
+            self._add_label(items, '↑', 10, button_x + 10, self.y + self.height - 80, white, centered=True)
+            self._add_rect(items, button_x, self.y + 30, 20, 15, (100, 100, 100), self.widget_group)
+            self._add_label(items, '↓', 10, button_x + 10, self.y + 35, white, centered=True)
+
+    def _build_orders_content(self):
+        """Create GL objects for the visible orders only; scrolled-out orders hold none"""
+        self._delete_items(self._row_items)
+        y_offset = self.y + self.height - 100
+
+        for orders, scroll_offset, max_visible, list_x, is_incoming in (
+                (self.order_system.get_incoming_orders(), self.incoming_scroll_offset,
+                 self.max_visible_incoming, self.x + 20, True),
+                (self.order_system.get_accepted_orders(), self.accepted_scroll_offset,
+                 self.max_visible_accepted, self.x + self.width // 2 + 20, False)):
+            start_idx = scroll_offset
+            end_idx = min(start_idx + max_visible, len(orders))
+
+            for i in range(start_idx, end_idx):
+                display_idx = i - start_idx
+                order_y = y_offset - display_idx * 65  # Increased spacing to 65 pixels for more space
+                self._build_order(orders[i], list_x, order_y, is_incoming)
+
+                # Separator line between orders (not after the last one)
+                if i < end_idx - 1:
+                    separator_y = order_y - 45  # Position line 9 pixels below the order (more padding)
+                    self._add_rect(self._row_items, list_x, separator_y - 1,  # Center the 2px line
+                                   self.width // 2 - 40, 2,  # Spans the list column, 2px height
+                                   (120, 120, 120), self.widget_group)  # Slightly brighter gray
+
+    def _build_order(self, order, x, y, is_incoming=True):
+        """Create the labels and buttons of a single order"""
+        items = self._row_items
+        white = (255, 255, 255, 255)
 
         # Order text
         crop_text = f"{order.crop_name}: {order.get_remaining_quantity()}/{order.quantity}"
         price_text = f"${order.premium_price:.2f}/unit"
-        
+
         # Time info - show age and due date for both incoming and accepted orders
-        current_day = self.game_window.market.current_day if self.game_window and hasattr(self.game_window, 'market') else 0
-        age_days = int(order.get_age_days(current_day))
-        age_text = f"Age: {age_days} days"
-        due_day = order.created_day + order.duration_days
-        due_text = f"Due: Day {due_day}"
-        time_text = None  # No separate time text needed
+        current_day = self._current_day()
+        age_text = f"Age: {int(order.get_age_days(current_day))} days"
+        due_text = f"Due: Day {order.created_day + order.duration_days}"
 
         # Color based on status
-        current_day = self.game_window.market.current_day if self.game_window and hasattr(self.game_window, 'market') else 0
         if order.is_expired(current_day):
             color = self.warning_color
         elif is_incoming:
@@ -226,84 +175,24 @@ class OrdersPopup:
         else:
             color = self.accent_color  # Green for accepted
 
-        # Draw order info
-        pyglet.text.Label(
-            crop_text, font_size=10,
-            x=x, y=y,
-            color=color
-        ).draw()
-
-        pyglet.text.Label(
-            price_text, font_size=10,
-            x=x, y=y - 12,
-            color=color
-        ).draw()
-
-        # Draw age on separate line for all orders
-        if age_text:
-            pyglet.text.Label(
-                age_text, font_size=9,
-                x=x, y=y - 24,
-                color=color
-            ).draw()
-
-        # Draw due date on separate line for all orders
-        if due_text:
-            pyglet.text.Label(
-                due_text, font_size=9,
-                x=x, y=y - 36,
-                color=color
-            ).draw()
-
-        # Draw accept/reject buttons for incoming orders
+        # Order info, with age and due date on separate lines
+        self._add_label(items, crop_text, 10, x, y, color)
+        self._add_label(items, price_text, 10, x, y - 12, color)
+        self._add_label(items, age_text, 9, x, y - 24, color)
+        self._add_label(items, due_text, 9, x, y - 36, color)
+
         if is_incoming:
-            # Accept button (green)
-            accept_btn = pyglet.shapes.Rectangle(
-                x + 200, y - 5, 40, 20, color=(50, 150, 50)
-            )
-            accept_btn.draw()
-            pyglet.text.Label(
-                'Accept', font_size=8,
-                x=x + 220, y=y + 5,
-                anchor_x='center', anchor_y='center',
-                color=(255, 255, 255, 255)
-            ).draw()
-
-            # Reject button (red)
-            reject_btn = pyglet.shapes.Rectangle(
-                x + 250, y - 5, 40, 20, color=(150, 50, 50)
-            )
-            reject_btn.draw()
-            pyglet.text.Label(
-                'Reject', font_size=8,
-                x=x + 270, y=y + 5,
-                anchor_x='center', anchor_y='center',
-                color=(255, 255, 255, 255)
-            ).draw()
+            # Accept button (green) and reject button (red)
+            self._add_rect(items, x + 200, y - 5, 40, 20, (50, 150, 50), self.widget_group)
+            self._add_label(items, 'Accept', 8, x + 220, y + 5, white, centered=True)
+            self._add_rect(items, x + 250, y - 5, 40, 20, (150, 50, 50), self.widget_group)
+            self._add_label(items, 'Reject', 8, x + 270, y + 5, white, centered=True)
         else:
-            # Complete button for accepted orders (blue)
-            complete_btn = pyglet.shapes.Rectangle(
-                x + 200, y - 5, 50, 20, color=(50, 100, 200)
-            )
-            complete_btn.draw()
-            pyglet.text.Label(
-                'Complete', font_size=8,
-                x=x + 225, y=y + 5,
-                anchor_x='center', anchor_y='center',
-                color=(255, 255, 255, 255)
-            ).draw()
-
-            # Cancel button for accepted orders (red)
-            cancel_btn = pyglet.shapes.Rectangle(
-                x + 260, y - 5, 45, 20, color=(150, 50, 50)
-            )
-            cancel_btn.draw()
-            pyglet.text.Label(
-                'Cancel', font_size=8,
-                x=x + 282, y=y + 5,
-                anchor_x='center', anchor_y='center',
-                color=(255, 255, 255, 255)
-            ).draw()
+            # Complete button (blue) and cancel button (red) for accepted orders
+            self._add_rect(items, x + 200, y - 5, 50, 20, (50, 100, 200), self.widget_group)
+            self._add_label(items, 'Complete', 8, x + 225, y + 5, white, centered=True)
+            self._add_rect(items, x + 260, y - 5, 45, 20, (150, 50, 50), self.widget_group)
+            self._add_label(items, 'Cancel', 8, x + 282, y + 5, white, centered=True)
 
     def handle_mouse_press(self, x, y, button, modifiers):
         """Handle mouse clicks in the popup (called from main window)"""
@@ -1,21 +1,60 @@
+import numpy as np
 import pyglet
-from pyglet import shapes
+from pyglet.gl import GL_BLEND, GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA, GL_TRIANGLES, glBlendFunc, glDisable, glEnable
+from simulation.catalog import CROP_IDS, CROP_NUTRIENT_DOUBLE
+from tile_chunks import TileChunks
 from constants import (
     OVERLAY_NONE, OVERLAY_WEEDS, OVERLAY_WATER, OVERLAY_NITROGEN, 
     OVERLAY_PHOSPHORUS, OVERLAY_POTASSIUM, OVERLAY_CALCIUM, 
     OVERLAY_MAGNESIUM, OVERLAY_SULFUR, OVERLAY_SEED_REQUIREMENTS, grid_size, 
-    TILE_OWNED, TILE_TILLED, TILE_PLANTED, TILE_READY_HARVEST, seeds_config
+    TILE_OWNED, TILE_TILLED, TILE_PLANTED, TILE_READY_HARVEST
 )
 
+# Tile states that show overlay colors
+OVERLAY_TILE_STATES = (TILE_OWNED, TILE_TILLED, TILE_PLANTED, TILE_READY_HARVEST)
+
+# Nutrient shown by each single-nutrient overlay
+OVERLAY_NUTRIENTS = {
+    OVERLAY_WATER: 'water',
+    OVERLAY_NITROGEN: 'nitrogen',
+    OVERLAY_PHOSPHORUS: 'phosphorus',
+    OVERLAY_POTASSIUM: 'potassium',
+    OVERLAY_CALCIUM: 'calcium',
+    OVERLAY_MAGNESIUM: 'magnesium',
+    OVERLAY_SULFUR: 'sulfur'
+}
+
+# Corners of the two triangles covering a tile, in tiles
+TILE_CORNERS = np.array([(0, 0), (1, 0), (1, 1), (0, 0), (1, 1), (0, 1)])
+
+
+class OverlayGroup(pyglet.graphics.ShaderGroup):
+    """Draws overlay vertex lists with the default shader, blending their translucent colors over the farm"""
+
+    def __init__(self, order=0):
+        super().__init__(pyglet.graphics.get_default_shader(), order=order)
+
+    def set_state(self):
+        super().set_state()
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+    def unset_state(self):
+        glDisable(GL_BLEND)
+        super().unset_state()
+
 
 class OverlayManager:
     def __init__(self, game_window):
         self.game_window = game_window
         self.current_overlay = OVERLAY_NONE
         self.selected_seed = None  # For seed requirements overlay
-        self.overlay_shapes = []
-        self.overlay_batch = pyglet.graphics.Batch()
-        self.overlay_group = pyglet.graphics.Group(order=2)  # Draw overlays on top
+        self.overlay_chunks = None  # Per-chunk batches so only overlays in view are drawn
+        self.overlay_lists = {}  # {chunk key: vertex list}, built when the chunk first comes into view
+        self.overlay_group = OverlayGroup(order=2)  # Draw overlays on top
+        self._overlay_grid = None  # FarmGrid the chunks were built for
+        self._tile_colors = None  # [row, column, rgba] for the current overlay; hidden tiles are transparent
+        self._seen_revision = 0  # FarmGrid revision the colors reflect
         
     def set_overlay(self, overlay_type):
         """Set the current overlay type and update display"""
@@ -71,34 +110,15 @@ class OverlayManager:
         if not self.selected_seed:
             return 0  # No seed selected
             
-        # Find the seed configuration
-        seed_config = None
-        for seed in seeds_config:
-            if seed['name'] == self.selected_seed:
-                seed_config = seed
-                break
-                
-        if not seed_config:
+        crop_id = CROP_IDS.get(self.selected_seed)
+        if crop_id is None:
             return 0  # Seed not found
-            
-        # Check all nutrient requirements
-        requirements = [
-            ('water', seed_config.get('water_double', 0)),
-            ('nitrogen', seed_config.get('nitrogen_double', 0)),
-            ('phosphorus', seed_config.get('phosphorus_double', 0)),
-            ('potassium', seed_config.get('potassium_double', 0)),
-            ('calcium', seed_config.get('calcium_double', 0)),
-            ('magnesium', seed_config.get('magnesium_double', 0)),
-            ('sulfur', seed_config.get('sulfur_double', 0))
-        ]
-        
-        # Check if all requirements are met
-        for nutrient, required_amount in requirements:
-            current_amount = tile.nutrients.get(nutrient, 0)
-            if current_amount < required_amount:
-                return 0  # Requirements not met (red)
-                
-        return 100  # All requirements met (green)
+
+        # Check all nutrient requirements in one compare
+        soil = tile.grid.nutrients[:, tile.row, tile.col]
+        if np.all(soil >= CROP_NUTRIENT_DOUBLE[crop_id]):
+            return 100  # All requirements met (green)
+        return 0  # Requirements not met (red)
     
     def value_to_color(self, value, overlay_type):
         """Convert a value to a color gradient based on overlay type"""
@@ -135,39 +155,119 @@ class OverlayManager:
                 blue = 0                      # Always 0 for red-green gradient
                 return (red, green, blue, 128)  # With transparency
     
+    def _farm_grid(self):
+        """Get the farm's array storage"""
+        return self.game_window.managers.farm_manager.farm_grid
+
+    def _reset_overlay_chunks(self, farm_grid):
+        """Drop the chunk vertex lists; each chunk is rebuilt from the current colors when next in view"""
+        for vertex_list in self.overlay_lists.values():
+            vertex_list.delete()
+        self.overlay_lists = {}
+        self.overlay_chunks = TileChunks(farm_grid.width, farm_grid.height, self._build_overlay_chunk)
+        self._overlay_grid = farm_grid
+
+    def _build_overlay_chunk(self, key, batch):
+        """Create one vertex list for a chunk, two triangles per tile, in the current overlay colors"""
+        first_col, first_row, end_col, end_row = self.overlay_chunks.tile_range(key)
+        cols, rows = np.meshgrid(np.arange(first_col, end_col), np.arange(first_row, end_row))
+        positions = np.zeros((cols.size, len(TILE_CORNERS), 3), dtype=np.float32)
+        positions[:, :, 0] = (cols.reshape(-1, 1) + TILE_CORNERS[:, 0]) * grid_size
+        positions[:, :, 1] = (rows.reshape(-1, 1) + TILE_CORNERS[:, 1]) * grid_size
+        program = pyglet.graphics.get_default_shader()
+        self.overlay_lists[key] = program.vertex_list(positions.shape[0] * positions.shape[1], GL_TRIANGLES,
+                                                      batch, self.overlay_group,
+                                                      position=('f', positions.ravel().tolist()),
+                                                      colors=('Bn', self._chunk_colors(key)))
+
+    def _chunk_colors(self, key):
+        """Get a chunk's vertex colors from the current tile colors"""
+        first_col, first_row, end_col, end_row = self.overlay_chunks.tile_range(key)
+        colors = self._tile_colors[first_row:end_row, first_col:end_col].reshape(-1, 4)
+        return np.repeat(colors, len(TILE_CORNERS), axis=0).ravel().tolist()
+
+    def _overlay_values(self, farm_grid):
+        """Get the current overlay's value for every tile as a [row, column] array"""
+        if self.current_overlay == OVERLAY_WEEDS:
+            return farm_grid.weeds
+        if self.current_overlay in OVERLAY_NUTRIENTS:
+            return farm_grid.nutrient_layer(OVERLAY_NUTRIENTS[self.current_overlay])
+        if self.current_overlay == OVERLAY_SEED_REQUIREMENTS:
+            crop_id = CROP_IDS.get(self.selected_seed)
+            if crop_id is None:
+                return np.zeros(farm_grid.state.shape)
+            required = CROP_NUTRIENT_DOUBLE[crop_id]
+            met = np.all(farm_grid.nutrients >= required[:, np.newaxis, np.newaxis], axis=0)
+            return np.where(met, 100.0, 0.0)
+        return np.zeros(farm_grid.state.shape)
+
+    def _overlay_colors(self, values):
+        """Vectorized value_to_color: get (red, green) arrays for the current overlay"""
+        ratio = np.clip(values / 100.0, 0.0, 1.0)
+        if self.current_overlay == OVERLAY_WEEDS:
+            # Weeds: green (good) at low values, red (bad) at high values
+            red = (255 * ratio).astype(np.int64)
+            green = (255 * (1 - ratio)).astype(np.int64)
+        else:
+            # Nutrients, water and seed requirements: red (bad) at low values, green (good) at high values
+            red = (255 * (1 - ratio)).astype(np.int64)
+            green = (255 * ratio).astype(np.int64)
+        return red, green
+
+    def _refresh_tiles(self, farm_grid, changed=None):
+        """Recompute colors in one vectorized pass and re-upload the built chunks holding changed tiles
+
+        With no changed mask every built chunk is recolored.
+        """
+        if changed is None:
+            keys = list(self.overlay_lists)
+        else:
+            rows, cols = np.nonzero(changed)
+            if len(rows) == 0:
+                return
+            size = self.overlay_chunks.chunk_size
+            keys = set(zip((cols // size).tolist(), (rows // size).tolist()))
+        red, green = self._overlay_colors(self._overlay_values(farm_grid))
+        colors = np.zeros(farm_grid.state.shape + (4,), dtype=np.uint8)
+        colors[:, :, 0] = red
+        colors[:, :, 1] = green
+        colors[:, :, 3] = np.where(farm_grid.state_mask(OVERLAY_TILE_STATES), 128, 0)
+        self._tile_colors = colors
+        for key in keys:
+            vertex_list = self.overlay_lists.get(key)
+            if vertex_list is not None:
+                vertex_list.colors[:] = self._chunk_colors(key)
+
     def update_overlay_display(self):
-        """Update the overlay display based on current overlay type"""
-        # Clear existing overlay shapes
-        for shape in self.overlay_shapes:
-            shape.delete()
-        self.overlay_shapes.clear()
-        
-        if self.current_overlay == OVERLAY_NONE:
+        """Recolor every overlay tile for the current overlay type"""
+        farm_grid = self._farm_grid()
+        self._seen_revision = farm_grid.revision if farm_grid is not None else 0
+        if self.current_overlay == OVERLAY_NONE or farm_grid is None:
             return
-            
-        # Create overlay shapes for each relevant tile
-        for tile in self.game_window.farm_tiles:
-            # Only show overlays on farmed tiles
-            if tile.state in [TILE_OWNED, TILE_TILLED, TILE_PLANTED, TILE_READY_HARVEST]:
-                value = self.get_tile_overlay_value(tile, self.current_overlay)
-                color = self.value_to_color(value, self.current_overlay)
-                
-                # Create a semi-transparent rectangle overlay
-                overlay_rect = shapes.Rectangle(
-                    tile.x, tile.y, grid_size, grid_size,
-                    color=color[:3],  # RGB without alpha
-                    batch=self.overlay_batch,
-                    group=self.overlay_group
-                )
-                overlay_rect.opacity = color[3]  # Set alpha
-                self.overlay_shapes.append(overlay_rect)
+        if self._overlay_grid is not farm_grid:
+            self._reset_overlay_chunks(farm_grid)
+        self._refresh_tiles(farm_grid)
+
+    def _update_changed_tiles(self):
+        """Recolor only tiles whose state, weeds or nutrients changed since the last refresh"""
+        farm_grid = self._farm_grid()
+        if farm_grid is None:
+            return
+        if self._overlay_grid is not farm_grid:
+            self.update_overlay_display()
+            return
+        if farm_grid.revision == self._seen_revision:
+            return
+        changed = farm_grid.changed_since(self._seen_revision)
+        self._seen_revision = farm_grid.revision
+        self._refresh_tiles(farm_grid, changed)
     
     def draw(self):
-        """Draw the overlay and update it every frame"""
+        """Draw the overlay, recoloring only tiles that changed"""
         if self.current_overlay != OVERLAY_NONE:
-            # Update overlay display every frame to reflect real-time changes
-            self.update_overlay_display()
-            self.overlay_batch.draw()
+            self._update_changed_tiles()
+            if self.overlay_chunks is not None:
+                self.overlay_chunks.draw_visible(self.game_window.camera)
     
     def clear(self):
         """Clear all overlays"""
@@ -1,4 +1,5 @@
 import pyglet
+from simulation.catalog import get_seed_cost
 
 
 class PopupCore:
@@ -92,11 +93,7 @@ class PopupCore:
     
     def get_seed_price(self, seed_name):
         """Get the price of a specific seed type from seeds config"""
-        from constants import seeds_config
-        for seed in seeds_config:
-            if seed['name'] == seed_name:
-                return seed['cost']
-        return 10  # Default fallback price
+        return get_seed_cost(seed_name)  # Falls back to 10 for unknown seeds
     
     def get_popup_tooltip(self):
         """Get current popup tooltip text and position"""
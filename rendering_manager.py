@@ -2,40 +2,99 @@
 Rendering Manager - Handles all drawing and rendering functionality
 """
 import pyglet
-from constants import farm_batch, icon_batch, tractor_batch, ui_batch
+from constants import icon_batch, ui_batch, grid_size, UI_PANEL_WIDTH
 
 
 class RenderingManager:
     def __init__(self, game_window):
         self.game_window = game_window
+        # Persistent queued-job indicators, kept in sync by TractorJobQueue
+        self.queue_batch = pyglet.graphics.Batch()
+        self.queue_tint_group = pyglet.graphics.Group(order=0)
+        self.queue_icon_group = pyglet.graphics.Group(order=1)
+        self.queue_indicators = {}  # TractorJob -> list of its shapes/sprites
+        # Retained background and notification shapes, built on first draw and laid out again only on resize
+        self.background_batch = pyglet.graphics.Batch()
+        self.main_background = None
+        self.ui_background = None
+        self.separator_line = None
+        self.notification_bg = None
+        self.notification_label = None
     
-    def draw_background(self):
-        """Draw the game background"""
-        # Draw main farm area background (bright green)
-        main_background = pyglet.shapes.Rectangle(
-            0, 0, self.game_window.width - 245, self.game_window.height,
-            color=(51, 153, 51)  # Bright green for farm area
+    def _build_ui_layer(self):
+        """Create the persistent background and notification shapes"""
+        # Main farm area background (bright green)
+        self.main_background = pyglet.shapes.Rectangle(
+            0, 0, 1, 1, color=(51, 153, 51),  # Bright green for farm area
+            batch=self.background_batch, group=pyglet.graphics.Group(order=0)
         )
-        main_background.draw()
-        
-        # Draw UI background area (very dark green rectangle)
-        ui_background = pyglet.shapes.Rectangle(
-            self.game_window.width - 245, 0, 245, self.game_window.height, 
-            color=(0, 25, 0)  # Very dark green for UI area
+        # UI background area (very dark green rectangle)
+        self.ui_background = pyglet.shapes.Rectangle(
+            0, 0, 1, 1, color=(0, 25, 0),  # Very dark green for UI area
+            batch=self.background_batch, group=pyglet.graphics.Group(order=0)
+        )
+        # Separator line
+        self.separator_line = pyglet.shapes.Line(
+            0, 0, 0, 0, color=(255, 255, 255),  # White line
+            batch=self.background_batch, group=pyglet.graphics.Group(order=1)
         )
-        ui_background.draw()
         
-        # Draw separator line
-        separator_line = pyglet.shapes.Line(
-            self.game_window.width - 245, 0, self.game_window.width - 245, self.game_window.height,
-            batch=None, color=(255, 255, 255)  # White line
+        # Notification in bottom left of game area (not UI panel)
+        x = 20
+        y = 20
+        bg_width = 200
+        bg_height = 40
+        self.notification_bg = pyglet.shapes.Rectangle(
+            x - 10, y - 5, bg_width, bg_height, color=(0, 0, 0)
         )
-        separator_line.draw()
+        self.notification_bg.opacity = 180
+        self.notification_label = pyglet.text.Label(
+            "",
+            x=x, y=y + 10,
+            anchor_x='left',
+            anchor_y='center',
+            color=(255, 255, 255, 255),
+            font_size=14
+        )
+        self.layout_ui_layer()
+    
+    def layout_ui_layer(self):
+        """Fit the retained background shapes to the window size (called on resize)"""
+        if self.main_background is None:
+            return
+        width = self.game_window.width
+        height = self.game_window.height
+        self.main_background.width = width - UI_PANEL_WIDTH
+        self.main_background.height = height
+        self.ui_background.x = width - UI_PANEL_WIDTH
+        self.ui_background.width = UI_PANEL_WIDTH
+        self.ui_background.height = height
+        self.separator_line.position = (width - UI_PANEL_WIDTH, 0)
+        self.separator_line.x2 = width - UI_PANEL_WIDTH
+        self.separator_line.y2 = height
+    
+    def draw_background(self):
+        """Draw the game background"""
+        if self.main_background is None:
+            self._build_ui_layer()
+        self.background_batch.draw()
+    
+    def draw_world(self):
+        """Draw everything that lives on the map through the camera, clipped to the map area"""
+        camera = self.game_window.camera
+        camera.begin()
+        try:
+            self.draw_game_batches()
+            
+            # Draw overlays
+            self.game_window.overlay_manager.draw()
+        finally:
+            camera.end()
     
     def draw_game_batches(self):
-        """Draw all game batches with error handling"""
-        # Draw farm batch (background layer)
-        farm_batch.draw()
+        """Draw all world-space batches with error handling"""
+        # Draw the tile chunks in view (ground, then crop and seed icons)
+        self.game_window.managers.farm_manager.tile_chunks.draw_visible(self.game_window.camera)
         
         # Draw icon batch (foreground layer - icons on top of buildings)
         icon_batch.draw()
@@ -48,13 +107,14 @@ class RenderingManager:
         
         # Draw tractor batch with error handling
         try:
-            tractor_batch.draw()
+            self.game_window.managers.tractor_manager.draw()
         except Exception as e:
             # If tractor batch fails to draw, recreate it
             print(f"Tractor batch drawing error: {e}")
             self.game_window.managers.tractor_manager.rebuild_tractor_batch()
-        
-        # Draw UI batch with error handling
+    
+    def draw_ui_batch(self):
+        """Draw the UI panel batch with error handling"""
         try:
             ui_batch.draw()
         except Exception as e:
@@ -95,45 +155,55 @@ class RenderingManager:
     
     def draw_queue_indicators(self):
         """Draw purple tint and tractor icons on tiles with queued jobs"""
-        if hasattr(self.game_window, 'tractor_job_queue'):
-            queued_positions = self.game_window.tractor_job_queue.get_queued_positions()
-            
-            for grid_x, grid_y in queued_positions:
-                # Draw light purple tint overlay on the tile
-                from constants import grid_size
-                purple_tint = pyglet.shapes.Rectangle(
-                    grid_x, grid_y, grid_size, grid_size,  # Use grid_size for tile size
-                    color=(128, 0, 128)  # Purple color
-                )
-                purple_tint.opacity = 80  # Semi-transparent (0-255 scale)
-                purple_tint.draw()
-                
-                # Draw a simple yellow circle as tractor indicator (more reliable than huge image)
-                tractor_indicator = pyglet.shapes.Circle(
-                    x=grid_x + grid_size // 2,  # Center in tile
-                    y=grid_y + grid_size // 2,
-                    radius=grid_size // 4,
-                    color=(255, 255, 0)  # Yellow color for visibility
+        self.queue_batch.draw()
+    
+    def sync_queue_indicators(self, jobs):
+        """Add indicators for newly queued jobs and remove those of jobs that left the queue"""
+        queued = set(jobs)
+        for job in [job for job in self.queue_indicators if job not in queued]:
+            for item in self.queue_indicators.pop(job):
+                item.delete()
+        for job in jobs:
+            if job not in self.queue_indicators:
+                self.queue_indicators[job] = self._create_queue_indicator(job.grid_x, job.grid_y)
+    
+    def _create_queue_indicator(self, grid_x, grid_y):
+        """Create the persistent tint, circle and tractor icon for one queued job"""
+        # Light purple tint overlay on the tile
+        purple_tint = pyglet.shapes.Rectangle(
+            grid_x, grid_y, grid_size, grid_size,
+            color=(128, 0, 128),  # Purple color
+            batch=self.queue_batch, group=self.queue_tint_group
+        )
+        purple_tint.opacity = 80  # Semi-transparent (0-255 scale)
+        
+        # A simple yellow circle as tractor indicator (more reliable than huge image)
+        tractor_indicator = pyglet.shapes.Circle(
+            x=grid_x + grid_size // 2,  # Center in tile
+            y=grid_y + grid_size // 2,
+            radius=grid_size // 4,
+            color=(255, 255, 0),  # Yellow color for visibility
+            batch=self.queue_batch, group=self.queue_tint_group
+        )
+        items = [purple_tint, tractor_indicator]
+        
+        # Also try to show the tractor image if it works
+        try:
+            from constants import tractor_image
+            if tractor_image and tractor_image.width > 0:
+                # Create a much smaller scale for the huge 4000x4000 image
+                target_size = 12  # Target 12x12 pixels (smaller)
+                tractor_sprite = pyglet.sprite.Sprite(
+                    tractor_image,
+                    x=grid_x + (grid_size - target_size) // 2,  # Center in tile
+                    y=grid_y + (grid_size - target_size) // 2,
+                    batch=self.queue_batch, group=self.queue_icon_group
                 )
-                tractor_indicator.draw()
-                
-                # Also try to draw the tractor image if it works
-                try:
-                    from constants import tractor_image
-                    if tractor_image and tractor_image.width > 0:
-                        # Create a much smaller scale for the huge 4000x4000 image
-                        target_size = 12  # Target 12x12 pixels (smaller)
-                        scale_factor = target_size / max(tractor_image.width, tractor_image.height)
-                        
-                        tractor_sprite = pyglet.sprite.Sprite(
-                            tractor_image,
-                            x=grid_x + (grid_size - target_size) // 2,  # Center in tile
-                            y=grid_y + (grid_size - target_size) // 2
-                        )
-                        tractor_sprite.scale = scale_factor
-                        tractor_sprite.draw()
-                except Exception as e:
-                    pass  # Fall back to just the yellow circle
+                tractor_sprite.scale = target_size / max(tractor_image.width, tractor_image.height)
+                items.append(tractor_sprite)
+        except Exception as e:
+            pass  # Fall back to just the yellow circle
+        return items
     
     def render_frame(self):
         """Render a complete frame"""
@@ -143,11 +213,11 @@ class RenderingManager:
         # Draw background
         self.draw_background()
         
-        # Draw game batches
-        self.draw_game_batches()
+        # Draw the map through the camera
+        self.draw_world()
         
-        # Draw overlays
-        self.game_window.overlay_manager.draw()
+        # Draw UI panel buttons
+        self.draw_ui_batch()
         
         # Draw UI elements
         self.draw_ui_elements()
@@ -162,28 +232,11 @@ class RenderingManager:
     def draw_notification(self):
         """Draw notification message in bottom left of game area"""
         if self.game_window.notification_message and self.game_window.notification_timer > 0:
-            # Position in bottom left of game area (not UI panel)
-            x = 20
-            y = 20
-            
-            # Draw semi-transparent background
-            bg_width = 200
-            bg_height = 40
-            notification_bg = pyglet.shapes.Rectangle(
-                x - 10, y - 5, bg_width, bg_height,
-                color=(0, 0, 0), batch=None
-            )
-            notification_bg.opacity = 180
-            notification_bg.draw()
+            if self.notification_label is None:
+                self._build_ui_layer()
+            if self.notification_label.text != self.game_window.notification_message:
+                self.notification_label.text = self.game_window.notification_message
             
-            # Draw notification text
-            notification_label = pyglet.text.Label(
-                self.game_window.notification_message,
-                x=x, y=y + 10,
-                anchor_x='left',
-                anchor_y='center',
-                color=(255, 255, 255, 255),
-                font_size=14
-            )
-            notification_label.draw()
-
+            # Draw semi-transparent background and notification text
+            self.notification_bg.draw()
+            self.notification_label.draw()
@@ -0,0 +1,326 @@
+"""
+Save Format - Reads and writes save files as JSON or as a compact versioned binary format
+
+The format is chosen by file extension: BINARY_SAVE_EXTENSION files are binary, anything else is JSON.
+Both formats load into the same game data dictionary. Run this module to convert between them:
+
+    python save_format.py game_save.json game_save.tfsave [zlib|zstd|none]
+"""
+import json
+import os
+import shutil
+import struct
+import sys
+import uuid
+import zlib
+import numpy as np
+from simulation.farm_grid import NUTRIENT_KEYS
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+BINARY_SAVE_EXTENSION = '.tfsave'
+BINARY_SAVE_MAGIC = b'TFSAVE'
+BINARY_SAVE_VERSION = 2  # 2: 'number' columns keep ints, floats and missing values apart (1 stored them all as floats)
+
+# Compression codes stored in the file header
+COMPRESSION_CODES = {'none': 0, 'zlib': 1, 'zstd': 2}
+COMPRESSION_NAMES = {code: name for name, code in COMPRESSION_CODES.items()}
+
+# magic, format version, compression code
+_FILE_HEADER = struct.Struct('<6sBB')
+# Length of the JSON header that precedes the column data
+_HEADER_LENGTH = struct.Struct('<I')
+
+# Top-level key holding the id of a full save; its delta log lines carry the same id
+SAVE_GENERATION_KEY = 'save_generation'
+
+# Per-value type codes of a 'number' column
+NUMBER_MISSING, NUMBER_INT, NUMBER_FLOAT = 0, 1, 2
+
+# Per-tile values that live on the tile managers rather than in FarmGrid, in save order
+TILE_FIELDS = (
+    'crop_type', 'growth_time', 'plant_time', 'current_scale', 'building_type',
+    'stored_crop_type', 'stored_amount', 'building_capacity', 'previous_seed_type'
+)
+
+
+def is_binary_save_path(path):
+    """Check if a save path uses the binary format"""
+    return str(path).endswith(BINARY_SAVE_EXTENSION)
+
+
+def tile_dicts_from_columns(columns):
+    """Turn column-form tile data into the per-tile dictionaries used by JSON saves"""
+    tile_dicts = []
+    field_columns = [columns[field] for field in TILE_FIELDS]
+    for x, y, state, weeds, nutrients, *fields in zip(
+            columns['x'], columns['y'], np.asarray(columns['state']).tolist(),
+            np.asarray(columns['weeds']).tolist(), np.asarray(columns['nutrients']).T.tolist(),
+            *field_columns):
+        tile_data = {'x': x, 'y': y, 'state': state, 'weeds': weeds}
+        tile_data.update(zip(TILE_FIELDS, fields))
+        tile_data['nutrients'] = dict(zip(NUTRIENT_KEYS, nutrients))
+        tile_dicts.append(tile_data)
+    return tile_dicts
+
+
+def tile_columns_from_dicts(tile_dicts):
+    """Turn per-tile save dictionaries into column form"""
+    columns = {
+        'x': [tile_data.get('x', 0) for tile_data in tile_dicts],
+        'y': [tile_data.get('y', 0) for tile_data in tile_dicts],
+        'state': np.array([tile_data.get('state', 0) for tile_data in tile_dicts], dtype=np.uint8),
+        'weeds': np.array([tile_data.get('weeds', 0) for tile_data in tile_dicts], dtype=np.float64),
+        'nutrients': np.array([[tile_data.get('nutrients', {}).get(nutrient, 0.0) for tile_data in tile_dicts]
+                               for nutrient in NUTRIENT_KEYS], dtype=np.float64).reshape(len(NUTRIENT_KEYS), -1)
+    }
+    for field in TILE_FIELDS:
+        columns[field] = [tile_data.get(field) for tile_data in tile_dicts]
+    return columns
+
+
+def _encode_column(values, strings, string_ids):
+    """Pack one column as (descriptor, array); strings go through the shared string table"""
+    if isinstance(values, np.ndarray):
+        return {'kind': 'array'}, values
+
+    present = [value for value in values if value is not None]
+    if all(isinstance(value, str) for value in present):
+        ids = np.empty(len(values), dtype='<i4')
+        for i, value in enumerate(values):
+            if value is None:
+                ids[i] = -1
+            else:
+                if value not in string_ids:
+                    string_ids[value] = len(strings)
+                    strings.append(value)
+                ids[i] = string_ids[value]
+        return {'kind': 'string'}, ids
+
+    if len(present) == len(values):
+        if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+            return {'kind': 'int'}, np.array(values, dtype='<i8')
+        if all(isinstance(value, float) for value in values):
+            return {'kind': 'float', 'nullable': False}, np.array(values, dtype='<f8')
+
+    # Missing values or ints mixed with floats: row 0 holds the values (0 where missing),
+    # row 1 the type code of each, so an int such as a growth_time of 5000 comes back as an int
+    codes = [NUMBER_MISSING if value is None else NUMBER_FLOAT if isinstance(value, float) else NUMBER_INT
+             for value in values]
+    array = np.array([[0 if value is None else value for value in values], codes], dtype='<f8').reshape(2, len(values))
+    return {'kind': 'number'}, array
+
+
+def _decode_column(descriptor, array, strings):
+    """Unpack one column back into the values _encode_column was given"""
+    kind = descriptor['kind']
+    if kind == 'array':
+        return array
+    if kind == 'string':
+        return [strings[i] if i >= 0 else None for i in array.tolist()]
+    if kind == 'number':
+        return [None if code == NUMBER_MISSING else int(value) if code == NUMBER_INT else value
+                for value, code in zip(array[0].tolist(), array[1].tolist())]
+    values = array.tolist()
+    if descriptor.get('nullable'):
+        values = [None if value != value else value for value in values]
+    return values
+
+
+def _compress(payload, compression):
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(payload)
+    if compression == 'zlib':
+        return zlib.compress(payload, 6)
+    return payload
+
+
+def _decompress(payload, compression):
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ValueError("Save file is zstd-compressed but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    if compression == 'zlib':
+        return zlib.decompress(payload)
+    return payload
+
+
+def resolve_compression(compression):
+    """Get a usable compression name, falling back to zlib when zstd is unavailable"""
+    compression = compression or 'none'
+    if compression not in COMPRESSION_CODES:
+        raise ValueError(f"Unknown save compression: {compression}")
+    if compression == 'zstd' and zstandard is None:
+        print("⚠️ zstandard is not installed, using zlib save compression instead")
+        return 'zlib'
+    return compression
+
+
+def encode_binary_save(sections, finance, columns, compression='zlib'):
+    """Encode a full save as bytes
+
+    sections maps top-level save keys to their JSON-encoded values, finance is the finance
+    save dictionary and columns is the column-form tile data.
+    """
+    compression = resolve_compression(compression)
+    strings = []
+    string_ids = {}
+    descriptors = []
+    arrays = []
+    for name in ('x', 'y', 'state', 'weeds', 'nutrients') + TILE_FIELDS:
+        descriptor, array = _encode_column(columns[name], strings, string_ids)
+        array = np.ascontiguousarray(array)
+        descriptor.update({'name': name, 'dtype': array.dtype.str, 'shape': list(array.shape)})
+        descriptors.append(descriptor)
+        arrays.append(array)
+
+    # Sections are already JSON, so they are spliced in rather than decoded and re-encoded
+    sections_json = '{' + ','.join(f'{json.dumps(key)}:{encoded}' for key, encoded in sections.items()) + '}'
+    header = (
+        '{"sections":' + sections_json +
+        ',"finance":' + json.dumps(finance) +
+        ',"tile_count":' + str(len(columns['x'])) +
+        ',"strings":' + json.dumps(strings) +
+        ',"columns":' + json.dumps(descriptors) + '}'
+    ).encode('utf-8')
+
+    payload = b''.join([_HEADER_LENGTH.pack(len(header)), header] + [array.tobytes() for array in arrays])
+    return (_FILE_HEADER.pack(BINARY_SAVE_MAGIC, BINARY_SAVE_VERSION, COMPRESSION_CODES[compression]) +
+            _compress(payload, compression))
+
+
+def decode_binary_save(data):
+    """Decode binary save bytes into a game data dictionary"""
+    magic, version, compression_code = _FILE_HEADER.unpack_from(data)
+    if magic != BINARY_SAVE_MAGIC:
+        raise ValueError("Not a binary save file")
+    if version > BINARY_SAVE_VERSION:
+        raise ValueError(f"Save file version {version} is newer than supported version {BINARY_SAVE_VERSION}")
+    if compression_code not in COMPRESSION_NAMES:
+        raise ValueError(f"Unknown save compression code: {compression_code}")
+
+    payload = _decompress(data[_FILE_HEADER.size:], COMPRESSION_NAMES[compression_code])
+    (header_length,) = _HEADER_LENGTH.unpack_from(payload)
+    offset = _HEADER_LENGTH.size
+    header = json.loads(payload[offset:offset + header_length])
+    offset += header_length
+
+    columns = {}
+    for descriptor in header['columns']:
+        dtype = np.dtype(descriptor['dtype'])
+        count = int(np.prod(descriptor['shape'], dtype=np.int64))
+        array = np.frombuffer(payload, dtype=dtype, count=count, offset=offset).reshape(descriptor['shape'])
+        offset += count * dtype.itemsize
+        columns[descriptor['name']] = _decode_column(descriptor, array, header['strings'])
+
+    game_data = header['sections']
+    game_data['finance'] = header['finance']
+    game_data['farm_tiles'] = tile_dicts_from_columns(columns)
+    return game_data
+
+
+def write_atomic(path, data):
+    """Write a file via a temporary file and rename, so a crash never leaves a half-written save"""
+    temp_path = path + '.tmp'
+    mode = 'wb' if isinstance(data, bytes) else 'w'
+    with open(temp_path, mode) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def write_save_file(path, sections, finance, columns, compression='zlib'):
+    """Write a full save in the format matching the path's extension"""
+    if is_binary_save_path(path):
+        write_atomic(path, encode_binary_save(sections, finance, columns, compression))
+        return
+
+    game_data = {key: json.loads(encoded) for key, encoded in sections.items()}
+    game_data['farm_tiles'] = tile_dicts_from_columns(columns)
+    game_data['finance'] = finance
+    write_atomic(path, json.dumps(game_data, indent=2))
+
+
+def read_save_file(path):
+    """Read a full save (without its delta log) in either format"""
+    if is_binary_save_path(path):
+        with open(path, 'rb') as f:
+            return decode_binary_save(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def apply_delta_log(delta_path, game_data):
+    """Apply a delta log on top of full save data; returns the number of deltas applied
+
+    Deltas from another generation (left behind when a newer full save was written but the old
+    log was not removed) are skipped. Saves and deltas from before generations both have none.
+    """
+    if not os.path.exists(delta_path):
+        return 0
+
+    generation = game_data.get(SAVE_GENERATION_KEY)
+    count = 0
+    skipped = 0
+    with open(delta_path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                delta = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted write; everything before it is valid
+                print(f"⚠️ Ignoring incomplete save delta in {delta_path}")
+                break
+            if delta.get('generation') != generation:
+                skipped += 1
+                continue
+
+            game_data.update(delta.get('top', {}))
+            farm_tiles = game_data.get('farm_tiles', [])
+            for index, tile_data in delta.get('farm_tiles', {}).items():
+                index = int(index)
+                if index < len(farm_tiles):
+                    farm_tiles[index] = tile_data
+            if 'finance' in delta:
+                finance_data = game_data.setdefault('finance', {'transactions': []})
+                finance_data['current_money'] = delta['finance']['current_money']
+                finance_data.setdefault('transactions', []).extend(delta['finance']['new_transactions'])
+                if 'totals' in delta['finance']:
+                    finance_data['totals'] = delta['finance']['totals']
+            count += 1
+    if skipped:
+        print(f"⚠️ Ignored {skipped} save deltas in {delta_path} left over from an older save")
+    return count
+
+
+def convert_save(source_path, target_path, compression='zlib'):
+    """Convert a save file (plus its delta log) to the format of target_path"""
+    game_data = read_save_file(source_path)
+    apply_delta_log(source_path + '.delta', game_data)
+    # The target is a new full save, so no delta log written for another file can apply to it
+    game_data[SAVE_GENERATION_KEY] = uuid.uuid4().hex
+
+    columns = tile_columns_from_dicts(game_data.pop('farm_tiles', []))
+    finance = game_data.pop('finance', {})
+    sections = {key: json.dumps(value) for key, value in game_data.items()}
+    write_save_file(target_path, sections, finance, columns, compression)
+    # The finance ledger holds the transactions that no longer fit in the save itself
+    if os.path.exists(source_path + '.ledger'):
+        shutil.copyfile(source_path + '.ledger', target_path + '.ledger')
+    elif os.path.exists(target_path + '.ledger'):
+        os.remove(target_path + '.ledger')
+    return target_path
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python save_format.py SOURCE TARGET [zlib|zstd|none]")
+        sys.exit(1)
+    target = convert_save(sys.argv[1], sys.argv[2], sys.argv[3] if len(sys.argv) == 4 else 'zlib')
+    print(f"💾 Converted {sys.argv[1]} to {target} ({os.path.getsize(target)} bytes)")
@@ -0,0 +1,64 @@
+"""
+Save Worker - Runs save encoding and file writes on a background thread
+"""
+import queue
+import threading
+import traceback
+
+
+class SaveWorker:
+    """Single background thread that runs save jobs in order and hands results back to the main thread"""
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = None
+
+    def _ensure_thread(self):
+        """Start the worker thread on first use"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="SaveWorker", daemon=True)
+            self._thread.start()
+
+    def submit(self, tag, func, *args):
+        """Queue func(*args) to run on the worker; its outcome is reported by poll_results() under tag"""
+        with self._lock:
+            self._pending += 1
+            self._idle.clear()
+        self._ensure_thread()
+        self._jobs.put((tag, func, args))
+
+    def is_busy(self):
+        """Check if any submitted job has not finished yet"""
+        return not self._idle.is_set()
+
+    def wait_idle(self, timeout=None):
+        """Block until every submitted job has finished (used before synchronous saves and on exit)"""
+        return self._idle.wait(timeout)
+
+    def poll_results(self):
+        """Get finished jobs as (tag, success, result_or_error) tuples without blocking"""
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def _run(self):
+        while True:
+            tag, func, args = self._jobs.get()
+            try:
+                self._results.put((tag, True, func(*args)))
+            except Exception as e:
+                traceback.print_exc()
+                self._results.put((tag, False, e))
+            finally:
+                with self._lock:
+                    self._pending -= 1
+                    if self._pending == 0:
+                        self._idle.set()
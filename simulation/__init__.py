@@ -0,0 +1,6 @@
+"""
+Simulation package - Game rules and state with no pyglet dependency
+
+Runs headless for servers, fast-forwarding and CI; the game window renders it on top.
+"""
+from simulation.simulation import Simulation
@@ -0,0 +1,36 @@
+"""
+Run the simulation headless for a number of game days, e.g. to soak-test the economy:
+
+    python -m simulation --days 100 --seed 1 --forecast
+"""
+import argparse
+import time
+from simulation import Simulation
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the farm simulation without a window")
+    parser.add_argument('--days', type=int, default=30, help="Market days to simulate")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for a repeatable run")
+    parser.add_argument('--forecast', action='store_true', help="Print price forecast bands at the end")
+    args = parser.parse_args()
+
+    sim = Simulation(seed=args.seed)
+    start = time.perf_counter()
+    steps = sim.run_days(args.days)
+    elapsed = time.perf_counter() - start
+
+    print(f"⏩ Simulated {args.days} days ({steps} steps, {sim.clock.now:.0f} game seconds) in {elapsed:.2f}s")
+    print(f"💰 Money: ${sim.game_state.money:.2f}")
+    print(sim.market.get_market_summary())
+
+    if args.forecast:
+        forecast = sim.forecaster.forecast_now()
+        print(f"=== {forecast.days}-Day Forecast (10th / 50th / 90th percentile) ===")
+        for crop_name in sim.market.crop_names:
+            low, median, high = forecast.get_range(crop_name)
+            print(f"{crop_name}: ${low} / ${median} / ${high}")
+
+
+if __name__ == '__main__':
+    main()
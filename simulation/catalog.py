@@ -0,0 +1,56 @@
+"""
+Catalog - Seeds and fertilizers compiled once from config: dense integer IDs, O(1) name lookup, nutrient vectors
+"""
+import numpy as np
+from simulation.config import seeds_config, fertilizer_config
+from simulation.farm_grid import NUTRIENT_KEYS
+
+# Crops in config order; a crop's ID is its index here and its row in the arrays below
+CROP_NAMES = tuple(seed['name'] for seed in seeds_config)
+CROP_IDS = {name: crop_id for crop_id, name in enumerate(CROP_NAMES)}
+SEEDS = {seed['name']: seed for seed in seeds_config}
+
+# Per-crop vectors in NUTRIENT_KEYS order: soil used at harvest, and levels needed for a double harvest
+CROP_NUTRIENT_USE = np.array(
+    [[max(0, seed.get(f"{nutrient}_use", 0)) for nutrient in NUTRIENT_KEYS] for seed in seeds_config],
+    dtype=np.float64
+).reshape(len(CROP_NAMES), len(NUTRIENT_KEYS))
+CROP_NUTRIENT_DOUBLE = np.array(
+    [[seed.get(f"{nutrient}_double", 0) for nutrient in NUTRIENT_KEYS] for seed in seeds_config],
+    dtype=np.float64
+).reshape(len(CROP_NAMES), len(NUTRIENT_KEYS))
+SEED_COSTS = np.array([seed.get('cost', 0) for seed in seeds_config], dtype=np.float64)
+HARVEST_PRICES = np.array([seed.get('harvest_price', 10) for seed in seeds_config], dtype=np.float64)
+GROWTH_TIMES = np.array([seed.get('growth_time', 0) for seed in seeds_config], dtype=np.float64)
+
+# Fertilizers in config order, with their nutrient contents as vectors
+FERTILIZER_NAMES = tuple(fertilizer['name'] for fertilizer in fertilizer_config)
+FERTILIZER_IDS = {name: fertilizer_id for fertilizer_id, name in enumerate(FERTILIZER_NAMES)}
+FERTILIZERS = {fertilizer['name']: fertilizer for fertilizer in fertilizer_config}
+FERTILIZER_NUTRIENTS = np.array(
+    [[fertilizer.get(nutrient, 0) for nutrient in NUTRIENT_KEYS] for fertilizer in fertilizer_config],
+    dtype=np.float64
+).reshape(len(FERTILIZER_NAMES), len(NUTRIENT_KEYS))
+FERTILIZER_COSTS = np.array([fertilizer.get('cost', 0) for fertilizer in fertilizer_config], dtype=np.float64)
+
+
+def get_seed(crop_name):
+    """Get a crop's seed config by name, or None if there is no such crop"""
+    return SEEDS.get(crop_name)
+
+
+def get_seed_cost(crop_name, default=10):
+    """Get the price of one seed of a crop"""
+    seed = SEEDS.get(crop_name)
+    return seed['cost'] if seed is not None else default
+
+
+def get_harvest_price(crop_name, default=10):
+    """Get a crop's base harvest (market) price"""
+    seed = SEEDS.get(crop_name)
+    return seed.get('harvest_price', default) if seed is not None else default
+
+
+def get_fertilizer(fertilizer_name):
+    """Get a fertilizer's config by name, or None if there is no such fertilizer"""
+    return FERTILIZERS.get(fertilizer_name)
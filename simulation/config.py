@@ -0,0 +1,41 @@
+"""
+Simulation Config - Game data and tile constants shared by the simulation and the renderer (no pyglet)
+"""
+import json
+import sys
+import os
+
+# Handle PyInstaller bundle path
+if getattr(sys, 'frozen', False):
+    # Running in a PyInstaller bundle
+    bundle_dir = sys._MEIPASS
+else:
+    # Running in normal Python environment - the game root is the parent of this package
+    bundle_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Load config files
+with open(os.path.join(bundle_dir, 'config', 'game_config.json'), 'r') as f:
+    game_config = json.load(f)
+with open(os.path.join(bundle_dir, 'config', 'seeds.json'), 'r') as f:
+    seeds_config = json.load(f)
+with open(os.path.join(bundle_dir, 'config', 'fertilizer.json'), 'r') as f:
+    fertilizer_config = json.load(f)
+with open(os.path.join(bundle_dir, 'config', 'tractor.json'), 'r') as f:
+    tractor_config = json.load(f)
+
+# Load tile_size from game_config.json
+grid_size = game_config.get('tile_size', 32)
+
+# Tile states
+TILE_UNOWNED = 0
+TILE_OWNED = 1
+TILE_TILLED = 2
+TILE_PLANTED = 3
+TILE_GROWING = 4
+TILE_READY_HARVEST = 5
+TILE_BARN = 6
+TILE_SEED_BIN = 7
+
+# Building types
+BUILDING_BARN = 'barn'
+BUILDING_SEED_BIN = 'seed_bin'
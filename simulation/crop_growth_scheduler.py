@@ -0,0 +1,69 @@
+"""
+Crop Growth Scheduler - Tracks planted tiles and fires harvest readiness on time
+"""
+import heapq
+import itertools
+from simulation.config import game_config
+from simulation.clock import SimulationClock
+
+
+class CropGrowthScheduler:
+    """Keeps planted tiles in a min-heap keyed by ready (game) time instead of polling every tile each frame"""
+
+    def __init__(self, clock=None):
+        self.clock = clock if clock is not None else SimulationClock()
+        self._ready_heap = []  # (ready_time, sequence, tile)
+        self._planted = {}  # {tile: ready_time} for tiles that are still growing
+        self._sequence = itertools.count()
+        self.visual_update_interval = game_config.get('crop_visual_update_interval', 0.1)
+        self._visual_timer = 0.0
+
+    def register(self, tile):
+        """Start tracking a planted tile until its crop is ready"""
+        crop_manager = tile.crop_manager
+        if crop_manager.plant_time is None:
+            return
+        ready_time = crop_manager.plant_time + crop_manager.growth_time / 1000.0
+        self._planted[tile] = ready_time
+        heapq.heappush(self._ready_heap, (ready_time, next(self._sequence), tile))
+
+    def unregister(self, tile):
+        """Stop tracking a tile (harvested, ready or cleared); its heap entry is dropped lazily"""
+        self._planted.pop(tile, None)
+
+    def clear(self):
+        """Forget all tracked tiles"""
+        self._ready_heap = []
+        self._planted = {}
+        self._visual_timer = 0.0
+
+    def planted_count(self):
+        """Get the number of tiles currently growing"""
+        return len(self._planted)
+
+    def update(self, now=None):
+        """Fire ready transitions that are due at game time `now` (defaults to the clock)"""
+        if now is None:
+            now = self.clock.now
+
+        while self._ready_heap and self._ready_heap[0][0] <= now:
+            ready_time, _, tile = heapq.heappop(self._ready_heap)
+            # Skip stale entries left behind by unregister() or re-planting
+            if self._planted.get(tile) != ready_time:
+                continue
+            del self._planted[tile]
+            tile.crop_manager.mark_ready_for_harvest(now)
+
+    def update_growth_visuals(self, dt, now=None):
+        """Refresh the growth scale of growing crops, at most once per visual_update_interval of real time"""
+        self._visual_timer += dt
+        if self._visual_timer >= self.visual_update_interval:
+            self._visual_timer = 0.0
+            self.refresh_growth(now)
+
+    def refresh_growth(self, now=None):
+        """Recompute the growth scale of every growing crop"""
+        if now is None:
+            now = self.clock.now
+        for tile in self._planted:
+            tile.crop_manager.update_growth_scale(now)
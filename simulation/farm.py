@@ -0,0 +1,131 @@
+"""
+Farm - The grid of farm tiles with its lookup index, row index, crop growth and daily soil update
+"""
+import numpy as np
+from simulation.config import (
+    grid_size, game_config, TILE_OWNED, TILE_TILLED, TILE_PLANTED, TILE_GROWING, TILE_READY_HARVEST,
+    TILE_BARN, BUILDING_BARN, BUILDING_SEED_BIN
+)
+from simulation.farm_tile import FarmTile
+from simulation.farm_grid import FarmGrid
+from simulation.farm_row_index import FarmRowIndex
+from simulation.storage_index import StorageIndex
+from simulation.crop_growth_scheduler import CropGrowthScheduler
+from simulation.clock import SimulationClock
+
+# Tile states that grow weeds (owned/farmed land, not forest or buildings)
+FARMED_STATES = (TILE_OWNED, TILE_TILLED, TILE_PLANTED, TILE_GROWING, TILE_READY_HARVEST)
+
+
+class Farm:
+    def __init__(self, map_width=None, map_height=None, clock=None):
+        self.clock = clock if clock is not None else SimulationClock()
+        self.map_width = map_width if map_width is not None else game_config.get('map_width', 50)
+        self.map_height = map_height if map_height is not None else game_config.get('map_height', 25)
+        self.farm_tiles = None
+        self.farm_grid = None
+        # 2D lookup grid indexed as tile_grid[column][row]
+        self.tile_grid = None
+        self.grid_width = 0
+        self.grid_height = 0
+        self.row_index = None
+        # Barn and seed bin contents by crop, kept up to date by the tiles' building managers
+        self.storage_index = StorageIndex()
+        self.growth_scheduler = CropGrowthScheduler(self.clock)
+        # Seeded generator for daily soil changes (set soil_random_seed for reproducible runs)
+        self.soil_rng = np.random.default_rng(game_config.get('soil_random_seed'))
+
+    @property
+    def width(self):
+        """Width of the map in world pixels"""
+        return self.map_width * grid_size
+
+    @property
+    def height(self):
+        """Height of the map in world pixels"""
+        return self.map_height * grid_size
+
+    def setup(self):
+        """Create the farm tiles and the starting owned area, barn and seed bin"""
+        # Shared array storage for tile state, weeds and nutrients
+        self.farm_grid = FarmGrid(self.map_width, self.map_height)
+        tiles = []
+        for i in range(self.map_width):
+            for j in range(self.map_height):
+                tiles.append(FarmTile(i * grid_size, j * grid_size, self.farm_grid))
+
+        # Center the owned area in the farm grid
+        center_grid_x = self.map_width // 2
+        center_grid_y = self.map_height // 2
+
+        # Set owned tiles: 6 columns in center for middle row and row below
+        for tile in tiles:
+            tile_grid_x = tile.x // grid_size
+            tile_grid_y = tile.y // grid_size
+            # Create 6x2 area of owned tiles in the center (6 columns, 2 rows)
+            # Middle row and the row below it
+            if (center_grid_x - 2 <= tile_grid_x <= center_grid_x + 3 and
+                center_grid_y <= tile_grid_y <= center_grid_y + 1):
+                tile.set_state(TILE_OWNED)
+
+                # Add carrot seed bin at the end of the first owned row (rightmost position)
+                if (tile_grid_x == center_grid_x + 3 and tile_grid_y == center_grid_y):
+                    tile.build_structure(BUILDING_SEED_BIN)
+                    tile.store_crop("Carrot", 20)  # Start with 20 carrot seeds
+
+                # Add barn as second to last tile of the first owned row
+                elif (tile_grid_x == center_grid_x + 2 and tile_grid_y == center_grid_y):
+                    tile.set_state(TILE_BARN)
+                    tile.building_type = BUILDING_BARN
+
+        self.farm_tiles = tiles
+        self.build_tile_index()
+        return tiles
+
+    def build_tile_index(self):
+        """Rebuild the (column, row) lookup grid from the current farm tiles"""
+        if not self.farm_tiles:
+            self.tile_grid = None
+            self.grid_width = 0
+            self.grid_height = 0
+            self.row_index = None
+            self.storage_index.clear()
+            return
+
+        self.grid_width = max(int(tile.x // grid_size) for tile in self.farm_tiles) + 1
+        self.grid_height = max(int(tile.y // grid_size) for tile in self.farm_tiles) + 1
+        self.tile_grid = [[None] * self.grid_height for _ in range(self.grid_width)]
+        for tile in self.farm_tiles:
+            self.tile_grid[int(tile.x // grid_size)][int(tile.y // grid_size)] = tile
+            tile.farm = self
+
+        self.row_index = FarmRowIndex(self.grid_width, self.grid_height)
+        self.row_index.build(self.tile_grid)
+        self.storage_index.rebuild(self.farm_tiles)
+
+    def on_tile_state_changed(self, tile, old_state, new_state):
+        """Keep the row index in sync when a tile changes state"""
+        if self.row_index is not None:
+            self.row_index.on_tile_state_changed(
+                int(tile.x // grid_size), int(tile.y // grid_size), old_state, new_state
+            )
+
+    def get_tile_at_grid(self, col, row):
+        """Get the farm tile at the given column and row"""
+        if self.tile_grid is None:
+            return None
+        if 0 <= col < self.grid_width and 0 <= row < self.grid_height:
+            return self.tile_grid[col][row]
+        return None
+
+    def get_tile_at_position(self, grid_x, grid_y):
+        """Get the farm tile at the given grid position"""
+        if grid_x < 0 or grid_y < 0:
+            return None
+        return self.get_tile_at_grid(int(grid_x // grid_size), int(grid_y // grid_size))
+
+    def daily_soil_tick(self):
+        """Run the day-rollover soil update (weed growth, capping) over all farmed tiles at once"""
+        if self.farm_grid is None:
+            return {'tiles_affected': 0, 'total_growth': 0.0, 'mean_growth': 0.0}
+        return self.farm_grid.daily_soil_tick(FARMED_STATES, self.soil_rng)
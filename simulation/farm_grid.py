@@ -0,0 +1,120 @@
+"""
+Farm Grid - Struct-of-arrays storage for per-tile state, weeds and soil nutrients
+"""
+from collections.abc import MutableMapping
+import numpy as np
+
+# Order of the nutrient planes in FarmGrid.nutrients
+NUTRIENT_KEYS = ('nitrogen', 'phosphorus', 'potassium', 'calcium', 'magnesium', 'sulfur', 'water')
+NUTRIENT_INDEX = {name: i for i, name in enumerate(NUTRIENT_KEYS)}
+
+
+class FarmGrid:
+    """Holds tile data as contiguous arrays indexed [row, column] so whole-farm passes can be vectorized"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.state = np.zeros((height, width), dtype=np.uint8)
+        self.nutrients = np.zeros((len(NUTRIENT_KEYS), height, width), dtype=np.float64)
+        self.weeds = np.zeros((height, width), dtype=np.float64)
+        # Change tracking: every write stamps the tile with a new revision number, so any
+        # consumer (overlays, saves, tooltips) can ask what changed since the revision it last saw
+        self.revision = 0
+        self.tile_revision = np.zeros((height, width), dtype=np.int64)
+
+    def touch(self, col, row):
+        """Record that one tile's data changed"""
+        self.revision += 1
+        self.tile_revision[row, col] = self.revision
+
+    def touch_mask(self, mask):
+        """Record that every tile in a boolean [row, column] mask changed"""
+        self.revision += 1
+        self.tile_revision[mask] = self.revision
+
+    def changed_since(self, revision):
+        """Get a boolean [row, column] mask of tiles changed after the given revision"""
+        return self.tile_revision > revision
+
+    def nutrient_layer(self, nutrient):
+        """Get the [row, column] array for a single nutrient"""
+        return self.nutrients[NUTRIENT_INDEX[nutrient]]
+
+    def state_mask(self, states):
+        """Get a boolean [row, column] mask of tiles in any of the given states"""
+        return np.isin(self.state, states)
+
+    def daily_soil_tick(self, farmed_states, rng, weed_growth_min=0.5, weed_growth_max=5.0,
+                        weed_cap=50.0, nutrient_drift=None):
+        """Grow weeds (and optionally drift nutrients) on every farmed tile in one vectorized pass
+
+        nutrient_drift is an optional sequence of per-day deltas in NUTRIENT_KEYS order.
+        Returns aggregate stats: tiles_affected, total_growth and mean_growth.
+        """
+        farmed = self.state_mask(farmed_states)
+        tiles_affected = int(np.count_nonzero(farmed))
+        if tiles_affected == 0:
+            return {'tiles_affected': 0, 'total_growth': 0.0, 'mean_growth': 0.0}
+
+        growth = rng.uniform(weed_growth_min, weed_growth_max, size=tiles_affected)
+        self.weeds[farmed] = np.minimum(weed_cap, self.weeds[farmed] + growth)
+        self.touch_mask(farmed)
+
+        if nutrient_drift is not None:
+            drift = np.asarray(nutrient_drift, dtype=self.nutrients.dtype)[:, np.newaxis]
+            self.nutrients[:, farmed] = np.maximum(0.0, self.nutrients[:, farmed] + drift)
+
+        total_growth = float(growth.sum())
+        return {
+            'tiles_affected': tiles_affected,
+            'total_growth': total_growth,
+            'mean_growth': total_growth / tiles_affected,
+        }
+
+    def tile_nutrients(self, col, row):
+        """Get a dict-like view of one tile's nutrients"""
+        return TileNutrients(self, col, row)
+
+
+class TileNutrients(MutableMapping):
+    """Dict-like view of one tile's nutrients backed by FarmGrid.nutrients"""
+
+    __slots__ = ('_grid', '_col', '_row')
+
+    def __init__(self, grid, col, row):
+        self._grid = grid
+        self._col = col
+        self._row = row
+
+    def __getitem__(self, nutrient):
+        return float(self._grid.nutrients[NUTRIENT_INDEX[nutrient], self._row, self._col])
+
+    def __setitem__(self, nutrient, value):
+        self._grid.nutrients[NUTRIENT_INDEX[nutrient], self._row, self._col] = value
+        self._grid.touch(self._col, self._row)
+
+    def __delitem__(self, nutrient):
+        raise TypeError("Tile nutrients cannot be removed")
+
+    def __iter__(self):
+        return iter(NUTRIENT_KEYS)
+
+    def __len__(self):
+        return len(NUTRIENT_KEYS)
+
+    def __contains__(self, nutrient):
+        return nutrient in NUTRIENT_INDEX
+
+    def copy(self):
+        """Get a plain dict snapshot of the nutrient levels"""
+        return dict(self.items())
+
+    def update_from(self, values):
+        """Set nutrient levels from a dict, ignoring unknown keys"""
+        for nutrient, value in values.items():
+            if nutrient in NUTRIENT_INDEX:
+                self[nutrient] = value
+
+    def __repr__(self):
+        return repr(self.copy())
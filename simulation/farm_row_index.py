@@ -0,0 +1,69 @@
+"""
+Farm Row Index - Per-row tile state lookup for tractor row scans
+"""
+from bisect import bisect_left, insort
+
+
+class FarmRowIndex:
+    """Keeps a sorted list of columns for every (state, row) pair so row queries don't scan the farm"""
+
+    def __init__(self, grid_width, grid_height):
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self._columns = {}  # {state: [sorted columns for row 0, row 1, ...]}
+
+    def _rows_for_state(self, state):
+        """Get (creating if needed) the per-row column lists for a state"""
+        rows = self._columns.get(state)
+        if rows is None:
+            rows = [[] for _ in range(self.grid_height)]
+            self._columns[state] = rows
+        return rows
+
+    def build(self, tile_grid):
+        """Rebuild the index from a tile_grid[column][row] lookup"""
+        self._columns = {}
+        for col in range(self.grid_width):
+            for row in range(self.grid_height):
+                tile = tile_grid[col][row]
+                if tile is not None:
+                    # Columns are visited in order, so a plain append keeps each list sorted
+                    self._rows_for_state(tile.state)[row].append(col)
+
+    def on_tile_state_changed(self, col, row, old_state, new_state):
+        """Move a tile's column from its old state list to its new one"""
+        if not (0 <= row < self.grid_height):
+            return
+        if old_state is not None:
+            columns = self._rows_for_state(old_state)[row]
+            index = bisect_left(columns, col)
+            if index < len(columns) and columns[index] == col:
+                columns.pop(index)
+        insort(self._rows_for_state(new_state)[row], col)
+
+    def next_column(self, row, start_col, states):
+        """Get the first column >= start_col in this row whose tile is in one of the states, or None"""
+        if not (0 <= row < self.grid_height):
+            return None
+        best = None
+        for state in states:
+            rows = self._columns.get(state)
+            if rows is None:
+                continue
+            columns = rows[row]
+            index = bisect_left(columns, start_col)
+            if index < len(columns) and (best is None or columns[index] < best):
+                best = columns[index]
+        return best
+
+    def has_state_in_row(self, row, start_col, states):
+        """Check if any tile at or after start_col in this row is in one of the states"""
+        return self.next_column(row, start_col, states) is not None
+
+    def continues_before(self, row, start_col, states, stop_states):
+        """Check if a tile in one of the states appears at or after start_col before any stop-state tile"""
+        found = self.next_column(row, start_col, states)
+        if found is None:
+            return False
+        stop = self.next_column(row, start_col, stop_states)
+        return stop is None or found < stop
@@ -1,23 +1,36 @@
-import pyglet
 import random
-import time
-from constants import (
-    grid_size, forest_image, farm_tile_image, tilled_image, crop_images,
-    barn_image, seed_bin_image, seeds_config, TILE_UNOWNED, TILE_OWNED,
-    TILE_TILLED, TILE_PLANTED, TILE_GROWING, TILE_READY_HARVEST,
-    TILE_BARN, TILE_SEED_BIN, BUILDING_BARN, BUILDING_SEED_BIN,
-    background_group, icon_group, icon_batch, ui_batch
+from simulation.config import (
+    grid_size, TILE_UNOWNED, TILE_OWNED, TILE_TILLED, TILE_PLANTED, TILE_GROWING, TILE_READY_HARVEST
 )
-from farm_tile_crop_manager import FarmTileCropManager
-from farm_tile_nutrient_manager import FarmTileNutrientManager
-from farm_tile_building_manager import FarmTileBuildingManager
-from farm_tile_visual_manager import FarmTileVisualManager
+from simulation.farm_tile_crop_manager import FarmTileCropManager
+from simulation.farm_tile_nutrient_manager import FarmTileNutrientManager
+from simulation.farm_tile_building_manager import FarmTileBuildingManager
+from simulation.farm_grid import FarmGrid
+
+
 class FarmTile:
-    def __init__(self, x, y, batch):
+    """One farm tile's simulation state; a renderer can attach a view to draw it
+
+    The view (None when running headless) is told when the tile's state, crop, storage or
+    water changes through set_state, update_crop, update_growth_scale, update_seed_icon and
+    update_visual_appearance.
+    """
+
+    def __init__(self, x, y, grid=None):
         self.x = x
         self.y = y
-        self.state = TILE_UNOWNED
-        self.batch = batch
+        # Tile data lives in a shared FarmGrid; a standalone tile gets its own 1x1 grid
+        if grid is None:
+            grid = FarmGrid(1, 1)
+            self.col = 0
+            self.row = 0
+        else:
+            self.col = int(x // grid_size)
+            self.row = int(y // grid_size)
+        self.grid = grid
+        self.farm = None  # Set by Farm when the tile is indexed
+        self.view = None  # Set by the renderer; stays None for headless simulation
+        self.grid.state[self.row, self.col] = TILE_UNOWNED
 
         # Initialize weeds property
         self.weeds = random.randint(0, 3)  # Start with 0-3 weeds randomly
@@ -26,10 +39,32 @@ class FarmTile:
         self.crop_manager = FarmTileCropManager(self)
         self.nutrient_manager = FarmTileNutrientManager(self)
         self.building_manager = FarmTileBuildingManager(self)
-        self.visual_manager = FarmTileVisualManager(self)
 
-        # Set initial visual state
-        self.visual_manager.set_state(TILE_UNOWNED)
+    @property
+    def state(self):
+        return int(self.grid.state[self.row, self.col])
+
+    @state.setter
+    def state(self, value):
+        old_state = int(self.grid.state[self.row, self.col])
+        self.grid.state[self.row, self.col] = value
+        if old_state != value:
+            self.grid.touch(self.col, self.row)
+            if self.farm is not None:
+                self.farm.on_tile_state_changed(self, old_state, value)
+
+    @property
+    def weeds(self):
+        return float(self.grid.weeds[self.row, self.col])
+
+    @weeds.setter
+    def weeds(self, value):
+        self.grid.weeds[self.row, self.col] = value
+        self.grid.touch(self.col, self.row)
+
+    def mark_changed(self):
+        """Record that this tile's saved data changed (crop, building or storage)"""
+        self.grid.touch(self.col, self.row)
 
     # Properties for backward compatibility
     @property
@@ -47,6 +82,8 @@ class FarmTile:
     @building_type.setter
     def building_type(self, value):
         self.building_manager.building_type = value
+        self.building_manager.update_index()
+        self.mark_changed()
 
     @property
     def stored_crop_type(self):
@@ -59,6 +96,8 @@ class FarmTile:
     @stored_amount.setter
     def stored_amount(self, value):
         self.building_manager.stored_amount = value
+        self.building_manager.update_index()
+        self.mark_changed()
 
     @property
     def building_capacity(self):
@@ -67,14 +106,15 @@ class FarmTile:
     @building_capacity.setter
     def building_capacity(self, value):
         self.building_manager.building_capacity = value
+        self.mark_changed()
 
     @property
     def seed_icon_sprite(self):
-        return self.building_manager.seed_icon_sprite
+        return self.view.seed_icon_sprite if self.view is not None else None
 
     @property
     def crop_sprite(self):
-        return self.crop_manager.crop_sprite
+        return self.view.crop_sprite if self.view is not None else None
         
     def plant_crop(self, crop_name):
         return self.crop_manager.plant_crop(crop_name)
@@ -108,7 +148,9 @@ class FarmTile:
         return self.building_manager.upgrade_barn(game_state)
     
     def set_state(self, new_state):
-        self.visual_manager.set_state(new_state)
+        self.state = new_state
+        if self.view is not None:
+            self.view.set_state(new_state)
     
     def cultivate_weeds(self):
         """Reduce weeds to 0 on farmed tiles"""
@@ -124,7 +166,6 @@ class FarmTile:
         """Grow weeds by 0.5-5 per day on farmed tiles (owned, tilled, planted, or harvestable)"""
         # Only grow weeds on owned/farmed tiles, not forests or buildings
         if self.state in [TILE_OWNED, TILE_TILLED, TILE_PLANTED, TILE_GROWING, TILE_READY_HARVEST]:
-            import random
             # Generate random weed growth between 0.5 and 5.0
             weed_growth = random.uniform(0.5, 5.0)
             self.weeds += weed_growth
@@ -134,5 +175,6 @@ class FarmTile:
         return 0
     
     def update_visual_appearance(self):
-        self.visual_manager.update_visual_appearance()
+        if self.view is not None:
+            self.view.update_visual_appearance()
 
@@ -1,7 +1,5 @@
-import pyglet
-from constants import (
-    grid_size, crop_images, ui_batch, TILE_BARN, TILE_SEED_BIN,
-    BUILDING_BARN, BUILDING_SEED_BIN, game_config, TILE_OWNED
+from simulation.config import (
+    TILE_BARN, TILE_SEED_BIN, BUILDING_BARN, BUILDING_SEED_BIN, game_config, TILE_OWNED
 )
 
 
@@ -15,7 +13,6 @@ class FarmTileBuildingManager:
         self.previous_seed_type = None
         self.stored_amount = 0
         self.building_capacity = 50  # Default capacity for buildings
-        self.seed_icon_sprite = None
 
     def build_structure(self, building_type):
         """Build a structure on this tile"""
@@ -28,6 +25,7 @@ class FarmTileBuildingManager:
                 self.tile.state = TILE_SEED_BIN
                 self.building_capacity = 50  # Seed bins hold less
             self.tile.set_state(self.tile.state)
+            self.update_index()
             return True
         return False
 
@@ -49,10 +47,11 @@ class FarmTileBuildingManager:
         if amount_to_store > 0:
             if self.stored_crop_type is None:
                 self.stored_crop_type = crop_type
-                # Create seed icon sprite for seed bins
-                if self.tile.state == TILE_SEED_BIN and crop_type in crop_images:
-                    self._create_seed_icon(crop_type)
+                # Seed bins show an icon of what they hold
+                self._update_view()
             self.stored_amount += amount_to_store
+            self.tile.mark_changed()
+            self.update_index()
             return amount_to_store
         return 0
 
@@ -69,45 +68,22 @@ class FarmTileBuildingManager:
         if self.stored_amount == 0:
             self.previous_seed_type = self.stored_crop_type  # Remember what was in here
             self.stored_crop_type = None
-            if self.seed_icon_sprite:
-                self.seed_icon_sprite.visible = False
-                self.seed_icon_sprite = None
+            self._update_view()
 
+        self.tile.mark_changed()
+        self.update_index()
         return crop_type, amount_to_remove
 
-    def _create_seed_icon(self, crop_type):
-        """Create and position seed icon sprite centered on the seed bin"""
-        if crop_type in crop_images:
-            # Remove existing seed icon if present
-            if self.seed_icon_sprite:
-                self.seed_icon_sprite.visible = False
-
-            # Create new seed icon sprite using ui_batch which draws last to ensure it's on top
-            try:
-                self.seed_icon_sprite = pyglet.sprite.Sprite(crop_images[crop_type], x=self.tile.x, y=self.tile.y, batch=ui_batch)
-            except Exception as e:
-                print(f"Error creating seed icon sprite for {crop_type}: {e}")
-                # Create sprite without batch as fallback
-                self.seed_icon_sprite = pyglet.sprite.Sprite(crop_images[crop_type], x=self.tile.x, y=self.tile.y)
-
-            # Scale the icon to be 80% of the tile height
-            icon_size = grid_size * 0.8
-            self.seed_icon_sprite.scale_x = icon_size / self.seed_icon_sprite.width
-            self.seed_icon_sprite.scale_y = icon_size / self.seed_icon_sprite.height
-
-            # Center the icon on the tile
-            # Position sprite so its center aligns with tile center
-            self.seed_icon_sprite.x = self.tile.x + (grid_size - icon_size) / 2
-            self.seed_icon_sprite.y = self.tile.y + (grid_size - icon_size) / 2
-
-            # Make icon visible
-            self.seed_icon_sprite.visible = True
-
-            # Apply current color state
-            water_level = self.tile.nutrient_manager.get_nutrient_level('water')
-            should_darken = water_level > 100
-            dark_color = (217, 217, 217) if should_darken else (255, 255, 255)
-            self.seed_icon_sprite.color = dark_color
+    def update_index(self):
+        """Keep the farm's storage index in step after the building or its contents changed"""
+        farm = self.tile.farm
+        if farm is not None:
+            farm.storage_index.sync(self.tile)
+
+    def _update_view(self):
+        """Let the tile's view (if any) redraw the seed bin icon"""
+        if self.tile.view is not None:
+            self.tile.view.update_seed_icon()
 
     def upgrade_seed_bin(self, game_state):
         """Upgrade seed bin capacity if possible"""
@@ -132,6 +108,7 @@ class FarmTileBuildingManager:
         if game_state.spend_money(upgrade_cost):
             old_capacity = self.building_capacity
             self.building_capacity = min(self.building_capacity + upgrade_amount, max_capacity)
+            self.tile.mark_changed()
             actual_increase = self.building_capacity - old_capacity
             print(f"Upgraded seed bin capacity from {old_capacity} to {self.building_capacity} (+{actual_increase}) for ${upgrade_cost}")
             return True
@@ -161,6 +138,7 @@ class FarmTileBuildingManager:
         if game_state.spend_money(upgrade_cost):
             old_capacity = self.building_capacity
             self.building_capacity = min(self.building_capacity + upgrade_amount, max_capacity)
+            self.tile.mark_changed()
             actual_increase = self.building_capacity - old_capacity
             print(f"Upgraded barn capacity from {old_capacity} to {self.building_capacity} (+{actual_increase}) for ${upgrade_cost}")
             return True
@@ -0,0 +1,167 @@
+import time
+from simulation.config import (
+    TILE_PLANTED, TILE_READY_HARVEST, TILE_OWNED, TILE_TILLED,
+    BUILDING_BARN, BUILDING_SEED_BIN, TILE_BARN, TILE_SEED_BIN
+)
+from simulation.catalog import SEEDS, get_seed
+
+
+class FarmTileCropManager:
+    """Manages crop planting, growth, and harvesting for a farm tile"""
+
+    def __init__(self, tile):
+        self.tile = tile
+        self.crop_type = None
+        self.plant_time = None
+        self.growth_time = 0
+        self.current_scale = 0.5  # Current visual scale (0.5 to 1.0)
+
+    def plant_crop(self, crop_name):
+        """Plant a crop on the tile"""
+        if self.tile.state == TILE_TILLED and crop_name in SEEDS:
+            self.crop_type = crop_name
+            self.plant_time = self._now()
+
+            self.current_scale = 0.5
+
+            self.growth_time = SEEDS[crop_name]['growth_time']
+
+            self.tile.set_state(TILE_PLANTED)
+            self._update_view()
+
+            scheduler = self._growth_scheduler()
+            if scheduler is not None:
+                scheduler.register(self.tile)
+            return True
+        return False
+
+    def _growth_scheduler(self):
+        """Get the farm's growth scheduler, if this tile belongs to a managed farm"""
+        farm = self.tile.farm
+        return farm.growth_scheduler if farm is not None else None
+
+    def _now(self):
+        """Get the current game time from the farm's clock (wall time for a standalone tile)"""
+        farm = self.tile.farm
+        return farm.clock.now if farm is not None else time.time()
+
+    def _update_view(self):
+        """Let the tile's view (if any) redraw the crop"""
+        if self.tile.view is not None:
+            self.tile.view.update_crop()
+
+    def update_growth(self):
+        """Update crop growth progress"""
+        if self.tile.state == TILE_PLANTED and self.plant_time is not None:
+            now = self._now()
+            elapsed = (now - self.plant_time) * 1000  # Convert to milliseconds
+            if elapsed >= self.growth_time:
+                self.mark_ready_for_harvest(now)
+            else:
+                self.update_growth_scale(now)
+
+    def mark_ready_for_harvest(self, now=None):
+        """Switch a planted crop to its ready-for-harvest state and full-size crop icon"""
+        if self.tile.state != TILE_PLANTED or self.plant_time is None:
+            return
+        if now is None:
+            now = self._now()
+        elapsed = (now - self.plant_time) * 1000
+
+        scheduler = self._growth_scheduler()
+        if scheduler is not None:
+            scheduler.unregister(self.tile)
+
+        self.tile.state = TILE_READY_HARVEST
+        self.current_scale = 1.0
+        print(f"🌱 {self.crop_type} crop is ready for harvest! (grew in {elapsed:.1f}ms)")
+        # Switch to the full-size crop icon when ready for harvest
+        self._update_view()
+
+    def update_growth_scale(self, now=None):
+        """Update the visual growth scale of a crop that is still growing"""
+        if self.tile.state != TILE_PLANTED or self.plant_time is None or not self.growth_time:
+            return
+        if now is None:
+            now = self._now()
+        elapsed = (now - self.plant_time) * 1000
+        growth_progress = min(1.0, elapsed / self.growth_time)
+        self.current_scale = 0.5 + (growth_progress * 0.5)  # Scale from 0.5 to 1.0
+
+        if self.tile.view is not None:
+            self.tile.view.update_growth_scale()
+
+    def harvest(self, nutrient_manager):
+        """Harvest the crop if ready"""
+        if self.tile.state == TILE_READY_HARVEST and self.crop_type:
+            # Base harvest amount is 1
+            amount = 1
+
+            # Find seed data for nutrient checks
+            seed_data = get_seed(self.crop_type)
+
+            # Check if nutrients meet doubling thresholds
+            if seed_data and nutrient_manager.check_nutrient_doubling_bonus(seed_data):
+                amount *= 2
+                print(f"🌟 Nutrient bonus! {self.crop_type} harvest doubled to {amount} units!")
+
+            # Consume nutrients based on crop requirements
+            if seed_data:
+                nutrient_manager.consume_nutrients_for_harvest(seed_data)
+
+            # Clear crop
+            scheduler = self._growth_scheduler()
+            if scheduler is not None:
+                scheduler.unregister(self.tile)
+            crop_name = self.crop_type
+            self.crop_type = None
+            self.plant_time = None
+            self.growth_time = 0
+            self._update_view()
+
+            # Restore tile state: if there's a building, show it; otherwise owned
+            if self.tile.building_manager.building_type == BUILDING_BARN:
+                self.tile.set_state(TILE_BARN)
+            elif self.tile.building_manager.building_type == BUILDING_SEED_BIN:
+                self.tile.set_state(TILE_SEED_BIN)
+            else:
+                self.tile.set_state(TILE_OWNED)
+
+            return crop_name, amount
+        return None, 0
+
+    def get_crop_type(self):
+        """Get the current crop type"""
+        return self.crop_type
+
+    def has_crop_sprite(self):
+        """Check if crop sprite exists"""
+        return self.tile.crop_sprite is not None
+
+    def restore_crop_state(self, crop_type, growth_time, plant_time, tile_state, current_scale=None):
+        """Restore crop state from saved data without resetting plant time"""
+        if crop_type:
+            self.crop_type = crop_type
+            self.growth_time = growth_time
+            self.plant_time = plant_time
+            
+            # Set current scale (default based on tile state if not provided)
+            if current_scale is not None:
+                self.current_scale = current_scale
+            elif tile_state == TILE_READY_HARVEST:
+                self.current_scale = 1.0
+            else:
+                self.current_scale = 0.5
+            
+            self._update_view()
+
+            # Track growing crops so they become harvestable on time
+            scheduler = self._growth_scheduler()
+            if scheduler is not None:
+                scheduler.unregister(self.tile)
+                if tile_state == TILE_PLANTED:
+                    scheduler.register(self.tile)
+            
+            return True
+        return False
+
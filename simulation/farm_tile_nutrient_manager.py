@@ -1,5 +1,8 @@
 import random
-from constants import game_config
+import numpy as np
+from simulation.config import game_config
+from simulation.farm_grid import NUTRIENT_KEYS
+from simulation.catalog import CROP_IDS, CROP_NUTRIENT_USE, CROP_NUTRIENT_DOUBLE
 
 
 class FarmTileNutrientManager:
@@ -9,6 +12,15 @@ class FarmTileNutrientManager:
         self.tile = tile
         self.nutrients = self._initialize_nutrients()
 
+    @property
+    def nutrients(self):
+        """Dict-like view of this tile's nutrients in the shared FarmGrid"""
+        return self.tile.grid.tile_nutrients(self.tile.col, self.tile.row)
+
+    @nutrients.setter
+    def nutrients(self, values):
+        self.tile.grid.tile_nutrients(self.tile.col, self.tile.row).update_from(values)
+
     def _initialize_nutrients(self):
         """Initialize nutrients with random variation"""
         default_nutrients = game_config.get('default_tile_nutrients', {
@@ -28,44 +40,32 @@ class FarmTileNutrientManager:
 
         return nutrients
 
+    def _soil_vector(self):
+        """This tile's nutrient levels as a view into the shared FarmGrid, in NUTRIENT_KEYS order"""
+        return self.tile.grid.nutrients[:, self.tile.row, self.tile.col]
+
     def check_nutrient_doubling_bonus(self, seed_data):
         """Check if soil nutrients meet the doubling thresholds for this crop"""
-        nutrient_keys = ['nitrogen', 'phosphorus', 'potassium', 'calcium', 'magnesium', 'sulfur', 'water']
-
-        for nutrient in nutrient_keys:
-            double_key = f"{nutrient}_double"
-            if double_key in seed_data:
-                required_amount = seed_data[double_key]
-                current_amount = self.nutrients.get(nutrient, 0)
-
-                if current_amount < required_amount:
-                    return False  # One nutrient is insufficient
-
-        return True  # All nutrients meet the doubling threshold
+        crop_id = CROP_IDS[seed_data['name']]
+        return bool(np.all(self._soil_vector() >= CROP_NUTRIENT_DOUBLE[crop_id]))
 
     def consume_nutrients_for_harvest(self, seed_data):
         """Consume nutrients from soil during harvest based on crop requirements"""
-        nutrient_keys = ['nitrogen', 'phosphorus', 'potassium', 'calcium', 'magnesium', 'sulfur', 'water']
-        nutrients_consumed = []
-
-        for nutrient in nutrient_keys:
-            use_key = f"{nutrient}_use"
-            if use_key in seed_data:
-                consumption = seed_data[use_key]
-                if consumption > 0:
-                    # Consume nutrients, but don't go below 0
-                    old_amount = self.nutrients.get(nutrient, 0)
-                    self.nutrients[nutrient] = max(0, old_amount - consumption)
-                    actual_consumed = old_amount - self.nutrients[nutrient]
-                    if actual_consumed > 0:
-                        nutrients_consumed.append(f"{nutrient}-{actual_consumed}")
-
+        crop_id = CROP_IDS[seed_data['name']]
+        soil = self._soil_vector()
+        old_levels = soil.copy()
+        # Consume nutrients, but don't go below 0
+        np.maximum(0, old_levels - CROP_NUTRIENT_USE[crop_id], out=soil)
+        self.tile.grid.touch(self.tile.col, self.tile.row)
+
+        consumed = old_levels - soil
+        nutrients_consumed = [f"{NUTRIENT_KEYS[i]}-{consumed[i]}" for i in np.flatnonzero(consumed > 0)]
         if nutrients_consumed:
             nutrients_summary = ", ".join(nutrients_consumed)
             print(f"  Nutrients consumed by {seed_data['name']}: {nutrients_summary}")
 
         # Update visual appearance after nutrient consumption
-        self.tile.visual_manager.update_visual_appearance()
+        self.tile.update_visual_appearance()
 
     def get_nutrient_level(self, nutrient):
         """Get the current level of a specific nutrient"""
@@ -0,0 +1,370 @@
+"""
+Finance System - Tracks all spending and income in the game
+"""
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from collections import defaultdict, deque
+from itertools import islice
+
+
+class TransactionType:
+    # Income types
+    CROP_SALE = "crop_sale"
+    INITIAL_MONEY = "initial_money"
+    
+    # Expense types
+    TILE_PURCHASE = "tile_purchase"
+    SEED_PURCHASE = "seed_purchase"
+    FERTILIZER_PURCHASE = "fertilizer_purchase"
+    BUILDING_CONSTRUCTION = "building_construction"
+    TRACTOR_UPGRADE = "tractor_upgrade"
+
+
+class Transaction:
+    """Represents a single financial transaction"""
+    
+    def __init__(self, transaction_type, amount, description="", metadata=None):
+        self.timestamp = time.time()
+        self.datetime = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.transaction_type = transaction_type
+        self.amount = amount  # Positive for income, negative for expenses
+        self.description = description
+        self.metadata = metadata or {}  # Additional data (crop type, location, etc.)
+        
+    def to_dict(self):
+        """Convert transaction to dictionary for saving"""
+        return {
+            'timestamp': self.timestamp,
+            'datetime': self.datetime,
+            'type': self.transaction_type,
+            'amount': self.amount,
+            'description': self.description,
+            'metadata': self.metadata
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Create transaction from dictionary"""
+        transaction = cls(
+            data['type'],
+            data['amount'],
+            data.get('description', ''),
+            data.get('metadata', {})
+        )
+        transaction.timestamp = data['timestamp']
+        transaction.datetime = data['datetime']
+        return transaction
+
+
+class Finance:
+    """Main finance tracking system
+
+    Only the most recent transactions are kept in memory; older ones are appended to the on-disk
+    ledger of the save the game belongs to (set by the save manager), and wait in memory until the
+    game has one. Totals are kept as running sums, so reports cost the same however long the game runs.
+    """
+    
+    def __init__(self, starting_money=1000, recent_limit=1000, ledger_path=None):
+        self.starting_money = starting_money
+        self.current_money = 0  # Start at 0, will be set by initial transaction
+        self.recent_limit = recent_limit
+        self.ledger_path = ledger_path
+        self.transactions = deque(maxlen=recent_limit)  # Most recent transactions only
+        self._ledger_buffer = []  # Evicted transactions waiting to be appended to the ledger
+        self.daily_stats = defaultdict(lambda: {'income': 0, 'expenses': 0})
+        self._reset_totals()
+        
+        # Record initial money
+        self.add_transaction(TransactionType.INITIAL_MONEY, starting_money, "Starting funds")
+    
+    def _reset_totals(self):
+        """Clear the running totals"""
+        self.transaction_count = 0  # Every transaction ever recorded, including ones in the ledger
+        self.total_income = 0
+        self.total_expenses = 0
+        # Track spending by category
+        self.category_totals = defaultdict(float)  # abs(amount) of every transaction per type
+        self.spending_by_category = defaultdict(float)  # Expenses only
+    
+    def _count_transaction(self, transaction):
+        """Add one transaction to the running totals"""
+        amount = transaction.amount
+        self.transaction_count += 1
+        self.category_totals[transaction.transaction_type] += abs(amount)
+        
+        # Update daily stats
+        date_key = datetime.fromtimestamp(transaction.timestamp).strftime("%Y-%m-%d")
+        if amount > 0:
+            self.total_income += amount
+            self.daily_stats[date_key]['income'] += amount
+        else:
+            self.daily_stats[date_key]['expenses'] += abs(amount)
+            if amount < 0:
+                self.total_expenses += -amount
+                self.spending_by_category[transaction.transaction_type] += -amount
+    
+    def _remember_transaction(self, transaction):
+        """Keep a transaction in memory, moving the oldest one to the ledger when the ring is full"""
+        if len(self.transactions) == self.recent_limit:
+            self._ledger_buffer.append(self.transactions[0])
+            if len(self._ledger_buffer) >= 100:
+                self.flush_ledger()
+        self.transactions.append(transaction)
+        
+    def add_transaction(self, transaction_type, amount, description="", metadata=None):
+        """Add a new transaction and update balances"""
+        transaction = Transaction(transaction_type, amount, description, metadata)
+        self._remember_transaction(transaction)
+        
+        # Update current money
+        self.current_money += amount
+        
+        self._count_transaction(transaction)
+            
+        return transaction
+    
+    def flush_ledger(self):
+        """Append transactions evicted from memory to the on-disk ledger, if the game has one yet"""
+        if not self._ledger_buffer or not self.ledger_path:
+            return
+        try:
+            with open(self.ledger_path, 'a') as f:
+                f.write(''.join(json.dumps(t.to_dict()) + '\n' for t in self._ledger_buffer))
+        except OSError as e:
+            print(f"Error writing finance ledger: {e}")
+            return
+        self._ledger_buffer = []
+    
+    def set_ledger_path(self, ledger_path):
+        """Keep the ledger at ledger_path from now on (e.g. next to a new save file), carrying over what is on disk"""
+        if ledger_path == self.ledger_path:
+            return
+        try:
+            if self.ledger_path and os.path.exists(self.ledger_path):
+                shutil.copyfile(self.ledger_path, ledger_path)
+            else:
+                # Nothing spilled yet; drop any ledger an earlier game left at this path
+                open(ledger_path, 'w').close()
+        except OSError as e:
+            print(f"Error moving finance ledger: {e}")
+            return
+        self.ledger_path = ledger_path
+    
+    def get_ledger_size(self):
+        """Get the size in bytes of the on-disk ledger (saves record it to know which transactions it holds)"""
+        if not self.ledger_path:
+            return 0
+        try:
+            return os.path.getsize(self.ledger_path)
+        except OSError:
+            return 0
+    
+    def can_afford(self, cost):
+        """Check if we can afford a purchase"""
+        return self.current_money >= cost
+    
+    def spend_money(self, amount, transaction_type, description="", metadata=None):
+        """Spend money and record transaction"""
+        if self.can_afford(amount):
+            self.add_transaction(transaction_type, -amount, description, metadata)
+            return True
+        return False
+    
+    def earn_money(self, amount, transaction_type, description="", metadata=None):
+        """Earn money and record transaction"""
+        self.add_transaction(transaction_type, amount, description, metadata)
+        return True
+    
+    def get_balance(self):
+        """Get current money balance"""
+        return self.current_money
+    
+    def get_total_income(self):
+        """Get total income earned"""
+        return self.total_income
+    
+    def get_total_expenses(self):
+        """Get total expenses (as positive number)"""
+        return self.total_expenses
+    
+    def get_net_profit(self):
+        """Get net profit/loss"""
+        return self.total_income - self.total_expenses
+    
+    def get_transactions_by_type(self, transaction_type):
+        """Get the in-memory (recent) transactions of a specific type"""
+        return [t for t in self.transactions if t.transaction_type == transaction_type]
+    
+    def get_spending_by_category(self):
+        """Get spending breakdown by category"""
+        return dict(self.spending_by_category)
+    
+    def get_recent_transactions(self, count=10):
+        """Get most recent transactions, oldest first"""
+        recent = list(islice(reversed(self.transactions), count))
+        recent.reverse()
+        return recent
+    
+    def get_daily_summary(self, date=None):
+        """Get financial summary for a specific date (default: today)"""
+        if date is None:
+            date = datetime.now().strftime("%Y-%m-%d")
+        
+        return self.daily_stats.get(date, {'income': 0, 'expenses': 0})
+    
+    def get_financial_report(self):
+        """Generate a comprehensive financial report"""
+        report = {
+            'current_balance': self.current_money,
+            'starting_money': self.starting_money,
+            'total_income': self.get_total_income(),
+            'total_expenses': self.get_total_expenses(),
+            'net_profit': self.get_net_profit(),
+            'spending_by_category': self.get_spending_by_category(),
+            'transaction_count': self.transaction_count,
+            'recent_transactions': [t.to_dict() for t in self.get_recent_transactions(5)]
+        }
+        return report
+    
+    def get_totals(self):
+        """Get the running totals as a dictionary for saving"""
+        return {
+            'transaction_count': self.transaction_count,
+            'total_income': self.total_income,
+            'total_expenses': self.total_expenses,
+            'category_totals': dict(self.category_totals),
+            'spending_by_category': dict(self.spending_by_category),
+            'daily_stats': {date: dict(stats) for date, stats in self.daily_stats.items()}
+        }
+    
+    def get_save_data(self):
+        """Get financial data as a dictionary for saving (recent transactions plus running totals)"""
+        self.flush_ledger()
+        return {
+            'starting_money': self.starting_money,
+            'current_money': self.current_money,
+            'transactions': [t.to_dict() for t in self.transactions],
+            'totals': self.get_totals(),
+            'ledger_size': self.get_ledger_size(),
+            'created': datetime.now().isoformat(),
+            'version': '1.1'
+        }
+    
+    def get_transactions_since(self, count):
+        """Get transactions recorded after the first `count` (for incremental saves)
+
+        Returns None if some of them have already left memory for the ledger.
+        """
+        new_count = self.transaction_count - count
+        if new_count <= 0:
+            return []
+        if new_count > len(self.transactions):
+            return None
+        return list(islice(self.transactions, len(self.transactions) - new_count, None))
+    
+    def save_to_file(self, filename="finance_data.json"):
+        """Save financial data to file"""
+        data = self.get_save_data()
+        
+        try:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
+            return True
+        except Exception as e:
+            print(f"Error saving finance data: {e}")
+            return False
+    
+    def load_from_file(self, filename="finance_data.json"):
+        """Load financial data from file"""
+        try:
+            with open(filename, 'r') as f:
+                data = json.load(f)
+            
+            self.load_save_data(data)
+            return True
+        except FileNotFoundError:
+            print(f"Finance file {filename} not found, starting with fresh data")
+            return False
+        except Exception as e:
+            print(f"Error loading finance data: {e}")
+            return False
+    
+    def load_save_data(self, data, ledger_path=None):
+        """Restore financial data from a saved dictionary and rebuild the running totals
+
+        ledger_path is the ledger kept next to the save. It is cut back to what it held when the
+        save was written, so only transactions that were never spilled to it are appended again.
+        Without one, transactions that do not fit in memory wait until the game is saved.
+        """
+        self.starting_money = data.get('starting_money', 1000)
+        self.current_money = data.get('current_money', self.starting_money)
+        
+        # The ledger belongs to the game being replaced; anything still buffered for it is dropped
+        self._ledger_buffer = []
+        self.ledger_path = ledger_path
+        if ledger_path:
+            self._truncate_ledger(data.get('ledger_size', 0) if data.get('totals') is not None else 0)
+        
+        # Load transactions
+        self.transactions = deque(maxlen=self.recent_limit)
+        self.daily_stats = defaultdict(lambda: {'income': 0, 'expenses': 0})
+        self._reset_totals()
+        transactions = [Transaction.from_dict(t_data) for t_data in data.get('transactions', [])]
+        
+        totals = data.get('totals')
+        if totals is None:
+            # Saves from before running totals hold every transaction, so count them all once
+            for transaction in transactions:
+                self._count_transaction(transaction)
+                self._remember_transaction(transaction)
+        else:
+            self.transaction_count = totals['transaction_count']
+            self.total_income = totals['total_income']
+            self.total_expenses = totals['total_expenses']
+            self.category_totals.update(totals['category_totals'])
+            self.spending_by_category.update(totals['spending_by_category'])
+            for date, stats in totals['daily_stats'].items():
+                self.daily_stats[date] = dict(stats)
+            # Transactions from the save's delta log can overflow memory; those go to the ledger
+            for transaction in transactions:
+                self._remember_transaction(transaction)
+        self.flush_ledger()
+    
+    def _truncate_ledger(self, size):
+        """Cut the ledger back to its first size bytes (creating it if missing)"""
+        try:
+            with open(self.ledger_path, 'a') as f:
+                if f.tell() > size:
+                    f.truncate(size)
+        except OSError as e:
+            print(f"Error restoring finance ledger: {e}")
+    
+    def print_summary(self):
+        """Print a formatted financial summary"""
+        report = self.get_financial_report()
+        
+        print("="*50)
+        print("FINANCIAL SUMMARY")
+        print("="*50)
+        print(f"Current Balance: ${report['current_balance']:.2f}")
+        print(f"Starting Money:  ${report['starting_money']:.2f}")
+        print(f"Total Income:    ${report['total_income']:.2f}")
+        print(f"Total Expenses:  ${report['total_expenses']:.2f}")
+        print(f"Net Profit:      ${report['net_profit']:.2f}")
+        print(f"Transactions:    {report['transaction_count']}")
+        
+        print("\nSPENDING BY CATEGORY:")
+        print("-" * 30)
+        for category, amount in sorted(report['spending_by_category'].items()):
+            print(f"{category.replace('_', ' ').title():<20} ${amount:.2f}")
+        
+        print("\nRECENT TRANSACTIONS:")
+        print("-" * 30)
+        for t in report['recent_transactions']:
+            amount_str = f"${abs(t['amount']):.2f}"
+            sign = "+" if t['amount'] > 0 else "-"
+            print(f"{t['datetime'][:16]} {sign}{amount_str:<8} {t['description']}")
+
@@ -0,0 +1,143 @@
+"""
+Price Forecast - Monte Carlo percentile bands for future market prices, simulated across a process pool
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from simulation.config import game_config
+from simulation.catalog import CROP_IDS
+from simulation.market import step_prices
+
+# Percentiles reported for each crop and day: low, median, high
+FORECAST_PERCENTILES = (10, 50, 90)
+
+
+def simulate_price_paths(prices, trends, min_prices, max_prices, flip_chance, days, paths, seed):
+    """Simulate many futures of the market's daily update; returns prices as a [path, crop, day] array"""
+    rng = np.random.default_rng(seed)
+    path_prices = np.tile(prices, (paths, 1))
+    path_trends = np.tile(trends, (paths, 1))
+    result = np.empty((paths, len(prices), days), dtype=np.int32)
+    for day in range(days):
+        path_prices = step_prices(rng, path_prices, path_trends, min_prices, max_prices, flip_chance)
+        result[:, :, day] = path_prices
+    return result
+
+
+class PriceForecast:
+    """Percentile bands of simulated prices for the days after one market day"""
+
+    def __init__(self, market_day, percentiles, bands):
+        self.market_day = market_day
+        self.percentiles = percentiles
+        self.bands = bands  # [percentile, crop, day ahead], where day 0 is the market day's own price
+        self.days = bands.shape[2] - 1
+
+    def get_band(self, crop_name):
+        """Get a crop's [percentile, day ahead] prices (day 0 is today), or None for an unknown crop"""
+        crop_id = CROP_IDS.get(crop_name)
+        return self.bands[:, crop_id] if crop_id is not None else None
+
+    def get_range(self, crop_name):
+        """Get a crop's (low, median, high) price on the last forecast day"""
+        band = self.get_band(crop_name)
+        if band is None:
+            return None
+        return tuple(int(round(value)) for value in band[:, -1])
+
+
+class PriceForecaster:
+    """Runs Monte Carlo price forecasts in worker processes and caches the result per market day
+
+    Nothing here blocks: poll() collects finished work and starts a new forecast when the market
+    day moves on, and readers get the latest finished forecast (or None while the first is running).
+    """
+
+    def __init__(self, market, days=None, paths=None, workers=None, seed=None):
+        self.market = market
+        self.days = days if days is not None else game_config.get('forecast_days', 7)
+        self.paths = paths if paths is not None else game_config.get('forecast_paths', 4000)
+        if workers is None:
+            workers = game_config.get('forecast_workers', min(4, os.cpu_count() or 1))
+        self.workers = max(1, workers)
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.latest = None
+        self._forecast_key = None  # Market key the latest forecast was made from
+        self.version = 0  # Bumped whenever a new forecast lands, so readers know to refresh
+        self._executor = None
+        self._pending = None  # (market key, market day, start prices, futures) of the forecast being computed
+        self._failed_key = None
+
+    def _market_key(self):
+        """Identify the market day a forecast was started from (day numbers repeat, update times do not)"""
+        return (self.market.current_day, self.market.last_update)
+
+    def _job_args(self, chunks):
+        """Split the paths into chunks, each with a snapshot of the market and its own random seed"""
+        market = self.market
+        base = (market.price_array.copy(), market.trend_array.copy(), market.min_prices, market.max_prices,
+                market.trend_flip_chance, self.days)
+        sizes = [len(chunk) for chunk in np.array_split(np.arange(self.paths), chunks)]
+        seeds = self.seed_sequence.spawn(chunks)
+        return [base + (size, seed) for size, seed in zip(sizes, seeds) if size > 0]
+
+    def _finish(self, key, market_day, start_prices, chunks):
+        """Combine the simulated paths into percentile bands and publish them"""
+        paths = np.concatenate(chunks, axis=0)
+        future_bands = np.percentile(paths, FORECAST_PERCENTILES, axis=0)
+        today = np.broadcast_to(start_prices[:, np.newaxis], (len(FORECAST_PERCENTILES), len(start_prices), 1))
+        bands = np.concatenate((today, future_bands), axis=2)
+        self.latest = PriceForecast(market_day, FORECAST_PERCENTILES, bands)
+        self._forecast_key = key
+        self.version += 1
+
+    def poll(self):
+        """Collect a finished forecast and start the next one if the market day changed; returns version"""
+        if self._pending is not None:
+            key, market_day, start_prices, futures = self._pending
+            if not all(future.done() for future in futures):
+                return self.version
+            self._pending = None
+            try:
+                self._finish(key, market_day, start_prices, [future.result() for future in futures])
+            except Exception as e:
+                print(f"⚠️ Price forecast failed: {e}")
+                self._failed_key = key
+                self.shutdown()
+
+        key = self._market_key()
+        fresh = self.latest is not None and self._forecast_key == key
+        if not fresh and self._pending is None and key != self._failed_key:
+            try:
+                self._start(key)
+            except Exception as e:
+                print(f"⚠️ Could not start price forecast: {e}")
+                self._failed_key = key
+                self.shutdown()
+        return self.version
+
+    def _start(self, key):
+        """Submit one forecast to the worker pool"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        futures = [self._executor.submit(simulate_price_paths, *args) for args in self._job_args(self.workers)]
+        self._pending = (key, self.market.current_day, self.market.price_array.copy(), futures)
+
+    def forecast_now(self):
+        """Compute a forecast for the current market day in this process, blocking (for headless runs)"""
+        key = self._market_key()
+        if self.latest is None or self._forecast_key != key:
+            self._finish(key, self.market.current_day, self.market.price_array.copy(), [simulate_price_paths(*args) for args in self._job_args(1)])
+        return self.latest
+
+    def get_range(self, crop_name):
+        """Get a crop's forecast (low, median, high) price at the end of the horizon, or None if not ready"""
+        self.poll()
+        return self.latest.get_range(crop_name) if self.latest is not None else None
+
+    def shutdown(self):
+        """Stop the worker processes without waiting for running forecasts"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending = None
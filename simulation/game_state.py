@@ -1,13 +1,17 @@
-from constants import game_config, seeds_config, fertilizer_config
-from finance import Finance, TransactionType
-from order_system import OrderSystem
+from simulation.config import game_config, seeds_config, fertilizer_config
+from simulation.finance import Finance, TransactionType
+from simulation.order_system import OrderSystem
+from simulation.catalog import get_seed
 
 
 class GameState:
-    def __init__(self):
+    def __init__(self, clock=None):
         # Initialize finance system with appropriate starting money based on gamemode
         starting_money = 100000 if game_config.get('gamemode') == 'DEBUG' else 1000
-        self.finance = Finance(starting_money=starting_money)
+        self.finance = Finance(
+            starting_money=starting_money,
+            recent_limit=game_config.get('finance_recent_transactions', 1000)
+        )
         self.money = self.finance.get_balance()  # Money is now managed by finance system
         
         self.barn_capacity = game_config['barn_max_capacity']
@@ -30,7 +34,7 @@ class GameState:
             self.fertilizer_inventory[fertilizer['name']] = 5  # Start with 5 of each fertilizer
         
         # Initialize order system
-        self.order_system = OrderSystem(self)
+        self.order_system = OrderSystem(self, clock)
         
         # Try to load existing finance data
         self.load_finance_data()
@@ -68,15 +72,15 @@ class GameState:
         return False
     
     def buy_seed(self, seed_name):
-        for seed in seeds_config:
-            if seed['name'] == seed_name and self.can_afford(seed['cost']):
-                if self.spend_money(seed['cost'], TransactionType.SEED_PURCHASE, 
-                                  f"Purchased {seed_name} seed", {'seed_type': seed_name}):
-                    if seed_name in self.seed_inventory:
-                        self.seed_inventory[seed_name] += 1
-                    else:
-                        self.seed_inventory[seed_name] = 1
-                    return True
+        seed = get_seed(seed_name)
+        if seed is not None and self.can_afford(seed['cost']):
+            if self.spend_money(seed['cost'], TransactionType.SEED_PURCHASE, 
+                              f"Purchased {seed_name} seed", {'seed_type': seed_name}):
+                if seed_name in self.seed_inventory:
+                    self.seed_inventory[seed_name] += 1
+                else:
+                    self.seed_inventory[seed_name] = 1
+                return True
         return False
     
     def use_seed(self, seed_name):
@@ -126,23 +130,44 @@ class GameState:
             return prestige_gained
         return 0
     
+    def get_save_data(self):
+        """Get the game state as a dictionary for saving"""
+        return {
+            'money': self.money,
+            'barn_capacity': self.barn_capacity,
+            'barn_storage': dict(self.barn_storage),
+            'seed_inventory': dict(self.seed_inventory),
+            'fertilizer_inventory': dict(self.fertilizer_inventory),
+            'selected_seed': self.selected_seed,
+            'selected_fertilizer': self.selected_fertilizer,
+            'tractor_row_mode': self.tractor_row_mode,
+            'tractor_3_row_purchased': self.tractor_3_row_purchased,
+            'prestige': self.prestige,
+            'total_order_revenue': self.total_order_revenue
+        }
+    
+    def apply_save_data(self, game_data):
+        """Restore the game state from a saved dictionary"""
+        self.money = game_data.get('money', self.money)
+        self.barn_capacity = game_data.get('barn_capacity', self.barn_capacity)
+        self.barn_storage = game_data.get('barn_storage', {})
+        self.seed_inventory = game_data.get('seed_inventory', {})
+        self.fertilizer_inventory = game_data.get('fertilizer_inventory', {})
+        self.selected_seed = game_data.get('selected_seed', self.selected_seed)
+        self.selected_fertilizer = game_data.get('selected_fertilizer', self.selected_fertilizer)
+        self.tractor_row_mode = game_data.get('tractor_row_mode', self.tractor_row_mode)
+        self.tractor_3_row_purchased = game_data.get('tractor_3_row_purchased', self.tractor_3_row_purchased)
+        self.prestige = game_data.get('prestige', self.prestige)
+        self.total_order_revenue = game_data.get('total_order_revenue', 0)
+        
+        # Update finance system balance
+        self.finance.current_money = self.money
+    
     def save_game_state(self, filename="game_save.json"):
         """Save complete game state to file"""
         import json
         try:
-            game_data = {
-                'money': self.money,
-                'barn_capacity': self.barn_capacity,
-                'barn_storage': self.barn_storage,
-                'seed_inventory': self.seed_inventory,
-                'fertilizer_inventory': self.fertilizer_inventory,
-                'selected_seed': self.selected_seed,
-                'selected_fertilizer': self.selected_fertilizer,
-                'tractor_row_mode': self.tractor_row_mode,
-                'tractor_3_row_purchased': self.tractor_3_row_purchased,
-                'prestige': self.prestige,
-                'total_order_revenue': self.total_order_revenue
-            }
+            game_data = self.get_save_data()
             
             with open(filename, 'w') as f:
                 json.dump(game_data, f, indent=2)
@@ -160,20 +185,7 @@ class GameState:
             with open(filename, 'r') as f:
                 game_data = json.load(f)
             
-            self.money = game_data.get('money', self.money)
-            self.barn_capacity = game_data.get('barn_capacity', self.barn_capacity)
-            self.barn_storage = game_data.get('barn_storage', {})
-            self.seed_inventory = game_data.get('seed_inventory', {})
-            self.fertilizer_inventory = game_data.get('fertilizer_inventory', {})
-            self.selected_seed = game_data.get('selected_seed', self.selected_seed)
-            self.selected_fertilizer = game_data.get('selected_fertilizer', self.selected_fertilizer)
-            self.tractor_row_mode = game_data.get('tractor_row_mode', self.tractor_row_mode)
-            self.tractor_3_row_purchased = game_data.get('tractor_3_row_purchased', self.tractor_3_row_purchased)
-            self.prestige = game_data.get('prestige', self.prestige)
-            self.total_order_revenue = game_data.get('total_order_revenue', 0)
-            
-            # Update finance system balance
-            self.finance.current_money = self.money
+            self.apply_save_data(game_data)
             
             print(f"📂 Game state loaded from {filename}")
             return True
@@ -183,4 +195,3 @@ class GameState:
         except Exception as e:
             print(f"❌ Failed to load game state: {e}")
             return False
-
@@ -0,0 +1,283 @@
+"""
+Market - Crop prices, trends and price history held as NumPy arrays indexed by catalog crop ID
+"""
+import os
+from collections.abc import MutableMapping
+import numpy as np
+from simulation.catalog import CROP_NAMES, CROP_IDS, HARVEST_PRICES
+from simulation.clock import SimulationClock
+
+TREND_TEXT = {-1: "↓", 0: "→", 1: "↑"}
+
+
+def step_prices(rng, prices, trends, min_prices, max_prices, flip_chance):
+    """Advance prices by one market day; returns the new prices and flips trends in place
+
+    Works on any array shape whose last axis is the crop, so the forecaster can step many
+    simulated markets at once with the same rules as the live market.
+    """
+    # Trend-based change: -15%..-5% falling, -5%..+5% stable, +5%..+15% rising,
+    # plus an additional ±10% of random market volatility
+    trend_change = rng.uniform(-0.05, 0.05, prices.shape) + trends * 0.1
+    volatility = rng.uniform(-0.1, 0.1, prices.shape)
+    new_prices = np.clip((prices * (1 + trend_change + volatility)).astype(np.int64), min_prices, max_prices)
+
+    # Occasionally change trend direction
+    flips = rng.random(prices.shape) < flip_chance
+    trends[flips] = rng.integers(-1, 2, int(flips.sum()))
+    return new_prices
+
+
+class Market:
+    def __init__(self, clock=None, seed=None, history_cache=None, history_days=60):
+        """Initialize market with base prices from seed configuration
+
+        Pass a seed for a repeatable market. history_cache is an optional .npz path: the starting
+        prices and past history are loaded from it when it was made for the same crops, days and seed,
+        and written to it otherwise.
+        """
+        self.clock = clock if clock is not None else SimulationClock()
+        self.rng = np.random.default_rng(seed)
+        self.last_update = self.clock.now
+        self.update_interval = 30.0  # Update prices every 30 game seconds
+        self.trend_flip_chance = 0.3  # Chance per day that a crop picks a new trend
+
+        # Day tracking system
+        self.current_day = 1  # Start at day 1
+        self.max_days = 180  # Track 180 days
+        self.day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+        # Price state, one entry per crop in catalog order
+        self.crop_names = CROP_NAMES
+        self.base_prices = HARVEST_PRICES
+        # Keep prices within reasonable bounds (50% to 200% of base price)
+        self.min_prices = np.maximum(1, (self.base_prices * 0.5).astype(np.int64))
+        self.max_prices = (self.base_prices * 2.0).astype(np.int64)
+        # Start with base price plus some random variation (-20% to +20%)
+        variation = self.rng.uniform(-0.2, 0.2, len(self.crop_names))
+        self.price_array = np.maximum(1, (self.base_prices * (1 + variation)).astype(np.int64))
+        self.trend_array = self.rng.integers(-1, 2, len(self.crop_names)).astype(np.int8)  # Down, stable, up
+        # Dict-style access by crop name, backed by the arrays above
+        self.prices = CropArrayView(self.price_array)
+        self.price_trends = CropArrayView(self.trend_array)
+
+        # Price history ring buffer. Each day is written twice, at slot and slot + max_history_length,
+        # so the most recent N days are always one contiguous slice and can be handed out as views.
+        self.max_history_length = 180  # Keep 180 days of history
+        self.history_length = 0
+        self._history_head = 0  # Slot the next day is written to
+        self._history_days = np.zeros(2 * self.max_history_length, dtype=np.int64)
+        self._history_prices = np.zeros((len(self.crop_names), 2 * self.max_history_length), dtype=np.int64)
+
+        # Fill in the days before today, then record the starting prices
+        self._bootstrap_history(history_days, seed, history_cache)
+        print(f"📈 Market initialized with {len(self.crop_names)} crops and {history_days} days of price history")
+
+    def _bootstrap_history(self, days_to_generate, seed, history_cache):
+        """Fill the history buffer with the days before today, from the history cache when it matches"""
+        # Anything the cached prices depend on: a change to the crops or their prices in config invalidates the cache
+        signature = np.array([str(days_to_generate), str(seed)] + list(self.crop_names)
+                             + [repr(value) for value in self.base_prices.tolist()]
+                             + [str(value) for value in self.min_prices.tolist() + self.max_prices.tolist()])
+        past_prices = self._read_history_cache(history_cache, signature)
+        if past_prices is None:
+            past_prices = self._generate_historical_data(days_to_generate)
+            self._write_history_cache(history_cache, signature, past_prices)
+
+        days = np.arange(self.current_day - days_to_generate, self.current_day)
+        self._record_history(days, past_prices)
+        self._record_history(np.array([self.current_day]), self.price_array[:, np.newaxis])
+
+    def _generate_historical_data(self, days_to_generate):
+        """Walk today's prices backwards for the given number of days; returns [crop, day] prices, oldest first"""
+        shape = (len(self.crop_names), days_to_generate)
+        if days_to_generate <= 0:
+            return np.zeros(shape, dtype=np.int64)
+
+        # Trends change with a 20% chance after each day; find the trend in force on each past day
+        flips = self.rng.random(shape) < 0.2
+        flip_trends = self.rng.integers(-1, 2, shape)
+        last_flip = np.maximum.accumulate(np.where(flips, np.arange(days_to_generate), -1), axis=1)
+        last_flip = np.pad(last_flip[:, :-1], ((0, 0), (1, 0)), constant_values=-1)  # Flips apply from the next day
+        trends = np.where(last_flip >= 0,
+                          np.take_along_axis(flip_trends, np.maximum(last_flip, 0), axis=1),
+                          self.trend_array[:, np.newaxis])
+
+        # Each step back divides by one day's change: the trend's range reversed for the past, plus ±10% volatility
+        trend_change = self.rng.uniform(-0.05, 0.05, shape) - trends * 0.1
+        volatility = self.rng.uniform(-0.1, 0.1, shape)
+        walk = self.price_array[:, np.newaxis] / np.cumprod(1 + trend_change + volatility, axis=1)
+        return np.maximum(1, walk.astype(np.int64))[:, ::-1]
+
+    def _read_history_cache(self, path, signature):
+        """Get cached past prices (and adopt the cached starting prices and trends) if made for the same setup"""
+        if not path:
+            return None
+        try:
+            with np.load(path) as cache:
+                if not np.array_equal(cache['signature'], signature):
+                    return None
+                prices, trends, history = cache['prices'], cache['trends'], cache['history']
+        except (OSError, KeyError, ValueError):
+            return None
+        self.price_array[:] = prices
+        self.trend_array[:] = trends
+        return history
+
+    def _write_history_cache(self, path, signature, past_prices):
+        """Store the starting prices, trends and past prices so later startups can reuse them"""
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'wb') as f:
+                np.savez(f, signature=signature, prices=self.price_array, trends=self.trend_array,
+                         history=past_prices)
+        except OSError as e:
+            print(f"Warning: Could not write market history cache: {e}")
+
+    def _record_history(self, days, prices):
+        """Append days (oldest first) and their [crop, day] prices to the history ring buffer"""
+        length = self.max_history_length
+        if len(days) > length:
+            days = days[-length:]
+            prices = prices[:, -length:]
+        slots = (self._history_head + np.arange(len(days))) % length
+        for offset in (0, length):
+            self._history_days[slots + offset] = days
+            self._history_prices[:, slots + offset] = prices
+        self._history_head = (self._history_head + len(days)) % length
+        self.history_length = min(length, self.history_length + len(days))
+
+    def update_prices(self):
+        """Update market prices based on trends and random fluctuations"""
+        current_time = self.clock.now
+
+        if current_time - self.last_update < self.update_interval:
+            return  # Not time to update yet
+
+        # Advance to next day
+        self.current_day += 1
+        if self.current_day > self.max_days:
+            self.current_day = 1  # Cycle back to day 1 after 180 days
+
+        day_of_week = self.get_day_of_week()
+        print(f"\n--- Market Update - Day {self.current_day} ({day_of_week}) ---")
+
+        old_prices = self.price_array.copy()
+        self.price_array[:] = step_prices(self.rng, old_prices, self.trend_array,
+                                          self.min_prices, self.max_prices, self.trend_flip_chance)
+
+        # Record prices in history
+        self._record_history(np.array([self.current_day]), self.price_array[:, np.newaxis])
+
+        # Show price changes
+        for crop_id in np.flatnonzero(self.price_array != old_prices):
+            old_price = int(old_prices[crop_id])
+            new_price = int(self.price_array[crop_id])
+            change = new_price - old_price
+            change_text = f"+${change}" if change > 0 else f"${change}"
+            trend_text = TREND_TEXT[int(self.trend_array[crop_id])]
+            print(f"  {self.crop_names[crop_id]}: ${old_price} → ${new_price} ({change_text}) {trend_text}")
+
+        self.last_update = current_time
+
+    def update(self, dt):
+        """Update method for game loop integration"""
+        self.update_prices()
+
+    def get_price(self, crop_name):
+        """Get current market price for a crop"""
+        return self.prices.get(crop_name, 10)  # Default to 10 if crop not found
+
+    def get_all_prices(self):
+        """Get all current market prices"""
+        return self.prices.copy()
+
+    def get_price_trend(self, crop_name):
+        """Get the current trend for a crop (-1: down, 0: stable, 1: up)"""
+        return self.price_trends.get(crop_name, 0)
+
+    def get_day_of_week(self):
+        """Get the current day of the week name"""
+        # Day -61 starts on Monday (index 0)
+        # Adjust negative days to positive for modulo calculation
+        adjusted_day = self.current_day + 61  # Convert -61 to 0, -60 to 1, etc.
+        day_index = adjusted_day % 7
+        return self.day_names[day_index]
+
+    def get_current_day(self):
+        """Get the current day number"""
+        return self.current_day
+
+    def get_history_view(self, crop_name=None, days=None):
+        """Get (days, prices) read-only views of the most recent history, oldest first, without copying
+
+        prices is one crop's 1-D array, or a [crop, day] array when crop_name is None.
+        Views are only valid until the next market update.
+        """
+        count = self.history_length if days is None else min(days, self.history_length)
+        end = self._history_head + self.max_history_length
+        window = slice(end - count, end)
+        day_view = self._history_days[window]
+        if crop_name is None:
+            price_view = self._history_prices[:, window]
+        else:
+            crop_id = CROP_IDS.get(crop_name)
+            if crop_id is None:
+                return day_view[:0], self._history_prices[0, :0]
+            price_view = self._history_prices[crop_id, window]
+        day_view.flags.writeable = False
+        price_view.flags.writeable = False
+        return day_view, price_view
+
+    def get_price_history(self, crop_name=None):
+        """Get price history as (day, price) lists for a specific crop or all crops"""
+        if crop_name:
+            days, prices = self.get_history_view(crop_name)
+            return list(zip(days.tolist(), prices.tolist()))
+        return {name: self.get_price_history(name) for name in self.crop_names}
+
+    def get_market_summary(self):
+        """Get a formatted summary of current market conditions"""
+        day_of_week = self.get_day_of_week()
+        summary = [f"=== Market Prices - Day {self.current_day} ({day_of_week}) ==="]
+        for crop_name, price in self.prices.items():
+            trend = self.price_trends[crop_name]
+            trend_text = "↓ Falling" if trend == -1 else "→ Stable" if trend == 0 else "↑ Rising"
+            summary.append(f"{crop_name}: ${price} {trend_text}")
+        return "\n".join(summary)
+
+
+class CropArrayView(MutableMapping):
+    """Dict-like view of a per-crop Market array, keyed by crop name"""
+
+    __slots__ = ('_values',)
+
+    def __init__(self, values):
+        self._values = values
+
+    def __getitem__(self, crop_name):
+        return int(self._values[CROP_IDS[crop_name]])
+
+    def __setitem__(self, crop_name, value):
+        self._values[CROP_IDS[crop_name]] = value
+
+    def __delitem__(self, crop_name):
+        raise TypeError("Market crops cannot be removed")
+
+    def __iter__(self):
+        return iter(CROP_NAMES)
+
+    def __len__(self):
+        return len(CROP_NAMES)
+
+    def __contains__(self, crop_name):
+        return crop_name in CROP_IDS
+
+    def copy(self):
+        """Get a plain dict snapshot of the values"""
+        return dict(zip(CROP_NAMES, self._values.tolist()))
+
+    def __repr__(self):
+        return repr(self.copy())
@@ -1,7 +1,7 @@
 import random
-import time
-from constants import seeds_config
-from finance import TransactionType
+from simulation.config import seeds_config, BUILDING_BARN
+from simulation.finance import TransactionType
+from simulation.clock import SimulationClock
 
 
 class Order:
@@ -42,15 +42,22 @@ class Order:
 
 class OrderSystem:
     """Manages crop orders from outside buyers"""
-    def __init__(self, game_state):
+    def __init__(self, game_state, clock=None):
         self.game_state = game_state
+        self.clock = clock if clock is not None else SimulationClock()
         self.game_window = None  # Will be set later
+        self.storage_index = None  # The farm's StorageIndex, set by the Simulation once the farm exists
         self.incoming_orders = []  # Orders that haven't been accepted yet
         self.accepted_orders = []  # Orders that have been accepted
-        self.last_order_generation = time.time()
+        self.last_order_generation = self.clock.now
         self.last_day_processed = -1  # Track the last day we processed orders
         self.order_generation_interval = 7 * 24 * 3600  # Generate new orders every 7 days (keeping for backward compatibility)
         self.initialized = False  # Flag to track if initial orders have been generated
+        self.revision = 0  # Bumped on every change to the order lists, so views only redraw when it moves
+
+    def _orders_changed(self):
+        """Record that the order lists or an order's progress changed"""
+        self.revision += 1
 
     def set_game_window(self, game_window):
         """Set reference to game window for accessing farm tiles"""
@@ -119,10 +126,11 @@ class OrderSystem:
                 order = self.generate_random_order()
                 self.incoming_orders.append(order)
             self.initialized = True
+            self._orders_changed()
 
     def update(self):
         """Update order system - generate new orders daily, cancel old unaccepted orders"""
-        current_time = time.time()
+        current_time = self.clock.now
 
         # Check if we have access to market day tracking
         if hasattr(self, 'market') and hasattr(self.market, 'current_day'):
@@ -134,6 +142,7 @@ class OrderSystem:
                 for _ in range(3):
                     order = self.generate_random_order()
                     self.incoming_orders.append(order)
+                self._orders_changed()
                 print(f"📦 Generated 3 new crop orders for day {current_day}")
 
                 # Cancel unaccepted orders that are 3 days old
@@ -158,6 +167,7 @@ class OrderSystem:
                     order = self.generate_random_order()
                     self.incoming_orders.append(order)
                 self.last_order_generation = current_time
+                self._orders_changed()
 
         # Remove expired orders (both incoming and accepted)
         current_day = self.market.current_day if hasattr(self, 'market') and self.market else 0
@@ -166,10 +176,12 @@ class OrderSystem:
 
         if expired_incoming:
             self.incoming_orders = [order for order in self.incoming_orders if not order.is_expired(current_day)]
+            self._orders_changed()
             print(f"⏰ {len(expired_incoming)} incoming orders expired")
 
         if expired_accepted:
             self.accepted_orders = [order for order in self.accepted_orders if not order.is_expired(current_day)]
+            self._orders_changed()
             print(f"⏰ {len(expired_accepted)} accepted orders expired")
 
     def accept_order(self, order):
@@ -178,16 +190,19 @@ class OrderSystem:
             self.incoming_orders.remove(order)
             order.accepted = True
             self.accepted_orders.append(order)
+            self._orders_changed()
 
     def reject_order(self, order):
         """Reject an incoming order"""
         if order in self.incoming_orders:
             self.incoming_orders.remove(order)
+            self._orders_changed()
 
     def cancel_order(self, order):
         """Cancel an accepted order"""
         if order in self.accepted_orders:
             self.accepted_orders.remove(order)
+            self._orders_changed()
             return True
         return False
 
@@ -212,6 +227,7 @@ class OrderSystem:
 
                 # Fulfill the order
                 order.fulfill(fulfill_amount)
+                self._orders_changed()
 
                 # Pay the premium price (1-5 times current market price)
                 current_market_price = self.market.prices.get(crop_name, 10)
@@ -281,32 +297,26 @@ class OrderSystem:
 
         # Remove from accepted orders
         self.accepted_orders.remove(order)
+        self._orders_changed()
         return True
 
     def remove_crops_from_barns(self, crop_name, amount_to_remove):
         """Remove specified amount of crops from barn tiles"""
-        if not self.game_window:
+        if self.storage_index is None:
             return
-        
+
         remaining_to_remove = amount_to_remove
-        for tile in self.game_window.farm_tiles:
-            if tile.state == 6 and tile.stored_crop_type == crop_name and remaining_to_remove > 0:  # TILE_BARN
-                _, removed = tile.remove_crop(remaining_to_remove)
-                remaining_to_remove -= removed
-                if remaining_to_remove <= 0:
-                    break
+        for tile in self.storage_index.get_holders(BUILDING_BARN, crop_name):
+            _, removed = tile.remove_crop(remaining_to_remove)
+            remaining_to_remove -= removed
+            if remaining_to_remove <= 0:
+                break
 
     def get_total_barn_storage(self, crop_name):
         """Get total amount of a crop stored across all barn tiles"""
-        if not self.game_window:
+        if self.storage_index is None:
             return 0
-        
-        total = 0
-        for tile in self.game_window.farm_tiles:
-            if tile.state == 6:  # TILE_BARN
-                if tile.stored_crop_type == crop_name:
-                    total += tile.stored_amount
-        return total
+        return self.storage_index.total(BUILDING_BARN, crop_name)
 
     def get_incoming_orders(self):
         """Get orders that haven't been accepted yet"""
@@ -384,6 +394,8 @@ class OrderSystem:
                 order.fulfilled_quantity = order_dict.get('fulfilled_quantity', 0)
                 self.accepted_orders.append(order)
         
+        self._orders_changed()
+        
         # Load last order generation time
         if 'last_order_generation' in order_data:
             self.last_order_generation = order_data['last_order_generation']
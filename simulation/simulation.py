@@ -0,0 +1,160 @@
+"""
+Simulation - The whole farm game without a window: tiles, crops, tractors, market, orders and finance
+"""
+import os
+import random
+import numpy as np
+from simulation.config import bundle_dir, game_config, grid_size
+from simulation.clock import SimulationClock
+from simulation.farm import Farm
+from simulation.game_state import GameState
+from simulation.market import Market
+from simulation.forecast import PriceForecaster
+from simulation.tractor import Tractor
+from simulation.tractor_job_queue import TractorJobQueue
+
+BASE_TRACTOR_SPEED = 50
+
+
+class Simulation:
+    """Owns and advances all game state; GameWindow draws it and feeds it player input
+
+    Tractor code receives the simulation as its world: it reads width/height (map size in pixels),
+    farm_tiles, get_tile_at_position, market and game_state from here. All game time comes from
+    `clock`, which update() advances in fixed steps; pass a seed for a repeatable run.
+    """
+
+    def __init__(self, map_width=None, map_height=None, seed=None):
+        if seed is not None:
+            random.seed(seed)
+        self.clock = SimulationClock()
+        self.game_state = GameState(self.clock)
+        self.market = Market(self.clock, seed, self._market_history_cache())
+        # Price forecasts run in worker processes, started on first use
+        self.forecaster = PriceForecaster(self.market, seed=seed)
+        # Initialize order system with market reference
+        self.game_state.order_system.initialize_starting_orders(self.market)
+
+        self.farm = Farm(map_width, map_height, self.clock)
+        if seed is not None:
+            self.farm.soil_rng = np.random.default_rng(seed)
+        self.farm.setup()
+        self.game_state.order_system.storage_index = self.farm.storage_index
+
+        self.tractors = [Tractor(0, 0, self.get_tractor_speed())]
+        self.tractor_job_queue = TractorJobQueue(self)
+
+    @staticmethod
+    def _market_history_cache():
+        """Path of the optional pre-generated market history (market_history_cache in the game config)"""
+        path = game_config.get('market_history_cache')
+        if path and not os.path.isabs(path):
+            path = os.path.join(bundle_dir, path)
+        return path
+
+    @property
+    def width(self):
+        """Width of the map in world pixels"""
+        return self.farm.width
+
+    @property
+    def height(self):
+        """Height of the map in world pixels"""
+        return self.farm.height
+
+    @property
+    def farm_tiles(self):
+        return self.farm.farm_tiles
+
+    def get_tile_at_position(self, grid_x, grid_y):
+        """Get the farm tile at the given grid position"""
+        return self.farm.get_tile_at_position(grid_x, grid_y)
+
+    def get_tile_at_grid(self, col, row):
+        """Get the farm tile at the given column and row"""
+        return self.farm.get_tile_at_grid(col, row)
+
+    def get_tractor_speed(self):
+        """Get the current tractor speed based on upgrades"""
+        if getattr(self.game_state, 'tractor_speed_purchased', False):
+            return int(BASE_TRACTOR_SPEED * 2.0)  # 200% of base speed (100% faster)
+        return BASE_TRACTOR_SPEED
+
+    def get_available_tractor(self):
+        """Get an available (idle) tractor for a task"""
+        for tractor in self.tractors:
+            if tractor.is_idle():
+                return tractor
+        return None
+
+    def purchase_tractor(self):
+        """Buy a new tractor with prestige points; returns the tractor, or None if unaffordable"""
+        # First tractor costs 30 prestige, each additional costs 20 more
+        prestige_cost = 30 + (len(self.tractors) * 20)
+        current_prestige = getattr(self.game_state, 'prestige', 0)
+        if current_prestige < prestige_cost:
+            print(f"Cannot afford tractor ({prestige_cost} prestige needed, have {current_prestige})")
+            return None
+
+        self.game_state.prestige -= prestige_cost
+        # New tractors start at the origin, offset by index
+        tractor = Tractor(0, len(self.tractors) * grid_size, self.get_tractor_speed())
+        self.tractors.append(tractor)
+        print(f"Purchased new tractor for {prestige_cost} prestige! Total tractors: {len(self.tractors)}")
+        return tractor
+
+    def update(self, real_dt):
+        """Advance by a real frame time scaled by the clock's time scale; returns True if a new market day started"""
+        new_day = False
+        for _ in range(self.clock.advance(real_dt)):
+            new_day = self.step() or new_day
+        # Growth visuals only need refreshing once per frame, however many steps ran
+        self.farm.growth_scheduler.update_growth_visuals(real_dt)
+        return new_day
+
+    def step(self):
+        """Advance the simulation by one fixed clock step; returns True if a new market day started"""
+        self.clock.step_once()
+        dt = self.clock.step
+
+        # Update all tractors
+        for tractor in self.tractors:
+            tractor.update(dt, self)
+
+        # Process tractor job queue when tractors become available
+        self.tractor_job_queue.process_queue()
+
+        # Fire crop growth (only planted tiles are tracked by the scheduler)
+        self.farm.growth_scheduler.update()
+
+        # Update market prices and check for new day
+        old_day = self.market.current_day
+        self.market.update(dt)
+        new_day = self.market.current_day != old_day
+
+        # If a new day has started, grow weeds on all farm tiles
+        if new_day:
+            self.grow_weeds_daily()
+
+        # Update order system (generate new orders periodically)
+        self.game_state.order_system.update()
+        return new_day
+
+    def run_days(self, days):
+        """Run the given number of market days as fast as possible, without rendering; returns steps run"""
+        steps = 0
+        days_left = days
+        while days_left > 0:
+            if self.step():
+                days_left -= 1
+            steps += 1
+        self.farm.growth_scheduler.refresh_growth()
+        return steps
+
+    def grow_weeds_daily(self):
+        """Grow weeds on all farm tiles at the start of each new day"""
+        stats = self.farm.daily_soil_tick()
+
+        if stats['tiles_affected'] > 0:
+            print(f"🌿 Daily weed growth: {stats['tiles_affected']} tiles affected, average +{stats['mean_growth']:.1f} weeds per tile")
+        return stats
@@ -0,0 +1,117 @@
+"""
+Storage Index - Which barns and seed bins hold which crops, kept in step with building changes
+"""
+from simulation.config import BUILDING_BARN, BUILDING_SEED_BIN
+
+
+class StorageIndex:
+    """Tracks building contents so totals are O(1) and finding stock only visits buildings that hold it
+
+    Barns hold crops and seed bins hold seeds, so everything is kept per building type:
+    holders[building_type][crop] maps each tile holding that crop to its amount, and
+    totals[building_type][crop] is their sum. FarmTileBuildingManager calls sync() whenever
+    a tile's building or stored contents change.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Forget every building"""
+        self.buildings = {BUILDING_BARN: {}, BUILDING_SEED_BIN: {}}  # {building_type: {tile: None}} in build order
+        self.holders = {BUILDING_BARN: {}, BUILDING_SEED_BIN: {}}  # {building_type: {crop: {tile: amount}}}
+        self.totals = {BUILDING_BARN: {}, BUILDING_SEED_BIN: {}}  # {building_type: {crop: total amount}}
+        self._entries = {}  # {tile: (building_type, crop, amount)} as last indexed
+
+    def rebuild(self, tiles):
+        """Index every building among the given tiles from scratch"""
+        self.clear()
+        for tile in tiles:
+            self.sync(tile)
+
+    def sync(self, tile):
+        """Re-index one tile after its building or stored contents changed
+
+        A tile keeps its place in the building and holder orders while its building type and crop
+        stay the same; only a new building or a newly stocked crop goes to the end.
+        """
+        manager = tile.building_manager
+        building_type = manager.building_type if manager.building_type in self.buildings else None
+        crop = manager.stored_crop_type if building_type and manager.stored_amount > 0 else None
+        entry = (building_type, crop, manager.stored_amount if crop else 0)
+
+        old_type, old_crop, old_amount = self._entries.get(tile, (None, None, 0))
+        if (old_type, old_crop, old_amount) == entry:
+            return
+
+        if old_type != building_type:
+            if old_type is not None:
+                self._remove_holder(tile, old_type, old_crop, old_amount)
+                del self.buildings[old_type][tile]
+            if building_type is not None:
+                self.buildings[building_type][tile] = None
+            old_crop = None
+        elif old_crop != crop and old_crop is not None:
+            self._remove_holder(tile, old_type, old_crop, old_amount)
+            old_crop = None
+
+        if building_type is None:
+            self._entries.pop(tile, None)
+            return
+        self._entries[tile] = entry
+        if crop is None:
+            return
+        totals = self.totals[building_type]
+        if old_crop == crop:
+            # Only the amount moved
+            totals[crop] += entry[2] - old_amount
+        else:
+            totals[crop] = totals.get(crop, 0) + entry[2]
+        self.holders[building_type].setdefault(crop, {})[tile] = entry[2]
+
+    def _remove_holder(self, tile, building_type, crop, amount):
+        """Drop a tile from a crop's holders"""
+        if crop is None:
+            return
+        holders = self.holders[building_type][crop]
+        del holders[tile]
+        totals = self.totals[building_type]
+        if holders:
+            totals[crop] -= amount
+        else:
+            del self.holders[building_type][crop]
+            del totals[crop]
+
+    def total(self, building_type, crop):
+        """Get the amount of a crop stored across all buildings of a type"""
+        return self.totals[building_type].get(crop, 0)
+
+    def contents(self, building_type):
+        """Get {crop: total amount} for everything stored in buildings of a type"""
+        return self.totals[building_type]
+
+    def get_holders(self, building_type, crop):
+        """Get the tiles holding a crop, in the order they were stocked"""
+        return list(self.holders[building_type].get(crop, ()))
+
+    def find_stock(self, building_type, crop):
+        """Get a building of the type holding some of the crop, or None"""
+        return next(iter(self.holders[building_type].get(crop, ())), None)
+
+    def find_space(self, building_type, crop):
+        """Get a building of the type that can take more of a crop, preferring ones already holding it"""
+        for tile in self.holders[building_type].get(crop, ()):
+            if tile.stored_amount < tile.building_capacity:
+                return tile
+        for tile in self.buildings[building_type]:
+            if tile.stored_amount == 0 and tile.building_capacity > 0 and tile.can_store_crop(crop):
+                return tile
+        return None
+
+    def count(self, building_type):
+        """Get the number of buildings of a type"""
+        return len(self.buildings[building_type])
+
+    def capacity(self, building_type):
+        """Get the combined capacity of all buildings of a type"""
+        return sum(tile.building_capacity for tile in self.buildings[building_type])
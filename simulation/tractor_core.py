@@ -1,20 +1,23 @@
-import pyglet
-from constants import (
-    tractor_image, tractor_batch, grid_size, 
-    TILE_OWNED, TILE_TILLED, TILE_UNOWNED, TILE_READY_HARVEST, TILE_BARN
+from simulation.config import (
+    grid_size, TILE_OWNED, TILE_TILLED, TILE_UNOWNED, TILE_READY_HARVEST, TILE_BARN
 )
 
 
+class TractorBody:
+    """Position and visibility of a tractor on the map; the renderer draws a sprite from it"""
+
+    def __init__(self, x, y, visible=False):
+        self.x = x
+        self.y = y
+        self.visible = visible
+
+
 class TractorCore:
-    """Core tractor functionality and sprite management"""
+    """Core tractor functionality and position tracking"""
     
     def __init__(self, x, y, speed=50):
-        self.sprite = pyglet.sprite.Sprite(tractor_image, x=x, y=y, batch=tractor_batch)
-        # Scale the tractor to fit the grid size
-        self.sprite.scale_x = grid_size / self.sprite.width
-        self.sprite.scale_y = grid_size / self.sprite.height
-        # Hide tractor initially
-        self.sprite.visible = False
+        # Hidden until the tractor starts working
+        self.body = TractorBody(x, y)
         self.speed = speed
         self.target_x = x
         self.target_y = y
@@ -42,24 +45,20 @@ class TractorCore:
         """Check if the tractor is idle (not moving)"""
         return not self.moving
         
-    def get_tile_at_position(self, x, y, game_window):
+    def get_tile_at_position(self, x, y, world):
         """Get the tile at the specified position"""
         grid_x = int(x // grid_size) * grid_size
         grid_y = int(y // grid_size) * grid_size
         
-        for tile in game_window.farm_tiles:
-            if (abs(tile.x - grid_x) < grid_size/2 and 
-                abs(tile.y - grid_y) < grid_size/2):
-                return tile
-        return None
+        return world.get_tile_at_position(grid_x, grid_y)
     
     def show(self):
-        """Show the tractor sprite"""
-        self.sprite.visible = True
+        """Show the tractor"""
+        self.body.visible = True
     
     def hide(self):
-        """Hide the tractor sprite"""
-        self.sprite.visible = False
+        """Hide the tractor"""
+        self.body.visible = False
     
     def add_to_harvest_accumulator(self, crop_type, amount, was_stored, market_price):
         """Add harvested crop to the job accumulator"""
@@ -80,7 +79,7 @@ class TractorCore:
         self.job_fertilizer_accumulator[fertilizer_name]['tiles_applied'] += 1
         self.job_fertilizer_accumulator[fertilizer_name]['total_cost'] += cost
     
-    def process_job_harvest_sales(self, game_window):
+    def process_job_harvest_sales(self, world):
         """Process all accumulated harvest sales as a single transaction at job completion"""
         if not self.job_harvest_accumulator:
             return
@@ -95,7 +94,7 @@ class TractorCore:
                 
         if total_value > 0:
             crop_list = ", ".join(crop_details)
-            game_window.game_state.earn_money(
+            world.game_state.earn_money(
                 total_value,
                 'crop_sale',
                 f"Harvest job completed - sold {crop_list} for ${total_value:.2f}",
@@ -110,7 +109,7 @@ class TractorCore:
         # Reset accumulator for next job
         self.job_harvest_accumulator = {}
     
-    def process_job_fertilizer_costs(self, game_window):
+    def process_job_fertilizer_costs(self, world):
         """Process all accumulated fertilizer costs as a single transaction at job completion"""
         if not self.job_fertilizer_accumulator:
             return
@@ -124,7 +123,7 @@ class TractorCore:
             
         if total_cost > 0:
             fertilizer_list = ", ".join(fertilizer_details)
-            success = game_window.game_state.spend_money(
+            success = world.game_state.spend_money(
                 total_cost,
                 'fertilizer_purchase',
                 f"Fertilizing job completed - applied {fertilizer_list} for ${total_cost:.2f}",
@@ -146,13 +145,13 @@ class TractorCore:
         self.job_fertilizer_accumulator = {}
         return True
     
-    def process_job_completion(self, game_window):
+    def process_job_completion(self, world):
         """Process all accumulated transactions (harvest sales and fertilizer costs) at job completion"""
         # Process fertilizer costs first (spending money)
-        fertilizer_success = self.process_job_fertilizer_costs(game_window)
+        fertilizer_success = self.process_job_fertilizer_costs(world)
         
         # Process harvest sales (earning money)
-        self.process_job_harvest_sales(game_window)
+        self.process_job_harvest_sales(world)
         
         return fertilizer_success
 
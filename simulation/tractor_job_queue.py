@@ -3,8 +3,8 @@ Tractor Job Queue System - Manages queued tractor operations
 """
 from enum import Enum
 from collections import deque
-import time
-from constants import TILE_OWNED, TILE_TILLED, TILE_READY_HARVEST, TILE_SEED_BIN, TILE_GROWING
+from simulation.config import TILE_OWNED, TILE_TILLED, TILE_READY_HARVEST, TILE_GROWING
+from simulation.tractor_position import TractorPositionChecker
 
 
 class JobType(Enum):
@@ -19,13 +19,13 @@ class JobType(Enum):
 class TractorJob:
     """Represents a single tractor job to be executed"""
     
-    def __init__(self, job_type, grid_x, grid_y, game_window, **kwargs):
+    def __init__(self, job_type, grid_x, grid_y, world, **kwargs):
         self.job_type = job_type
         self.grid_x = grid_x
         self.grid_y = grid_y
-        self.game_window = game_window
+        self.world = world
         self.kwargs = kwargs  # Additional parameters specific to job type
-        self.timestamp = time.time()  # When the job was created
+        self.timestamp = world.clock.now  # Game time when the job was created
         
     def execute(self, tractor):
         """Execute this job with the given tractor"""
@@ -33,7 +33,7 @@ class TractorJob:
             if self.job_type == JobType.TILLING:
                 num_rows = self.kwargs.get('num_rows', 1)
                 return tractor.start_tilling_multi_row(
-                    self.grid_y, self.game_window.width, self.game_window, 
+                    self.grid_y, self.world.width, self.world, 
                     self.grid_x, num_rows
                 )
                 
@@ -41,14 +41,14 @@ class TractorJob:
                 seed_type = self.kwargs.get('seed_type')
                 num_rows = self.kwargs.get('num_rows', 1)
                 return tractor.start_planting_multi_row(
-                    self.grid_y, self.game_window.width, self.game_window, 
+                    self.grid_y, self.world.width, self.world, 
                     self.grid_x, seed_type, num_rows
                 )
                 
             elif self.job_type == JobType.HARVESTING:
                 num_rows = self.kwargs.get('num_rows', 1)
                 return tractor.start_harvesting_multi_row(
-                    self.grid_y, self.game_window.width, self.game_window, 
+                    self.grid_y, self.world.width, self.world, 
                     self.grid_x, num_rows
                 )
                 
@@ -56,14 +56,14 @@ class TractorJob:
                 fertilizer_data = self.kwargs.get('fertilizer_data')
                 num_rows = self.kwargs.get('num_rows', 1)
                 return tractor.start_cultivating_multi_row(
-                    self.grid_y, self.game_window.width, self.game_window, 
+                    self.grid_y, self.world.width, self.world, 
                     self.grid_x, fertilizer_data, num_rows
                 )
                 
             elif self.job_type == JobType.CULTIVATOR:
                 num_rows = self.kwargs.get('num_rows', 1)
                 return tractor.start_cultivator_multi_row(
-                    self.grid_y, self.game_window.width, self.game_window, 
+                    self.grid_y, self.world.width, self.world, 
                     self.grid_x, num_rows
                 )
                 
@@ -80,10 +80,12 @@ class TractorJob:
 class TractorJobQueue:
     """Manages a queue of tractor jobs and executes them when tractors become available"""
     
-    def __init__(self, game_window):
-        self.game_window = game_window
+    def __init__(self, world):
+        self.world = world
         self.job_queue = deque()
         self.max_queue_size = 20  # Prevent infinite queue growth
+        self.on_queue_changed = None  # Called with the queue whenever jobs are added or removed
+        self.revision = 0  # Bumped whenever jobs are added or removed, so saves can skip an unchanged queue
         
     def add_job(self, job_type, grid_x, grid_y, **kwargs):
         """Add a new job to the queue"""
@@ -91,19 +93,27 @@ class TractorJobQueue:
             print(f"Tractor job queue is full! Cannot queue {job_type.value} job.")
             return False
             
-        job = TractorJob(job_type, grid_x, grid_y, self.game_window, **kwargs)
+        job = TractorJob(job_type, grid_x, grid_y, self.world, **kwargs)
         self.job_queue.append(job)
+        self._queue_changed()
         print(f"Queued {job_type.value} job at position ({grid_x},{grid_y}) - {len(self.job_queue)} jobs in queue")
         return True
     
+    def _queue_changed(self):
+        """Tell the listener (e.g. the queued-job indicators) that the queue changed"""
+        self.revision += 1
+        if self.on_queue_changed is not None:
+            self.on_queue_changed(self.job_queue)
+    
     def process_queue(self):
         """Check for available tractors and execute queued jobs"""
         if not self.job_queue:
             return
             
         # Try to execute jobs while we have available tractors and queued jobs
+        queue_length = len(self.job_queue)
         while self.job_queue:
-            available_tractor = self.game_window.get_available_tractor()
+            available_tractor = self.world.get_available_tractor()
             if not available_tractor:
                 break  # No available tractors, wait for later
                 
@@ -118,10 +128,13 @@ class TractorJobQueue:
                     print(f"Failed to execute queued {job.job_type.value} job (conditions changed)")
             else:
                 print(f"Skipped invalid queued {job.job_type.value} job (tile conditions changed)")
+        
+        if len(self.job_queue) != queue_length:
+            self._queue_changed()
     
     def _is_job_valid(self, job):
         """Check if a queued job is still valid to execute"""
-        tile = self.game_window.get_tile_at_position(job.grid_x, job.grid_y)
+        tile = self.world.get_tile_at_position(job.grid_x, job.grid_y)
         if not tile:
             return False
             
@@ -136,14 +149,7 @@ class TractorJobQueue:
             if tile.state != TILE_TILLED:
                 return False
             # Check if seeds are available in seed bins
-            has_seeds = False
-            for bin_tile in self.game_window.farm_tiles:
-                if (bin_tile.state == TILE_SEED_BIN and 
-                    bin_tile.stored_crop_type == seed_type and 
-                    bin_tile.stored_amount > 0):
-                    has_seeds = True
-                    break
-            return has_seeds
+            return TractorPositionChecker.has_seeds_in_bins(self.world, seed_type)
         elif job.job_type == JobType.HARVESTING:
             return tile.state == TILE_READY_HARVEST
         elif job.job_type == JobType.FERTILIZING:
@@ -157,6 +163,7 @@ class TractorJobQueue:
         """Clear all queued jobs"""
         count = len(self.job_queue)
         self.job_queue.clear()
+        self._queue_changed()
         if count > 0:
             print(f"Cleared {count} queued tractor jobs")
     
@@ -189,6 +196,7 @@ class TractorJobQueue:
             if job.grid_x == grid_x and job.grid_y == grid_y:
                 cancelled_job = self.job_queue[i]
                 del self.job_queue[i]
+                self._queue_changed()
                 print(f"Cancelled {cancelled_job.job_type.value} job at position ({grid_x},{grid_y}) - {len(self.job_queue)} jobs remaining")
                 return True
         return False
@@ -220,14 +228,15 @@ class TractorJobQueue:
                 grid_x = job_data['grid_x']
                 grid_y = job_data['grid_y']
                 kwargs = job_data.get('kwargs', {})
-                timestamp = job_data.get('timestamp', time.time())
+                timestamp = job_data.get('timestamp', self.world.clock.now)
                 
-                job = TractorJob(job_type, grid_x, grid_y, self.game_window, **kwargs)
+                job = TractorJob(job_type, grid_x, grid_y, self.world, **kwargs)
                 job.timestamp = timestamp
                 self.job_queue.append(job)
             except Exception as e:
                 print(f"Error loading tractor job: {e}")
                 continue
+        self._queue_changed()
         
         if self.job_queue:
             print(f"Loaded {len(self.job_queue)} tractor jobs from save file")
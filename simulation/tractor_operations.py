@@ -1,8 +1,8 @@
-from constants import (
+from simulation.config import (
     grid_size, TILE_OWNED, TILE_TILLED, TILE_UNOWNED, TILE_READY_HARVEST, 
-    TILE_BARN, TILE_SEED_BIN, TILE_GROWING
+    TILE_GROWING, BUILDING_BARN, BUILDING_SEED_BIN
 )
-from tractor_position import TractorPositionChecker
+from simulation.tractor_position import TractorPositionChecker
 
 
 class TractorOperations:
@@ -12,18 +12,18 @@ class TractorOperations:
         self.tractor = tractor_core
         self.position_checker = TractorPositionChecker()
     
-    def start_tilling_row(self, row_y, field_width, game_window, start_x=0):
+    def start_tilling_row(self, row_y, field_width, world, start_x=0):
         """Start tilling a specific row from a specific starting position"""
         self.tractor.target_y = row_y
-        self.tractor.sprite.y = row_y
+        self.tractor.body.y = row_y
         
         # Check if starting position is owned
-        if not self.position_checker.can_start_tilling(start_x, row_y, game_window):
+        if not self.position_checker.can_start_tilling(start_x, row_y, world):
             print("Cannot start tractor on unowned tile!")
             return False
         
         # Start at the specified position and move right
-        self.tractor.sprite.x = start_x
+        self.tractor.body.x = start_x
         self.tractor.target_x = field_width - grid_size
         self.tractor.row_direction = 1  # Always move left to right
         self.tractor.mode = 'till'  # Ensure we're in tilling mode
@@ -32,22 +32,22 @@ class TractorOperations:
         self.tractor.show()
             
         # Till the starting position
-        self.till_current_position(game_window)
+        self.till_current_position(world)
         self.tractor.moving = True
         return True
     
-    def start_planting_row(self, row_y, field_width, game_window, start_x=0, seed_type=None):
+    def start_planting_row(self, row_y, field_width, world, start_x=0, seed_type=None):
         """Start planting seeds in a specific row from a specific starting position"""
         self.tractor.target_y = row_y
-        self.tractor.sprite.y = row_y
+        self.tractor.body.y = row_y
         
         # Check if starting position is tilled and we have seeds
-        if not self.position_checker.can_start_planting_position(start_x, row_y, game_window, seed_type):
+        if not self.position_checker.can_start_planting_position(start_x, row_y, world, seed_type):
             print(f"Cannot start planting: tile not tilled or no {seed_type} seeds available!")
             return False
         
         # Start at the specified position and move right
-        self.tractor.sprite.x = start_x
+        self.tractor.body.x = start_x
         self.tractor.target_x = field_width - grid_size
         self.tractor.row_direction = 1  # Always move left to right
         self.tractor.mode = 'plant'
@@ -57,22 +57,22 @@ class TractorOperations:
         self.tractor.show()
             
         # Plant at the starting position
-        self.plant_current_position(game_window)
+        self.plant_current_position(world)
         self.tractor.moving = True
         return True
     
-    def start_harvesting_row(self, row_y, field_width, game_window, start_x=0):
+    def start_harvesting_row(self, row_y, field_width, world, start_x=0):
         """Start harvesting crops in a specific row from a specific starting position"""
         self.tractor.target_y = row_y
-        self.tractor.sprite.y = row_y
+        self.tractor.body.y = row_y
         
         # Check if starting position has harvestable crops
-        if not self.position_checker.can_start_harvesting_position(start_x, row_y, game_window):
+        if not self.position_checker.can_start_harvesting_position(start_x, row_y, world):
             print("Cannot start harvesting: no harvestable crops in this row!")
             return False
         
         # Start at the specified position and move right
-        self.tractor.sprite.x = start_x
+        self.tractor.body.x = start_x
         self.tractor.target_x = field_width - grid_size
         self.tractor.row_direction = 1  # Always move left to right
         self.tractor.mode = 'harvest'
@@ -81,26 +81,26 @@ class TractorOperations:
         self.tractor.show()
             
         # Harvest at the starting position
-        self.harvest_current_position(game_window)
+        self.harvest_current_position(world)
         self.tractor.moving = True
         return True
     
-    def start_cultivating_row(self, row_y, field_width, game_window, start_x=0, fertilizer_data=None):
+    def start_cultivating_row(self, row_y, field_width, world, start_x=0, fertilizer_data=None):
         """Start applying fertilizer in a specific row from a specific starting position"""
         if not fertilizer_data:
             print("No fertilizer selected for cultivation!")
             return False
             
         self.tractor.target_y = row_y
-        self.tractor.sprite.y = row_y
+        self.tractor.body.y = row_y
         
         # Check if starting position can be cultivated
-        if not self.position_checker.can_cultivate_position(start_x, row_y, game_window, fertilizer_data):
+        if not self.position_checker.can_cultivate_position(start_x, row_y, world, fertilizer_data):
             print(f"Cannot start cultivating: tile not suitable or cannot afford {fertilizer_data['name']} (${fertilizer_data['cost']})!")
             return False
         
         # Start at the specified position and move right
-        self.tractor.sprite.x = start_x
+        self.tractor.body.x = start_x
         self.tractor.target_x = field_width - grid_size
         self.tractor.row_direction = 1  # Always move left to right
         self.tractor.mode = 'cultivate'
@@ -114,18 +114,18 @@ class TractorOperations:
         self.tractor.moving = True  
         return True
     
-    def start_cultivator_row(self, row_y, field_width, game_window, start_x=0):
+    def start_cultivator_row(self, row_y, field_width, world, start_x=0):
         """Start removing weeds in a specific row from a specific starting position"""
         self.tractor.target_y = row_y
-        self.tractor.sprite.y = row_y
+        self.tractor.body.y = row_y
         
         # Check if starting position can be worked on (any farmed tile state)
-        if not self.position_checker.can_cultivator_position(start_x, row_y, game_window):
+        if not self.position_checker.can_cultivator_position(start_x, row_y, world):
             print("Cannot start cultivator: tile not suitable for weed removal!")
             return False
         
         # Start at the specified position and move right
-        self.tractor.sprite.x = start_x
+        self.tractor.body.x = start_x
         self.tractor.target_x = field_width - grid_size
         self.tractor.row_direction = 1  # Always move left to right
         self.tractor.mode = 'cultivator'
@@ -138,9 +138,9 @@ class TractorOperations:
         self.tractor.moving = True  
         return True
     
-    def till_current_position(self, game_window):
+    def till_current_position(self, world):
         """Convert the tile under the tractor to tilled soil (only works on owned tiles)"""
-        tile = self.tractor.get_tile_at_position(self.tractor.sprite.x, self.tractor.sprite.y, game_window)
+        tile = self.tractor.get_tile_at_position(self.tractor.body.x, self.tractor.body.y, world)
         
         if tile:
             # Only till owned tiles (convert owned to tilled)
@@ -150,24 +150,18 @@ class TractorOperations:
             # If it's unowned, the tractor shouldn't be here (safety check)
             elif tile.state == TILE_UNOWNED:
                 print("Warning: Tractor on unowned tile!")
-                self.tractor.process_job_completion(game_window)
+                self.tractor.process_job_completion(world)
                 self.tractor.moving = False
                 # Hide tractor when it encounters problems
                 self.tractor.hide()
     
-    def plant_current_position(self, game_window):
+    def plant_current_position(self, world):
         """Plant seeds at the current tractor position"""
-        tile = self.tractor.get_tile_at_position(self.tractor.sprite.x, self.tractor.sprite.y, game_window)
+        tile = self.tractor.get_tile_at_position(self.tractor.body.x, self.tractor.body.y, world)
         
         if tile and tile.state == TILE_TILLED and self.tractor.selected_seed:
             # Find a seed bin with the selected seed type
-            seed_bin = None
-            for bin_tile in game_window.farm_tiles:
-                if (bin_tile.state == TILE_SEED_BIN and 
-                    bin_tile.stored_crop_type == self.tractor.selected_seed and 
-                    bin_tile.stored_amount > 0):
-                    seed_bin = bin_tile
-                    break
+            seed_bin = world.farm.storage_index.find_stock(BUILDING_SEED_BIN, self.tractor.selected_seed)
             
             if seed_bin:
                 # Use one seed from the bin
@@ -177,13 +171,13 @@ class TractorOperations:
             else:
                 # No more seeds, stop the tractor
                 print(f"Out of {self.tractor.selected_seed} seeds in seed bins!")
-                self.tractor.process_job_completion(game_window)
+                self.tractor.process_job_completion(world)
                 self.tractor.moving = False
                 self.tractor.hide()
     
-    def harvest_current_position(self, game_window):
+    def harvest_current_position(self, world):
         """Harvest crops at the current tractor position"""
-        tile = self.tractor.get_tile_at_position(self.tractor.sprite.x, self.tractor.sprite.y, game_window)
+        tile = self.tractor.get_tile_at_position(self.tractor.body.x, self.tractor.body.y, world)
         
         if tile and tile.state == TILE_READY_HARVEST:
             # Harvest the crop (now returns crop_name and amount)
@@ -191,16 +185,15 @@ class TractorOperations:
             if crop_name:
                 # Try to store in nearest barn, otherwise sell for money
                 stored = False
-                for barn_tile in game_window.farm_tiles:
-                    if barn_tile.state == TILE_BARN and barn_tile.can_store_crop(crop_name):
-                        amount_stored = barn_tile.store_crop(crop_name, amount)
-                        if amount_stored > 0:
-                            stored = True
-                            print(f"Stored {amount} {crop_name} in barn")
-                            break
+                barn_tile = world.farm.storage_index.find_space(BUILDING_BARN, crop_name)
+                if barn_tile is not None:
+                    amount_stored = barn_tile.store_crop(crop_name, amount)
+                    if amount_stored > 0:
+                        stored = True
+                        print(f"Stored {amount} {crop_name} in barn")
                 
                 # Add to harvest accumulator instead of immediate sale/transaction
-                market_price = game_window.market.get_price(crop_name)
+                market_price = world.market.get_price(crop_name)
                 self.tractor.add_to_harvest_accumulator(crop_name, amount, stored, market_price)
                 
                 if stored:
@@ -208,19 +201,19 @@ class TractorOperations:
                 else:
                     print(f"Tractor harvested {amount} {crop_name} - will be sold at job completion for ${market_price} each (market price)")
     
-    def cultivate_current_position(self, game_window):
+    def cultivate_current_position(self, world):
         """Apply fertilizer at the current tractor position (only once per tile)"""
         if not hasattr(self.tractor, 'selected_fertilizer') or not self.tractor.selected_fertilizer:
             return
             
-        tile = self.tractor.get_tile_at_position(self.tractor.sprite.x, self.tractor.sprite.y, game_window)
+        tile = self.tractor.get_tile_at_position(self.tractor.body.x, self.tractor.body.y, world)
         
         if tile:
             # Create unique identifier for this tile position
             tile_id = (int(tile.x // grid_size), int(tile.y // grid_size))
             
             # Only process if we haven't cultivated this tile yet
-            if tile_id not in self.tractor.cultivated_tiles and self.position_checker.can_cultivate_position(self.tractor.sprite.x, self.tractor.sprite.y, game_window, self.tractor.selected_fertilizer):
+            if tile_id not in self.tractor.cultivated_tiles and self.position_checker.can_cultivate_position(self.tractor.body.x, self.tractor.body.y, world, self.tractor.selected_fertilizer):
                 # Mark this tile as cultivated
                 self.tractor.cultivated_tiles.add(tile_id)
                 
@@ -253,16 +246,16 @@ class TractorOperations:
                 else:
                     print(f"  No nutrients added (fertilizer contains no positive nutrient values)")
     
-    def cultivate_weeds_current_position(self, game_window):
+    def cultivate_weeds_current_position(self, world):
         """Remove weeds at the current tractor position (only once per tile)"""
-        tile = self.tractor.get_tile_at_position(self.tractor.sprite.x, self.tractor.sprite.y, game_window)
+        tile = self.tractor.get_tile_at_position(self.tractor.body.x, self.tractor.body.y, world)
         
         if tile:
             # Create unique identifier for this tile position
             tile_id = (int(tile.x // grid_size), int(tile.y // grid_size))
             
             # Only process if we haven't worked on this tile yet and it's a farmed tile
-            if tile_id not in self.tractor.cultivated_tiles and self.position_checker.can_cultivator_position(self.tractor.sprite.x, self.tractor.sprite.y, game_window):
+            if tile_id not in self.tractor.cultivated_tiles and self.position_checker.can_cultivator_position(self.tractor.body.x, self.tractor.body.y, world):
                 # Mark this tile as worked on
                 self.tractor.cultivated_tiles.add(tile_id)
                 
@@ -0,0 +1,157 @@
+from simulation.config import grid_size, TILE_OWNED, TILE_TILLED, TILE_READY_HARVEST, TILE_GROWING, TILE_UNOWNED, BUILDING_SEED_BIN
+
+
+class TractorPositionChecker:
+    """Handles position checking and validation for tractor operations"""
+    
+    @staticmethod
+    def _row_index(world):
+        """Get the farm's per-row state index"""
+        return world.farm.row_index
+    
+    @staticmethod
+    def has_seeds_in_bins(world, seed_type):
+        """Check if any seed bin holds seeds of the given type"""
+        return world.farm.storage_index.total(BUILDING_SEED_BIN, seed_type) > 0
+    
+    @staticmethod
+    def can_start_tilling(x, y, world):
+        """Check if the tractor can start tilling at a specific position"""
+        grid_x = int(x // grid_size) * grid_size
+        grid_y = int(y // grid_size) * grid_size
+        
+        tile = world.get_tile_at_position(grid_x, grid_y)
+        return bool(tile) and (tile.state == TILE_OWNED or tile.state == TILE_TILLED)
+    
+    @staticmethod
+    def can_till_position(x, y, world):
+        """Check if there are tillable tiles ahead (for continuation logic)"""
+        current_tile_x = int(x // grid_size)
+        current_tile_y = int(y // grid_size)
+        
+        # Look ahead in the row starting from the NEXT tile: continue tilling through
+        # owned or already tilled tiles, stop at the first unowned tile
+        return TractorPositionChecker._row_index(world).continues_before(
+            current_tile_y, current_tile_x + 1, (TILE_OWNED, TILE_TILLED), (TILE_UNOWNED,)
+        )
+    
+    @staticmethod
+    def can_start_harvesting_position(x, y, world):
+        """Check if the tractor can start harvesting at the given position (must be ready to harvest)"""
+        grid_x = int(x // grid_size) * grid_size
+        grid_y = int(y // grid_size) * grid_size
+        
+        tile = world.get_tile_at_position(grid_x, grid_y)
+        return bool(tile) and tile.state == TILE_READY_HARVEST
+    
+    @staticmethod
+    def can_harvest_position(x, y, world):
+        """Check if the tractor can continue harvesting (check if there are any more harvestable tiles ahead)"""
+        # Check if there are any harvestable tiles remaining in this row (to the right)
+        current_tile_x = int(x // grid_size)
+        current_tile_y = int(y // grid_size)
+        
+        # Look ahead in the row starting from the NEXT tile to see if there are any more harvestable tiles
+        return TractorPositionChecker._row_index(world).has_state_in_row(
+            current_tile_y, current_tile_x + 1, (TILE_READY_HARVEST,)
+        )
+    
+    @staticmethod
+    def has_harvestable_crops_in_row(row_y, world, start_x=0):
+        """Check if a row has any harvestable crops starting from a specific position"""
+        current_tile_y = int(row_y // grid_size)
+        start_tile_x = int(start_x // grid_size)
+        
+        # Check if there are any harvestable tiles in this row starting from start_x
+        return TractorPositionChecker._row_index(world).has_state_in_row(
+            current_tile_y, start_tile_x, (TILE_READY_HARVEST,)
+        )
+    
+    @staticmethod
+    def can_plant_position(x, y, world, seed_type):
+        """Check if the tractor can continue planting (check if there are seeds and tilled tiles ahead)"""
+        # First check if we have any seeds in seed bins
+        if not seed_type:
+            return False
+            
+        # Check if we have seeds available in seed bins
+        if not TractorPositionChecker.has_seeds_in_bins(world, seed_type):
+            return False
+            
+        # Check if there are any tilled tiles remaining in this row (to the right)
+        current_tile_x = int(x // grid_size)
+        current_tile_y = int(y // grid_size)
+        
+        # Look ahead in the row to see if there are any more tilled tiles
+        return TractorPositionChecker._row_index(world).has_state_in_row(
+            current_tile_y, current_tile_x, (TILE_TILLED,)
+        )
+    
+    @staticmethod
+    def can_start_planting_position(x, y, world, seed_type):
+        """Check if the tractor can start planting at the given position (must be tilled)"""
+        # First check if we have any seeds in seed bins
+        if not seed_type:
+            return False
+            
+        # Check if we have seeds available in seed bins
+        if not TractorPositionChecker.has_seeds_in_bins(world, seed_type):
+            return False
+            
+        # Check if the starting position is tilled
+        grid_x = int(x // grid_size) * grid_size
+        grid_y = int(y // grid_size) * grid_size
+        
+        start_tile = world.get_tile_at_position(grid_x, grid_y)
+        
+        return start_tile and start_tile.state == TILE_TILLED
+    
+    @staticmethod
+    def can_cultivate_position(x, y, world, fertilizer_data):
+        """Check if the tractor can apply fertilizer at the current position"""
+        grid_x = int(x // grid_size) * grid_size
+        grid_y = int(y // grid_size) * grid_size
+        
+        tile = world.get_tile_at_position(grid_x, grid_y)
+        
+        if not tile:
+            return False
+        
+        # Can cultivate tilled, growing, or harvest-ready tiles
+        cultivatable_states = [TILE_TILLED, TILE_GROWING, TILE_READY_HARVEST]
+        
+        # Check if tile is cultivatable and player can afford fertilizer
+        return (tile.state in cultivatable_states and 
+                world.game_state.can_afford(fertilizer_data['cost']))
+    
+    @staticmethod
+    def can_cultivator_position(x, y, world):
+        """Check if the tractor can remove weeds at the current position"""
+        grid_x = int(x // grid_size) * grid_size
+        grid_y = int(y // grid_size) * grid_size
+        
+        tile = world.get_tile_at_position(grid_x, grid_y)
+        
+        if not tile:
+            return False
+        
+        # Can remove weeds from any farmed tile state (owned, tilled, planted, growing, harvest-ready)
+        from simulation.config import TILE_OWNED
+        cultivatable_states = [TILE_OWNED, TILE_TILLED, TILE_GROWING, TILE_READY_HARVEST]
+        
+        # Continue working on any farmed tile regardless of weed count (will work even if weeds are 0)
+        return tile.state in cultivatable_states
+    
+    @staticmethod
+    def can_cultivator_continue(x, y, world):
+        """Check if there are more cultivatable tiles ahead (for continuation logic)"""
+        current_tile_x = int(x // grid_size)
+        current_tile_y = int(y // grid_size)
+        
+        # Look ahead in the row starting from the NEXT tile: continue through
+        # cultivatable tiles, stop at the first unowned tile
+        cultivatable_states = (TILE_OWNED, TILE_TILLED, TILE_GROWING, TILE_READY_HARVEST)
+        return TractorPositionChecker._row_index(world).continues_before(
+            current_tile_y, current_tile_x + 1, cultivatable_states, (TILE_UNOWNED,)
+        )
+
@@ -1,4 +1,4 @@
-from market import Market
+from simulation.market import Market
 from market_window import MarketWindow
 
 # Create market and window
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test script for save round trips: JSON to .tfsave conversion, full plus incremental saves, and old saves
+"""
+import json
+import os
+import sys
+from game_window import GameWindow
+from constants import TILE_OWNED, TILE_TILLED, BUILDING_BARN
+from save_format import convert_save, tile_dicts_from_columns
+from simulation.finance import TransactionType
+
+TEST_FILES = ('test_round_trip.json', 'test_round_trip.tfsave', 'test_incremental.tfsave', 'test_old_save.json')
+
+
+def save_paths(gw):
+    """Get every file the tests may write in the save directory, including delta logs and ledgers"""
+    sm = gw.managers.save_manager
+    return [sm.get_save_path(name) + suffix for name in TEST_FILES for suffix in ('', '.delta', '.ledger')]
+
+
+def farm_state(gw):
+    """Get what a save must restore: every tile's saved fields, money, transactions and inventories"""
+    sm = gw.managers.save_manager
+    return {
+        'tiles': tile_dicts_from_columns(sm._snapshot_tiles(gw.farm_tiles)),
+        'money': gw.game_state.money,
+        'transaction_count': gw.game_state.finance.transaction_count,
+        'seed_inventory': gw.game_state.seed_inventory,
+        'current_day': gw.market.current_day
+    }
+
+
+def report(label, expected, actual):
+    """Report one comparison; returns whether it matched"""
+    if expected == actual:
+        print(f"✅ {label}")
+        return True
+    print(f"❌ {label}")
+    for key in expected:
+        if expected[key] != actual.get(key):
+            print(f"   {key} differs")
+    return False
+
+
+def set_up_farm(gw):
+    """Plant a crop and stock a barn so the save has crop, building and nullable fields to round trip"""
+    owned = [tile for tile in gw.farm_tiles if tile.state == TILE_OWNED]
+    crop_tile = owned[0]
+    crop_tile.state = TILE_TILLED
+    crop_tile.plant_crop('Carrot')
+    crop_tile.crop_manager.growth_time = 5000
+    crop_tile.mark_changed()
+
+    barn_tile = owned[1]
+    barn_tile.build_structure(BUILDING_BARN)
+    barn_tile.store_crop('Carrot', 7)
+    gw.game_state.seed_inventory['Carrot'] = 12
+    return crop_tile
+
+
+def load_into_new_game(filename):
+    gw = GameWindow()
+    if not gw.load_game(filename):
+        raise RuntimeError(f"Could not load {filename}")
+    return gw
+
+
+def check_json_to_binary(gw):
+    """Save as JSON, convert to .tfsave, load the converted file"""
+    sm = gw.managers.save_manager
+    gw.save_game('test_round_trip.json')
+
+    # Hand-edited and older JSON saves can leave fields out; that makes growth_time a nullable int column
+    json_path = sm.get_save_path('test_round_trip.json')
+    with open(json_path, 'r') as f:
+        game_data = json.load(f)
+    for tile_data in game_data['farm_tiles']:
+        if not tile_data.get('crop_type'):
+            tile_data.pop('growth_time', None)
+    with open(json_path, 'w') as f:
+        json.dump(game_data, f, indent=2)
+    convert_save(sm.get_save_path('test_round_trip.json'), sm.get_save_path('test_round_trip.tfsave'))
+
+    loaded = load_into_new_game('test_round_trip.tfsave')
+    try:
+        ok = report("JSON save converted to .tfsave loads the same farm", farm_state(gw), farm_state(loaded))
+        growth_time = next(tile.crop_manager.growth_time for tile in loaded.farm_tiles if tile.crop_type)
+        if type(growth_time) is int and growth_time == 5000:
+            print("✅ Nullable int column (growth_time) loads as an int")
+        else:
+            print(f"❌ growth_time loaded as {growth_time!r}")
+            ok = False
+        return ok
+    finally:
+        loaded.close()
+
+
+def check_full_and_incremental(gw, crop_tile):
+    """Full save, change the game, incremental save, load the full save plus its delta log"""
+    sm = gw.managers.save_manager
+    gw.save_game('test_incremental.tfsave')
+
+    crop_tile.crop_manager.current_scale = 0.9
+    crop_tile.mark_changed()
+    gw.game_state.seed_inventory['Carrot'] = 3
+    gw.game_state.finance.add_transaction(TransactionType.CROP_SALE, 25, "Test sale")
+    gw.game_state.money = gw.game_state.finance.get_balance()
+    gw.save_game('test_incremental.tfsave', incremental=True)
+
+    ok = os.path.exists(sm.get_delta_path(sm.get_save_path('test_incremental.tfsave')))
+    print(("✅" if ok else "❌") + " Incremental save appended to the delta log")
+
+    loaded = load_into_new_game('test_incremental.tfsave')
+    try:
+        return report("Full save plus incremental save loads the latest farm", farm_state(gw), farm_state(loaded)) and ok
+    finally:
+        loaded.close()
+
+
+def check_old_save(gw):
+    """Load a JSON save in the layout written before binary saves, running totals and generations"""
+    sm = gw.managers.save_manager
+    with open(sm.get_save_path('test_round_trip.json'), 'r') as f:
+        game_data = json.load(f)
+    game_data.pop('save_generation', None)
+    game_data['finance'].pop('totals', None)
+    game_data['finance'].pop('ledger_size', None)
+    with open(sm.get_save_path('test_old_save.json'), 'w') as f:
+        json.dump(game_data, f, indent=2)
+
+    # Asking for the binary name finds the old JSON file
+    loaded = load_into_new_game('test_old_save.tfsave')
+    try:
+        return report("Old JSON save loads the same farm", farm_state(gw), farm_state(loaded))
+    finally:
+        loaded.close()
+
+
+if __name__ == "__main__":
+    print("Testing save round trips...")
+    gw = GameWindow()
+    for path in save_paths(gw):
+        if os.path.exists(path):
+            os.remove(path)
+    try:
+        crop_tile = set_up_farm(gw)
+        results = [
+            check_json_to_binary(gw),
+            check_old_save(gw),
+            check_full_and_incremental(gw, crop_tile)
+        ]
+    finally:
+        for path in save_paths(gw):
+            if os.path.exists(path):
+                os.remove(path)
+        gw.close()
+
+    if all(results):
+        print("\n🎉 All save round trip tests passed!")
+    else:
+        print("\n❌ Save round trip tests failed!")
+        sys.exit(1)
@@ -4,7 +4,7 @@ Test script to verify that tractors continue working during save operations
 """
 import time
 from game_window import GameWindow
-from tractor_job_queue import JobType
+from simulation.tractor_job_queue import JobType
 
 def test_save_with_tractor_jobs():
     """Test that tractors continue working while save dialog is shown"""
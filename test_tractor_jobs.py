@@ -1,7 +1,7 @@
 import json
 import time
 from game_window import GameWindow
-from tractor_job_queue import JobType
+from simulation.tractor_job_queue import JobType
 
 # Create game and set up tractors with jobs
 gw = GameWindow(1013, 768, 'Test')
@@ -32,7 +32,7 @@ print("=== Before Save ===")
 print(f"Tractor position: ({tractor.x}, {tractor.y})")
 print(f"Tractor moving: {tractor.core.moving}")
 print(f"Current operation: {tractor.core.current_operation}")
-print(f"Sprite visible: {tractor.core.sprite.visible}")
+print(f"Sprite visible: {tractor.core.body.visible}")
 
 # Save game
 result = gw.save_game('test_tractor_visibility.json')
@@ -50,13 +50,13 @@ print("\n=== After Load ===")
 print(f"Tractor position: ({loaded_tractor.x}, {loaded_tractor.y})")
 print(f"Tractor moving: {loaded_tractor.core.moving}")
 print(f"Current operation: {loaded_tractor.core.current_operation}")
-print(f"Sprite visible: {loaded_tractor.core.sprite.visible}")
+print(f"Sprite visible: {loaded_tractor.core.body.visible}")
 
 # Test with idle tractor too
 print("\n=== Testing Idle Tractor ===")
 idle_tractor = gw2.tractors[1] if len(gw2.tractors) > 1 else gw2.tractors[0]
 if idle_tractor != loaded_tractor:
-    print(f"Idle tractor sprite visible: {idle_tractor.core.sprite.visible}")
+    print(f"Idle tractor sprite visible: {idle_tractor.core.body.visible}")
 else:
     print("Only one tractor available")
 
@@ -12,7 +12,7 @@ tile.state = TILE_PLANTED
 
 # Manually set up crop manager
 tile.crop_manager.crop_type = 'Carrot'
-tile.crop_manager.plant_time = time.time() - 1  # Planted 1 second ago
+tile.crop_manager.plant_time = gw.simulation.clock.now - 1  # Planted 1 game second ago
 tile.crop_manager.growth_time = 5000  # 5 seconds to grow
 tile.crop_manager.current_scale = 0.6  # Partially grown
 
@@ -55,9 +55,9 @@ print(f'Current scale: {loaded_tile.crop_manager.current_scale}')
 print(f'Tile state: {loaded_tile.state}')
 
 # Check sprite scale if it exists
-if loaded_tile.crop_manager.crop_sprite:
-    print(f'Sprite scale_x: {loaded_tile.crop_manager.crop_sprite.scale_x}')
-    print(f'Sprite scale_y: {loaded_tile.crop_manager.crop_sprite.scale_y}')
+if loaded_tile.crop_sprite:
+    print(f'Sprite scale_x: {loaded_tile.crop_sprite.scale_x}')
+    print(f'Sprite scale_y: {loaded_tile.crop_sprite.scale_y}')
 
 # Wait a bit and update growth
 print(f'\nWaiting 2 seconds and updating growth...')
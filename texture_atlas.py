@@ -0,0 +1,154 @@
+"""
+Texture Atlas - Packs every game image into one texture at tile resolution
+
+Source images in img/ are up to 1024x1024 but are only ever drawn at tile size, so they are
+downsampled once and packed into a single pyglet TextureAtlas. Sprites drawn from the atlas share
+one texture, which lets a whole batch layer draw without texture switches.
+
+The downsampled cells are cached as a PNG sheet plus a JSON index, so later startups only decode
+one small image. The cache is rebuilt when the tile size or any source image changes.
+"""
+import json
+import os
+import pyglet
+from PIL import Image, ImageDraw
+
+ATLAS_CACHE_VERSION = 2
+# Images that are not drawn on the map (the splash screen shows title.png at full resolution)
+ATLAS_EXCLUDE = ('title.png',)
+# Each cell carries a 1 pixel copy of its edge pixels so filtering never samples a neighbouring image
+CELL_PADDING = 1
+# Buildings get an extra '<name>_bordered' image with a black outline baked in
+BORDERED_IMAGES = ('barn', 'seed_bin')
+BUILDING_BORDER_WIDTH = 2
+
+
+class TileAtlas:
+    """Downsampled game images packed into one pyglet TextureAtlas, looked up by file name without extension"""
+
+    def __init__(self, image_dir, tile_size, cache_dir=None):
+        self.image_dir = image_dir
+        self.tile_size = tile_size
+        self.cache_dir = cache_dir
+        self.regions = {}
+
+        cells = self._load_cells()
+        cell_size = tile_size + 2 * CELL_PADDING
+        columns = max(1, int(len(cells) ** 0.5 + 0.999))
+        side = _next_power_of_two(columns * cell_size)
+        self.atlas = pyglet.image.atlas.TextureAtlas(side, side)
+        self.texture = self.atlas.texture
+
+        for name, cell in cells.items():
+            image_data = pyglet.image.ImageData(cell_size, cell_size, 'RGBA', cell.tobytes(),
+                                                pitch=-cell_size * 4)
+            padded_region = self.atlas.add(image_data)
+            self.regions[name] = padded_region.get_region(CELL_PADDING, CELL_PADDING, tile_size, tile_size)
+
+    def __getitem__(self, name):
+        return self.regions[name]
+
+    def __contains__(self, name):
+        return name in self.regions
+
+    def get(self, name, default=None):
+        """Get an image region by name, or default if the atlas has no such image"""
+        return self.regions.get(name, default)
+
+    def _source_files(self):
+        """Get the (name, path) pairs of every image that goes into the atlas"""
+        sources = []
+        for filename in sorted(os.listdir(self.image_dir)):
+            if filename.lower().endswith('.png') and filename not in ATLAS_EXCLUDE:
+                sources.append((os.path.splitext(filename)[0], os.path.join(self.image_dir, filename)))
+        return sources
+
+    def _load_cells(self):
+        """Get padded tile-size PIL images for every source, from the cache when it is current"""
+        sources = self._source_files()
+        signature = {
+            'version': ATLAS_CACHE_VERSION,
+            'tile_size': self.tile_size,
+            'sources': [[name, os.path.getsize(path), os.stat(path).st_mtime_ns] for name, path in sources]
+        }
+
+        cells = self._read_cache(signature)
+        if cells is not None:
+            return cells
+
+        cells = {}
+        for name, path in sources:
+            try:
+                cells[name] = _padded_cell(Image.open(path), self.tile_size)
+            except OSError as e:
+                print(f"Warning: Could not load image {path} for the texture atlas: {e}")
+        for name in BORDERED_IMAGES:
+            if name in cells:
+                cells[f"{name}_bordered"] = _bordered_cell(cells[name])
+
+        self._write_cache(signature, cells)
+        return cells
+
+    def _cache_paths(self):
+        base = os.path.join(self.cache_dir, f"tile_atlas_{self.tile_size}")
+        return base + '.png', base + '.json'
+
+    def _read_cache(self, signature):
+        """Get cached cells if the cache was built from the same sources, otherwise None"""
+        if not self.cache_dir:
+            return None
+        sheet_path, index_path = self._cache_paths()
+        try:
+            with open(index_path, 'r') as f:
+                index = json.load(f)
+            if index.get('signature') != signature:
+                return None
+            sheet = Image.open(sheet_path).convert('RGBA')
+        except (OSError, ValueError):
+            return None
+
+        cell_size = self.tile_size + 2 * CELL_PADDING
+        return {name: sheet.crop((i * cell_size, 0, (i + 1) * cell_size, cell_size))
+                for i, name in enumerate(index['names'])}
+
+    def _write_cache(self, signature, cells):
+        """Store cells as one horizontal strip; a read-only install just rebuilds every startup"""
+        if not self.cache_dir or not cells:
+            return
+        cell_size = self.tile_size + 2 * CELL_PADDING
+        sheet = Image.new('RGBA', (cell_size * len(cells), cell_size))
+        for i, cell in enumerate(cells.values()):
+            sheet.paste(cell, (i * cell_size, 0))
+
+        sheet_path, index_path = self._cache_paths()
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            sheet.save(sheet_path)
+            with open(index_path, 'w') as f:
+                json.dump({'signature': signature, 'names': list(cells)}, f)
+        except OSError as e:
+            print(f"Warning: Could not write texture atlas cache: {e}")
+
+
+def _padded_cell(image, tile_size):
+    """Downsample an image to tile_size and surround it with a copy of its edge pixels"""
+    image = image.convert('RGBA')
+    cell_size = tile_size + 2 * CELL_PADDING
+    cell = image.resize((cell_size, cell_size), Image.Resampling.LANCZOS)
+    cell.paste(image.resize((tile_size, tile_size), Image.Resampling.LANCZOS), (CELL_PADDING, CELL_PADDING))
+    return cell
+
+
+def _bordered_cell(cell):
+    """Get a copy of a padded cell with a black outline just inside the tile edge"""
+    cell = cell.copy()
+    ImageDraw.Draw(cell).rectangle((0, 0, cell.width - 1, cell.height - 1), outline=(0, 0, 0, 255),
+                                   width=CELL_PADDING + BUILDING_BORDER_WIDTH)
+    return cell
+
+
+def _next_power_of_two(value):
+    size = 1
+    while size < value:
+        size *= 2
+    return size
@@ -0,0 +1,71 @@
+"""
+Tile Chunks - Splits the map into fixed-size blocks of tiles, each drawn from its own batch
+"""
+import time
+import pyglet
+from constants import game_config
+
+CHUNK_SIZE = 16  # Tiles per chunk side
+
+
+class TileChunks:
+    """One pyglet Batch per CHUNK_SIZE x CHUNK_SIZE block of tiles, so only chunks in view are drawn
+
+    A chunk's contents are created by build_chunk(key, batch) the first time the chunk comes into
+    view, so a large map only pays for the parts the player has actually looked at.
+    """
+
+    def __init__(self, map_width, map_height, build_chunk, chunk_size=CHUNK_SIZE):
+        self.map_width = map_width
+        self.map_height = map_height
+        self.chunk_size = chunk_size
+        self.chunks_x = (map_width + chunk_size - 1) // chunk_size
+        self.chunks_y = (map_height + chunk_size - 1) // chunk_size
+        self.build_chunk = build_chunk
+        # Time allowed for building new chunks per frame; at least one is always built
+        self.build_budget = game_config.get('chunk_build_budget_ms', 10) / 1000
+        self.batches = {}  # {(chunk x, chunk y): Batch} for the chunks built so far
+
+    def tile_range(self, key):
+        """Get (first_col, first_row, end_col, end_row) of the tiles in a chunk, end exclusive"""
+        chunk_x, chunk_y = key
+        first_col = chunk_x * self.chunk_size
+        first_row = chunk_y * self.chunk_size
+        return (first_col, first_row, min(self.map_width, first_col + self.chunk_size),
+                min(self.map_height, first_row + self.chunk_size))
+
+    def chunks_in_tile_range(self, first_col, first_row, end_col, end_row):
+        """Get the keys of the chunks overlapping a tile range (end exclusive)"""
+        first_x = max(0, first_col // self.chunk_size)
+        first_y = max(0, first_row // self.chunk_size)
+        end_x = min(self.chunks_x, (end_col - 1) // self.chunk_size + 1)
+        end_y = min(self.chunks_y, (end_row - 1) // self.chunk_size + 1)
+        return [(cx, cy) for cy in range(first_y, end_y) for cx in range(first_x, end_x)]
+
+    def build(self, key):
+        """Create a chunk's batch and fill it"""
+        batch = self.batches[key] = pyglet.graphics.Batch()
+        self.build_chunk(key, batch)
+        return batch
+
+    def draw_visible(self, camera):
+        """Draw the chunks that intersect the camera's view, building the missing ones within the frame budget
+
+        Chunks over budget are left for the next frames, so zooming out over a large map fills
+        the view in over a few frames rather than stalling one.
+        """
+        deadline = None
+        for key in self.chunks_in_tile_range(*camera.visible_tile_range()):
+            batch = self.batches.get(key)
+            if batch is None:
+                now = time.perf_counter()
+                if deadline is None:
+                    deadline = now + self.build_budget
+                elif now > deadline:
+                    continue
+                batch = self.build(key)
+            batch.draw()
+
+    def clear(self):
+        """Drop every chunk batch (the shapes in them must already be deleted)"""
+        self.batches = {}
@@ -1,4 +1,5 @@
 import pyglet
+from simulation.catalog import get_seed_cost
 from constants import TILE_BARN, TILE_SEED_BIN, TILE_TILLED, TILE_GROWING, TILE_READY_HARVEST, TILE_OWNED
 
 
@@ -9,33 +10,36 @@ class TooltipSystem:
         self.tooltip_tile = None
         self.mouse_x = 0
         self.mouse_y = 0
-    
-    def hide_tooltip(self):
-        """Hide the current tooltip"""
-        self.tooltip_text = None
-        self.tooltip_tile = None
+        # Tooltip text is only regenerated when (tile, tile revision, market day) changes
+        self._tooltip_key = None
+        # Persistent background and label, created on first draw and reused afterwards
+        self.tooltip_batch = pyglet.graphics.Batch()
+        self._border = None
+        self._background = None
+        self._label = None
+        self._layout_key = None
     
     def update_mouse_position(self, x, y):
         """Update mouse position and check for tooltip updates"""
         self.mouse_x = x
         self.mouse_y = y
         
-        # Check if mouse is over a building tile for tooltip
+        # Check if mouse is over a building tile for tooltip (tooltips are drawn in screen space)
         from constants import grid_size
-        grid_x = int(x // grid_size) * grid_size
-        grid_y = int(y // grid_size) * grid_size
+        camera = self.game_window.camera
         
-        if 0 <= grid_y < self.game_window.height and 0 <= grid_x < self.game_window.width:
+        if camera.contains_screen_point(x, y):
+            world_x, world_y = camera.screen_to_world(x, y)
+            grid_x = int(world_x // grid_size) * grid_size
+            grid_y = int(world_y // grid_size) * grid_size
             tile = self.game_window.get_tile_at_position(grid_x, grid_y)
             if tile and tile.state in [TILE_BARN, TILE_SEED_BIN, TILE_OWNED, TILE_TILLED, TILE_GROWING, TILE_READY_HARVEST]:
                 self.tooltip_tile = tile
-                self.update_tooltip_text(tile)
+                self.refresh_tooltip_text()
             else:
-                self.tooltip_tile = None
-                self.tooltip_text = None
+                self.hide_tooltip()
         else:
-            self.tooltip_tile = None
-            self.tooltip_text = None
+            self.hide_tooltip()
     
     def update_tooltip_text(self, tile):
         """Update tooltip text based on tile type and contents"""
@@ -54,8 +58,9 @@ class TooltipSystem:
                 total_value = current_price * tile.stored_amount
                 trend = self.game_window.market.get_price_trend(tile.stored_crop_type)
                 trend_text = "↓" if trend == -1 else "→" if trend == 0 else "↑"
+                forecast_info = self._get_forecast_text(tile.stored_crop_type)
                 
-                self.tooltip_text = f"Barn\nContains: {tile.stored_amount} {tile.stored_crop_type}\nCurrent Price: ${current_price}/unit {trend_text}\nTotal Value: ${total_value}\n{capacity_info}\nLeft-Click: Show info\nShift+Left-Click: Upgrade (${upgrade_cost})\nShift+Right-Click: Sell All"
+                self.tooltip_text = f"Barn\nContains: {tile.stored_amount} {tile.stored_crop_type}\nCurrent Price: ${current_price}/unit {trend_text}\n{forecast_info}\nTotal Value: ${total_value}\n{capacity_info}\nLeft-Click: Show info\nShift+Left-Click: Upgrade (${upgrade_cost})\nShift+Right-Click: Sell All"
             else:
                 self.tooltip_text = f"Barn\nEmpty\n{capacity_info}\nLeft-Click: Show info\nShift+Left-Click: Upgrade (${upgrade_cost})"
         elif tile.state == TILE_SEED_BIN:
@@ -68,14 +73,7 @@ class TooltipSystem:
                 capacity_info += f" (Max: {max_capacity})"
             
             if tile.stored_amount > 0:
-                from constants import seeds_config
-                seed_cost = None
-                for seed in seeds_config:
-                    if seed['name'] == tile.stored_crop_type:
-                        seed_cost = seed.get('cost', 0)
-                        break
-                if seed_cost is None:
-                    seed_cost = 0
+                seed_cost = get_seed_cost(tile.stored_crop_type, 0)
                 seed_price_10 = seed_cost * 10
                 self.tooltip_text = f"Seed Bin\nContains: {tile.stored_amount} {tile.stored_crop_type} seeds\nSeed Price: ${seed_cost}/seed\n{capacity_info}\nLeft-Click: Show info\nShift+Left-Click: Upgrade (${upgrade_cost})\nRight-Click: Add 1 seed (${seed_cost})\nShift+Right-Click: Add 10 seeds (${seed_price_10})"
             else:
@@ -91,6 +89,15 @@ class TooltipSystem:
             crop_info = f"Ready to Harvest: {tile.crop_type}" if tile.crop_type else "Ready to Harvest"
             self.tooltip_text = self._get_nutrient_tooltip(crop_info, tile)
     
+    def _get_forecast_text(self, crop_name):
+        """Describe a crop's forecast price range, without waiting for a forecast still being computed"""
+        forecaster = self.game_window.forecaster
+        forecast = forecaster.get_range(crop_name)
+        if forecast is None:
+            return f"{forecaster.days}-Day Forecast: calculating..."
+        low, median, high = forecast
+        return f"{forecaster.days}-Day Forecast: ${low}-${high} (median ${median})"
+    
     def _get_nutrient_tooltip(self, title, tile):
         """Generate nutrient information tooltip for farming tiles"""
         nutrients = tile.nutrients
@@ -115,11 +122,44 @@ class TooltipSystem:
         """Check if tooltip should be drawn (not over popups)"""
         return self.tooltip_text and self.tooltip_tile and not show_popups
     
-    def draw(self):
-        """Draw the tooltip if available"""
-        if not self.tooltip_text:
+    def _tile_version(self, tile):
+        """Get a key that changes whenever the tooltip text of a tile could change"""
+        # The tile revision covers state, nutrient, weed and storage changes; prices change once per market day
+        # and price forecasts land some time after that
+        return (tile, int(tile.grid.tile_revision[tile.row, tile.col]), self.game_window.market.current_day,
+                self.game_window.forecaster.version)
+    
+    def refresh_tooltip_text(self):
+        """Regenerate the tooltip text only if the hovered tile or its data changed"""
+        key = self._tile_version(self.tooltip_tile)
+        if key != self._tooltip_key:
+            self._tooltip_key = key
+            self.update_tooltip_text(self.tooltip_tile)
+    
+    def _create_shapes(self):
+        """Create the persistent tooltip background and label"""
+        self._border = pyglet.shapes.Rectangle(
+            0, 0, 1, 1, color=(0, 0, 0),
+            batch=self.tooltip_batch, group=pyglet.graphics.Group(order=0)
+        )
+        self._background = pyglet.shapes.Rectangle(
+            0, 0, 1, 1, color=(50, 50, 50),
+            batch=self.tooltip_batch, group=pyglet.graphics.Group(order=1)
+        )
+        self._label = pyglet.text.Label(
+            "", x=0, y=0, width=1, multiline=True, anchor_y='top',
+            color=(255, 255, 255, 255), font_size=12,
+            batch=self.tooltip_batch, group=pyglet.graphics.Group(order=2)
+        )
+    
+    def _layout(self):
+        """Resize and move the tooltip shapes when the text or mouse position changed"""
+        layout_key = (self.tooltip_text, self.mouse_x, self.mouse_y, self.game_window.width)
+        if layout_key == self._layout_key:
             return
-            
+        text_changed = self._layout_key is None or self._layout_key[0] != self.tooltip_text
+        self._layout_key = layout_key
+        
         # Split tooltip text into lines
         lines = self.tooltip_text.split('\n')
         line_height = 20
@@ -139,36 +179,38 @@ class TooltipSystem:
             tooltip_x = self.mouse_x - tooltip_width - 15
         if tooltip_y < 0:
             tooltip_y = self.mouse_y + 15
-            
-        # Draw tooltip background
-        pyglet.shapes.Rectangle(
-            tooltip_x, tooltip_y, tooltip_width, tooltip_height,
-            color=(0, 0, 0), batch=None
-        ).draw()
         
-        pyglet.shapes.Rectangle(
-            tooltip_x + 2, tooltip_y + 2, tooltip_width - 4, tooltip_height - 4,
-            color=(50, 50, 50), batch=None
-        ).draw()
+        self._border.position = (tooltip_x, tooltip_y)
+        self._border.width = tooltip_width
+        self._border.height = tooltip_height
+        self._background.position = (tooltip_x + 2, tooltip_y + 2)
+        self._background.width = tooltip_width - 4
+        self._background.height = tooltip_height - 4
         
-        # Draw tooltip text
-        for i, line in enumerate(lines):
-            label = pyglet.text.Label(
-                line,
-                x=tooltip_x + padding,
-                y=tooltip_y + tooltip_height - padding - (i + 1) * line_height,
-                color=(255, 255, 255, 255),
-                font_size=12
-            )
-            label.draw()
+        if text_changed:
+            self._label.begin_update()
+            self._label.text = self.tooltip_text
+            self._label.width = max_width
+            self._label.set_style('line_spacing', line_height)
+            self._label.end_update()
+        self._label.position = (tooltip_x + padding, tooltip_y + tooltip_height - padding, 0)
+    
+    def draw(self):
+        """Draw the tooltip if available"""
+        if not self.tooltip_text:
+            return
+        if self._label is None:
+            self._create_shapes()
+        self._layout()
+        self.tooltip_batch.draw()
     
     def update_tooltip_tick(self):
         """Update tooltip content every tick for dynamic data like market prices"""
         if self.tooltip_tile:
-            self.update_tooltip_text(self.tooltip_tile)
+            self.refresh_tooltip_text()
     
     def hide_tooltip(self):
         """Hide the current tooltip"""
         self.tooltip_text = None
         self.tooltip_tile = None
-
+        self._tooltip_key = None
@@ -1,36 +1,27 @@
 """
-Tractor Manager - Handles all tractor-related functionality
+Tractor Manager - Draws the simulation's tractors and tracks which one the player has selected
 """
 import pyglet
 from PIL import Image
-from constants import tractor_batch, tractor_image, tractor_config, grid_size
-from tractor import Tractor
+import constants
+from constants import tractor_image, grid_size
 
 
 class TractorManager:
     def __init__(self, game_window):
         self.game_window = game_window
-        self.tractors = []
-        self.active_tractor_index = 0
-        self.tractor_cursor = None
-        self.setup_initial_tractor()
-    
-    def get_tractor_speed(self):
-        """Get the current tractor speed based on upgrades"""
-        base_speed = 50
-        is_speed_purchased = getattr(self.game_window.game_state, 'tractor_speed_purchased', False)
-        if is_speed_purchased:
-            return int(base_speed * 2.0)  # 200% of base speed (100% faster)
-        return base_speed
-
-    def setup_initial_tractor(self):
-        """Set up the initial tractor"""
-        speed = self.get_tractor_speed()
-        first_tractor = Tractor(0, 0, speed)
-        first_tractor.sprite.visible = False  # Hide tractor initially
-        self.tractors = [first_tractor]  # Start with one tractor
+        self.simulation = game_window.simulation
         self.active_tractor_index = 0  # Currently selected tractor
+        self.tractor_sprites = {}  # {tractor: sprite drawn at its body's position}
         self.tractor_cursor = self.create_tractor_cursor()
+
+    @property
+    def tractors(self):
+        return self.simulation.tractors
+
+    def get_tractor_speed(self):
+        """Get the current tractor speed based on upgrades"""
+        return self.simulation.get_tractor_speed()
     
     def create_tractor_cursor(self):
         """Create a custom cursor from the tractor image"""
@@ -80,45 +71,22 @@ class TractorManager:
     
     def get_available_tractor(self):
         """Get an available (idle) tractor for a task"""
-        for tractor in self.tractors:
-            if tractor.is_idle():
-                return tractor
-        return None
+        return self.simulation.get_available_tractor()
     
     def purchase_tractor(self):
         """Purchase a new tractor using prestige points"""
-        # Calculate cost: first tractor costs 30 prestige, each additional costs 20 more
-        prestige_cost = 30 + (len(self.tractors) * 20)
-        
-        # Check if player has enough prestige
-        current_prestige = getattr(self.game_window.game_state, 'prestige', 0)
-        if current_prestige >= prestige_cost:
-            # Deduct prestige
-            self.game_window.game_state.prestige -= prestige_cost
-            
-            # Create new tractor at origin with unique position and current speed
-            speed = self.get_tractor_speed()
-            new_tractor = Tractor(0, len(self.tractors) * grid_size, speed)  # Offset by index
-            self.tractors.append(new_tractor)
-            
-            # Auto-select the new tractor
-            self.active_tractor_index = len(self.tractors) - 1
-            self.update_tractor_highlighting()
-            
-            print(f"Purchased new tractor for {prestige_cost} prestige! Total tractors: {len(self.tractors)}")
-            return True
-        else:
-            print(f"Cannot afford tractor ({prestige_cost} prestige needed, have {current_prestige})")
+        if self.simulation.purchase_tractor() is None:
             return False
+        # Auto-select the new tractor
+        self.active_tractor_index = len(self.tractors) - 1
+        self.update_tractor_highlighting()
+        return True
     
     def update_tractor_highlighting(self):
         """Update tractor highlighting to show which one is active (only when working)"""
         for i, tractor in enumerate(self.tractors):
             # Only show tractors when they are actually working or moving
-            if tractor.moving:
-                tractor.sprite.visible = True
-            else:
-                tractor.sprite.visible = False
+            tractor.body.visible = bool(tractor.moving)
     
     def select_next_tractor(self):
         """Select the next tractor in the list"""
@@ -134,26 +102,40 @@ class TractorManager:
             self.update_tractor_highlighting()
             print(f"Selected tractor {self.active_tractor_index + 1} of {len(self.tractors)}")
     
+    def _create_sprite(self, tractor):
+        """Create the sprite that draws a tractor, scaled to fit the grid size"""
+        sprite = pyglet.sprite.Sprite(tractor_image, batch=constants.tractor_batch)
+        sprite.scale_x = grid_size / sprite.image.width
+        sprite.scale_y = grid_size / sprite.image.height
+        return sprite
+
+    def sync_sprites(self):
+        """Move each tractor's sprite to its simulated position before drawing"""
+        if len(self.tractor_sprites) != len(self.tractors):
+            for tractor in list(self.tractor_sprites):
+                if tractor not in self.tractors:
+                    self.tractor_sprites.pop(tractor).delete()
+        for tractor in self.tractors:
+            sprite = self.tractor_sprites.get(tractor)
+            if sprite is None:
+                sprite = self.tractor_sprites[tractor] = self._create_sprite(tractor)
+            body = tractor.body
+            if sprite.visible != body.visible:
+                sprite.visible = body.visible
+            if body.visible and (sprite.x != body.x or sprite.y != body.y):
+                sprite.position = (body.x, body.y, sprite.z)
+
+    def draw(self):
+        """Draw the tractors at their current simulated positions"""
+        self.sync_sprites()
+        constants.tractor_batch.draw()
+
     def rebuild_tractor_batch(self):
         """Rebuild the tractor batch if it becomes corrupted"""
-        import constants
-        
         # Clear the existing batch by creating a new one
         constants.tractor_batch = pyglet.graphics.Batch()
         
-        # Recreate all tractor sprites in the new batch
-        for tractor in self.tractors:
-            if hasattr(tractor, 'sprite') and tractor.sprite:
-                old_x, old_y = tractor.sprite.x, tractor.sprite.y
-                old_visible = tractor.sprite.visible
-                # Create new sprite in the new batch
-                tractor.sprite = pyglet.sprite.Sprite(
-                    tractor_image, 
-                    x=old_x, 
-                    y=old_y, 
-                    batch=constants.tractor_batch
-                )
-                tractor.sprite.visible = old_visible
+        # Recreate all tractor sprites in the new batch on the next sync
+        self.tractor_sprites = {}
         
         print("Tractor batch rebuilt successfully")
-
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
 import threading
-from constants import TILE_BARN, TILE_SEED_BIN
+from constants import BUILDING_BARN, BUILDING_SEED_BIN
 
 
 class UIInfoWindow:
@@ -170,33 +170,14 @@ class UIInfoWindow:
             prestige = getattr(self.game_window.game_state, 'prestige', 1)
             self.labels['prestige'].config(text=f"Prestige: {prestige}")
             
-            # Update barn storage (scan all barn tiles)
+            # Update barn storage (from the farm's storage index)
             if hasattr(self, 'barn_text'):
                 self.barn_text.delete(1.0, tk.END)
                 
-                # Collect storage from all barn tiles
-                barn_contents = {}
-                total_barns = 0
-                total_capacity = 0
-                
-                for tile in self.game_window.farm_tiles:
-                    if (hasattr(tile, 'state') and tile.state == TILE_BARN and 
-                        hasattr(tile, 'stored_crop_type') and tile.stored_crop_type and
-                        hasattr(tile, 'stored_amount') and tile.stored_amount > 0):
-                        
-                        crop_type = tile.stored_crop_type
-                        amount = tile.stored_amount
-                        
-                        if crop_type in barn_contents:
-                            barn_contents[crop_type] += amount
-                        else:
-                            barn_contents[crop_type] = amount
-                            
-                    # Count total barn capacity
-                    if hasattr(tile, 'state') and tile.state == TILE_BARN:
-                        total_barns += 1
-                        if hasattr(tile, 'building_capacity'):
-                            total_capacity += tile.building_capacity
+                storage_index = self.game_window.storage_index
+                barn_contents = storage_index.contents(BUILDING_BARN)
+                total_barns = storage_index.count(BUILDING_BARN)
+                total_capacity = storage_index.capacity(BUILDING_BARN)
                 
                 # Display barn contents
                 if barn_contents:
@@ -231,15 +212,10 @@ class UIInfoWindow:
                                 total_seeds[seed] = {'personal': amount, 'bins': 0}
                     
                     # Collect seeds from seed bins
-                    if hasattr(self.game_window, 'farm_tiles'):
-                        for tile in self.game_window.farm_tiles:
-                            if (hasattr(tile, 'state') and tile.state == TILE_SEED_BIN and
-                                hasattr(tile, 'stored_crop_type') and tile.stored_crop_type and
-                                hasattr(tile, 'stored_amount') and tile.stored_amount > 0):
-                                seed_type = tile.stored_crop_type
-                                if seed_type not in total_seeds:
-                                    total_seeds[seed_type] = {'personal': 0, 'bins': 0}
-                                total_seeds[seed_type]['bins'] += tile.stored_amount
+                    for seed_type, amount in self.game_window.storage_index.contents(BUILDING_SEED_BIN).items():
+                        if seed_type not in total_seeds:
+                            total_seeds[seed_type] = {'personal': 0, 'bins': 0}
+                        total_seeds[seed_type]['bins'] += amount
                     
                     # Display combined seed inventory
                     if total_seeds:
@@ -295,8 +271,8 @@ class UIInfoWindow:
                                 tractor_count += 1
                                 # Get tractor details
                                 mode = getattr(tractor, 'mode', 'unknown').title()
-                                pos_x = int(tractor.sprite.x // 50) if hasattr(tractor, 'sprite') else 0
-                                pos_y = int(tractor.sprite.y // 50) if hasattr(tractor, 'sprite') else 0
+                                pos_x = int(tractor.body.x // 50) if hasattr(tractor, 'body') else 0
+                                pos_y = int(tractor.body.y // 50) if hasattr(tractor, 'body') else 0
                                 
                                 tractor_desc = f"  T{i+1}: {mode} at ({pos_x}, {pos_y})"
                                 
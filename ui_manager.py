@@ -11,6 +11,7 @@ class UIManager:
     def __init__(self, game_window):
         self.game_window = game_window
         self.financial_window = FinancialSummaryWindow(game_window)
+        self.row_mode_label = None  # Persistent label, created on first draw
         self.create_buttons()
     
     def create_buttons(self):
@@ -242,17 +243,27 @@ class UIManager:
         current_mode = getattr(self.game_window.game_state, 'tractor_row_mode', 1)
         mode_text = f"{current_mode} Row Mode"
         
-        # Position 10 pixels from the bottom of the screen
-        pyglet.text.Label(
-            mode_text,
-            font_name='Arial',
-            font_size=12,
-            x=self.game_window.row_mode_toggle_button.x + self.game_window.row_mode_toggle_button.width // 2,
-            y=10,
-            anchor_x='center',
-            anchor_y='bottom',
-            color=(255, 255, 255, 255)
-        ).draw()
+        if self.row_mode_label is None:
+            # Position 10 pixels from the bottom of the screen
+            self.row_mode_label = pyglet.text.Label(
+                mode_text,
+                font_name='Arial',
+                font_size=12,
+                y=10,
+                anchor_x='center',
+                anchor_y='bottom',
+                color=(255, 255, 255, 255)
+            )
+            self._layout_row_mode_label()
+        elif self.row_mode_label.text != mode_text:
+            self.row_mode_label.text = mode_text
+        self.row_mode_label.draw()
+    
+    def _layout_row_mode_label(self):
+        """Center the row mode label under the row mode button"""
+        if self.row_mode_label is not None:
+            button = self.game_window.row_mode_toggle_button
+            self.row_mode_label.x = button.x + button.width // 2
 
     def draw_queue_status(self):
         """Draw tractor job queue status in bottom right area"""
@@ -290,4 +301,8 @@ class UIManager:
             self.game_window.row_mode_toggle_button.x = button_x
         if hasattr(self.game_window, 'financial_button'):
             self.game_window.financial_button.x = button_x
+        
+        # Move the retained labels and background shapes along with the buttons
+        self._layout_row_mode_label()
+        self.game_window.managers.rendering_manager.layout_ui_layer()
 